@@ -7,13 +7,13 @@ import tokenize
 
 from typing import Any, List, Optional, Set, Tuple
 
-from pegen.parser import memoize, memoize_left_rec, logger, Parser
+from pegen.parser import memoize, memoize_left_rec, memoize_involved, logger, Parser
 
 # TODO: Replace List[Any] with List[NodeType] once recursive type alias are in
 NodeType = Tuple[str, int, List[Any]]
 class GeneratedParser(Parser):
 
-    @memoize
+    @logger
     def start(self) -> Optional[NodeType]:
         # start: file
         mark = self.mark()
@@ -26,7 +26,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def file(self) -> Optional[NodeType]:
         # file: statements? $
         mark = self.mark()
@@ -41,7 +41,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def interactive(self) -> Optional[NodeType]:
         # interactive: statement_newline
         mark = self.mark()
@@ -54,7 +54,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def eval(self) -> Optional[NodeType]:
         # eval: expressions NEWLINE* $
         mark = self.mark()
@@ -71,7 +71,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def func_type(self) -> Optional[NodeType]:
         # func_type: '(' type_expressions? ')' '->' expression NEWLINE* $
         mark = self.mark()
@@ -96,7 +96,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def fstring(self) -> Optional[NodeType]:
         # fstring: star_expressions
         mark = self.mark()
@@ -109,7 +109,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def type_expressions(self) -> Optional[NodeType]:
         # type_expressions: ','.expression+ ',' '*' expression ',' '**' expression | ','.expression+ ',' '*' expression | ','.expression+ ',' '**' expression | '*' expression ',' '**' expression | '*' expression | '**' expression | ','.expression+
         mark = self.mark()
@@ -193,14 +193,14 @@ class GeneratedParser(Parser):
         if cut: return None
         cut = False
         if (
-            (_gather_9 := self._gather_9())
+            (a := self._gather_9())
         ):
-            return [_gather_9]
+            return [a]
         self.reset(mark)
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def statements(self) -> Optional[NodeType]:
         # statements: statement+
         mark = self.mark()
@@ -213,7 +213,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def statement(self) -> Optional[NodeType]:
         # statement: compound_stmt | simple_stmt
         mark = self.mark()
@@ -226,14 +226,14 @@ class GeneratedParser(Parser):
         if cut: return None
         cut = False
         if (
-            (simple_stmt := self.simple_stmt())
+            (a := self.simple_stmt())
         ):
-            return [simple_stmt]
+            return [a]
         self.reset(mark)
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def statement_newline(self) -> Optional[NodeType]:
         # statement_newline: compound_stmt NEWLINE | simple_stmt | NEWLINE | $
         mark = self.mark()
@@ -269,7 +269,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def simple_stmt(self) -> Optional[NodeType]:
         # simple_stmt: small_stmt !';' NEWLINE | ';'.small_stmt+ ';'? NEWLINE
         mark = self.mark()
@@ -297,7 +297,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @memoize(10)
     def small_stmt(self) -> Optional[NodeType]:
         # small_stmt: assignment | star_expressions | &'return' return_stmt | &('import' | 'from') import_stmt | &'raise' raise_stmt | 'pass' | &'del' del_stmt | &'yield' yield_stmt | &'assert' assert_stmt | 'break' | 'continue' | &'global' global_stmt | &'nonlocal' nonlocal_stmt
         mark = self.mark()
@@ -410,7 +410,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def compound_stmt(self) -> Optional[NodeType]:
         # compound_stmt: &('def' | '@' | ASYNC) function_def | &'if' if_stmt | &('class' | '@') class_def | &('with' | ASYNC) with_stmt | &('for' | ASYNC) for_stmt | &'try' try_stmt | &'while' while_stmt
         mark = self.mark()
@@ -479,7 +479,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def assignment(self) -> Optional[NodeType]:
         # assignment: NAME ':' expression ['=' annotated_rhs] | ('(' single_target ')' | single_subscript_attribute_target) ':' expression ['=' annotated_rhs] | ((star_targets '='))+ (yield_expr | star_expressions) !'=' TYPE_COMMENT? | single_target augassign ~ (yield_expr | star_expressions) | invalid_assignment
         mark = self.mark()
@@ -544,7 +544,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def augassign(self) -> Optional[NodeType]:
         # augassign: '+=' | '-=' | '*=' | '@=' | '/=' | '%=' | '&=' | '|=' | '^=' | '<<=' | '>>=' | '**=' | '//='
         mark = self.mark()
@@ -641,7 +641,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def global_stmt(self) -> Optional[NodeType]:
         # global_stmt: 'global' ','.NAME+
         mark = self.mark()
@@ -656,7 +656,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def nonlocal_stmt(self) -> Optional[NodeType]:
         # nonlocal_stmt: 'nonlocal' ','.NAME+
         mark = self.mark()
@@ -671,7 +671,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def yield_stmt(self) -> Optional[NodeType]:
         # yield_stmt: yield_expr
         mark = self.mark()
@@ -684,7 +684,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def assert_stmt(self) -> Optional[NodeType]:
         # assert_stmt: 'assert' expression [',' expression]
         mark = self.mark()
@@ -701,7 +701,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def del_stmt(self) -> Optional[NodeType]:
         # del_stmt: 'del' del_targets &(';' | NEWLINE) | invalid_del_stmt
         mark = self.mark()
@@ -725,7 +725,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def import_stmt(self) -> Optional[NodeType]:
         # import_stmt: import_name | import_from
         mark = self.mark()
@@ -745,7 +745,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def import_name(self) -> Optional[NodeType]:
         # import_name: 'import' dotted_as_names
         mark = self.mark()
@@ -760,7 +760,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def import_from(self) -> Optional[NodeType]:
         # import_from: 'from' (('.' | '...'))* dotted_name 'import' import_from_targets | 'from' (('.' | '...'))+ 'import' import_from_targets
         mark = self.mark()
@@ -794,7 +794,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def import_from_targets(self) -> Optional[NodeType]:
         # import_from_targets: '(' import_from_as_names ','? ')' | import_from_as_names !',' | '*' | invalid_import_from_targets
         mark = self.mark()
@@ -836,7 +836,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def import_from_as_names(self) -> Optional[NodeType]:
         # import_from_as_names: ','.import_from_as_name+
         mark = self.mark()
@@ -849,7 +849,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def import_from_as_name(self) -> Optional[NodeType]:
         # import_from_as_name: NAME ['as' NAME]
         mark = self.mark()
@@ -864,7 +864,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def dotted_as_names(self) -> Optional[NodeType]:
         # dotted_as_names: ','.dotted_as_name+
         mark = self.mark()
@@ -877,7 +877,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def dotted_as_name(self) -> Optional[NodeType]:
         # dotted_as_name: dotted_name ['as' NAME]
         mark = self.mark()
@@ -892,31 +892,40 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize_left_rec
+    @memoize(11)
     def dotted_name(self) -> Optional[NodeType]:
         # dotted_name: dotted_name '.' NAME | NAME
         mark = self.mark()
         cut = False
-        if (
-            (a := self.dotted_name())
-            and
-            (literal := self.expect('.'))
-            and
-            (b := self.name())
-        ):
-            return [a, literal, b]
-        self.reset(mark)
-        if cut: return None
-        cut = False
         if (
             (name_ := self.name())
         ):
-            return [name_]
+            return self._grow_dotted_name([name_])
         self.reset(mark)
         if cut: return None
         return None
 
-    @memoize
+    def _grow_dotted_name(self, _seed: NodeType) -> Optional[NodeType]:
+        # Grow dotted_name: dotted_name '.' NAME
+        while True:
+            mark = self.mark()
+            if (
+                (a := _seed)
+                and
+                (literal := self.expect('.'))
+                and
+                (b := self.name())
+            ):
+                _tree = [a, literal, b]
+                if not _tree or self.mark() <= mark:
+                    self.reset(mark)
+                    return _seed
+                _seed = _tree
+                continue
+            self.reset(mark)
+            return _seed
+
+    @logger
     def if_stmt(self) -> Optional[NodeType]:
         # if_stmt: 'if' named_expression ':' block elif_stmt | 'if' named_expression ':' block else_block?
         mark = self.mark()
@@ -952,7 +961,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def elif_stmt(self) -> Optional[NodeType]:
         # elif_stmt: 'elif' named_expression ':' block elif_stmt | 'elif' named_expression ':' block else_block?
         mark = self.mark()
@@ -988,7 +997,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def else_block(self) -> Optional[NodeType]:
         # else_block: 'else' ':' block
         mark = self.mark()
@@ -1005,7 +1014,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def while_stmt(self) -> Optional[NodeType]:
         # while_stmt: 'while' named_expression ':' block else_block?
         mark = self.mark()
@@ -1026,7 +1035,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def for_stmt(self) -> Optional[NodeType]:
         # for_stmt: 'for' star_targets 'in' ~ star_expressions ':' TYPE_COMMENT? block else_block? | ASYNC 'for' star_targets 'in' ~ star_expressions ':' TYPE_COMMENT? block else_block? | invalid_for_target
         mark = self.mark()
@@ -1087,7 +1096,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def with_stmt(self) -> Optional[NodeType]:
         # with_stmt: 'with' '(' ','.with_item+ ','? ')' ':' block | 'with' ','.with_item+ ':' TYPE_COMMENT? block | ASYNC 'with' '(' ','.with_item+ ','? ')' ':' block | ASYNC 'with' ','.with_item+ ':' TYPE_COMMENT? block
         mark = self.mark()
@@ -1165,9 +1174,9 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def with_item(self) -> Optional[NodeType]:
-        # with_item: expression 'as' target &(',' | ')' | ':') | invalid_with_item | expression
+        # with_item: expression 'as' star_target &(',' | ')' | ':') | invalid_with_item | expression
         mark = self.mark()
         cut = False
         if (
@@ -1175,7 +1184,7 @@ class GeneratedParser(Parser):
             and
             (keyword := self.expect_keyword('as'))
             and
-            (t := self.target())
+            (t := self.star_target())
             and
             self.positive_lookahead(self._tmp_47, )
         ):
@@ -1198,7 +1207,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def try_stmt(self) -> Optional[NodeType]:
         # try_stmt: 'try' ':' block finally_block | 'try' ':' block except_block+ else_block? finally_block?
         mark = self.mark()
@@ -1234,7 +1243,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def except_block(self) -> Optional[NodeType]:
         # except_block: 'except' expression ['as' NAME] ':' block | 'except' ':' block
         mark = self.mark()
@@ -1266,7 +1275,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def finally_block(self) -> Optional[NodeType]:
         # finally_block: 'finally' ':' block
         mark = self.mark()
@@ -1283,7 +1292,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def return_stmt(self) -> Optional[NodeType]:
         # return_stmt: 'return' star_expressions?
         mark = self.mark()
@@ -1298,7 +1307,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def raise_stmt(self) -> Optional[NodeType]:
         # raise_stmt: 'raise' expression ['from' expression] | 'raise'
         mark = self.mark()
@@ -1322,7 +1331,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def function_def(self) -> Optional[NodeType]:
         # function_def: decorators function_def_raw | function_def_raw
         mark = self.mark()
@@ -1344,7 +1353,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def function_def_raw(self) -> Optional[NodeType]:
         # function_def_raw: 'def' NAME '(' params? ')' ['->' expression] ':' func_type_comment? block | ASYNC 'def' NAME '(' params? ')' ['->' expression] ':' func_type_comment? block
         mark = self.mark()
@@ -1398,7 +1407,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def func_type_comment(self) -> Optional[NodeType]:
         # func_type_comment: NEWLINE TYPE_COMMENT &(NEWLINE INDENT) | invalid_double_type_comments | TYPE_COMMENT
         mark = self.mark()
@@ -1429,7 +1438,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def params(self) -> Optional[NodeType]:
         # params: invalid_parameters | parameters
         mark = self.mark()
@@ -1449,7 +1458,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def parameters(self) -> Optional[NodeType]:
         # parameters: slash_no_default param_no_default* param_with_default* star_etc? | slash_with_default param_with_default* star_etc? | param_no_default+ param_with_default* star_etc? | param_with_default+ star_etc? | star_etc
         mark = self.mark()
@@ -1506,7 +1515,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def slash_no_default(self) -> Optional[NodeType]:
         # slash_no_default: param_no_default+ '/' ',' | param_no_default+ '/' &')'
         mark = self.mark()
@@ -1534,7 +1543,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def slash_with_default(self) -> Optional[NodeType]:
         # slash_with_default: param_no_default* param_with_default+ '/' ',' | param_no_default* param_with_default+ '/' &')'
         mark = self.mark()
@@ -1566,7 +1575,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def star_etc(self) -> Optional[NodeType]:
         # star_etc: '*' param_no_default param_maybe_default* kwds? | '*' ',' param_maybe_default+ kwds? | kwds | invalid_star_etc
         mark = self.mark()
@@ -1612,7 +1621,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def kwds(self) -> Optional[NodeType]:
         # kwds: '**' param_no_default
         mark = self.mark()
@@ -1627,7 +1636,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def param_no_default(self) -> Optional[NodeType]:
         # param_no_default: param ',' TYPE_COMMENT? | param TYPE_COMMENT? &')'
         mark = self.mark()
@@ -1655,7 +1664,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def param_with_default(self) -> Optional[NodeType]:
         # param_with_default: param default ',' TYPE_COMMENT? | param default TYPE_COMMENT? &')'
         mark = self.mark()
@@ -1687,7 +1696,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def param_maybe_default(self) -> Optional[NodeType]:
         # param_maybe_default: param default? ',' TYPE_COMMENT? | param default? TYPE_COMMENT? &')'
         mark = self.mark()
@@ -1719,7 +1728,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def param(self) -> Optional[NodeType]:
         # param: NAME annotation?
         mark = self.mark()
@@ -1734,7 +1743,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def annotation(self) -> Optional[NodeType]:
         # annotation: ':' expression
         mark = self.mark()
@@ -1749,7 +1758,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def default(self) -> Optional[NodeType]:
         # default: '=' expression
         mark = self.mark()
@@ -1764,7 +1773,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def decorators(self) -> Optional[NodeType]:
         # decorators: (('@' named_expression NEWLINE))+
         mark = self.mark()
@@ -1777,7 +1786,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def class_def(self) -> Optional[NodeType]:
         # class_def: decorators class_def_raw | class_def_raw
         mark = self.mark()
@@ -1799,7 +1808,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def class_def_raw(self) -> Optional[NodeType]:
         # class_def_raw: 'class' NAME ['(' arguments? ')'] ':' block
         mark = self.mark()
@@ -1820,7 +1829,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @memoize(12)
     def block(self) -> Optional[NodeType]:
         # block: NEWLINE INDENT statements DEDENT | simple_stmt | invalid_block
         mark = self.mark()
@@ -1853,7 +1862,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def expressions_list(self) -> Optional[NodeType]:
         # expressions_list: ','.star_expression+ ','?
         mark = self.mark()
@@ -1868,7 +1877,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def star_expressions(self) -> Optional[NodeType]:
         # star_expressions: star_expression ((',' star_expression))+ ','? | star_expression ',' | star_expression
         mark = self.mark()
@@ -1901,7 +1910,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @memoize(13)
     def star_expression(self) -> Optional[NodeType]:
         # star_expression: '*' bitwise_or | expression
         mark = self.mark()
@@ -1923,7 +1932,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def star_named_expressions(self) -> Optional[NodeType]:
         # star_named_expressions: ','.star_named_expression+ ','?
         mark = self.mark()
@@ -1938,7 +1947,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def star_named_expression(self) -> Optional[NodeType]:
         # star_named_expression: '*' bitwise_or | named_expression
         mark = self.mark()
@@ -1960,7 +1969,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def named_expression(self) -> Optional[NodeType]:
         # named_expression: NAME ':=' ~ expression | expression !':=' | invalid_named_expression
         mark = self.mark()
@@ -1995,7 +2004,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def annotated_rhs(self) -> Optional[NodeType]:
         # annotated_rhs: yield_expr | star_expressions
         mark = self.mark()
@@ -2015,7 +2024,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def expressions(self) -> Optional[NodeType]:
         # expressions: expression ((',' expression))+ ','? | expression ',' | expression
         mark = self.mark()
@@ -2048,7 +2057,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @memoize(14)
     def expression(self) -> Optional[NodeType]:
         # expression: disjunction 'if' disjunction 'else' expression | disjunction | lambdef
         mark = self.mark()
@@ -2083,7 +2092,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def lambdef(self) -> Optional[NodeType]:
         # lambdef: 'lambda' lambda_params? ':' expression
         mark = self.mark()
@@ -2102,7 +2111,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def lambda_params(self) -> Optional[NodeType]:
         # lambda_params: invalid_lambda_parameters | lambda_parameters
         mark = self.mark()
@@ -2122,7 +2131,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def lambda_parameters(self) -> Optional[NodeType]:
         # lambda_parameters: lambda_slash_no_default lambda_param_no_default* lambda_param_with_default* lambda_star_etc? | lambda_slash_with_default lambda_param_with_default* lambda_star_etc? | lambda_param_no_default+ lambda_param_with_default* lambda_star_etc? | lambda_param_with_default+ lambda_star_etc? | lambda_star_etc
         mark = self.mark()
@@ -2179,7 +2188,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def lambda_slash_no_default(self) -> Optional[NodeType]:
         # lambda_slash_no_default: lambda_param_no_default+ '/' ',' | lambda_param_no_default+ '/' &':'
         mark = self.mark()
@@ -2207,7 +2216,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def lambda_slash_with_default(self) -> Optional[NodeType]:
         # lambda_slash_with_default: lambda_param_no_default* lambda_param_with_default+ '/' ',' | lambda_param_no_default* lambda_param_with_default+ '/' &':'
         mark = self.mark()
@@ -2239,7 +2248,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def lambda_star_etc(self) -> Optional[NodeType]:
         # lambda_star_etc: '*' lambda_param_no_default lambda_param_maybe_default* lambda_kwds? | '*' ',' lambda_param_maybe_default+ lambda_kwds? | lambda_kwds | invalid_lambda_star_etc
         mark = self.mark()
@@ -2285,7 +2294,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def lambda_kwds(self) -> Optional[NodeType]:
         # lambda_kwds: '**' lambda_param_no_default
         mark = self.mark()
@@ -2300,7 +2309,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def lambda_param_no_default(self) -> Optional[NodeType]:
         # lambda_param_no_default: lambda_param ',' | lambda_param &':'
         mark = self.mark()
@@ -2324,7 +2333,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def lambda_param_with_default(self) -> Optional[NodeType]:
         # lambda_param_with_default: lambda_param default ',' | lambda_param default &':'
         mark = self.mark()
@@ -2352,7 +2361,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def lambda_param_maybe_default(self) -> Optional[NodeType]:
         # lambda_param_maybe_default: lambda_param default? ',' | lambda_param default? &':'
         mark = self.mark()
@@ -2380,7 +2389,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def lambda_param(self) -> Optional[NodeType]:
         # lambda_param: NAME
         mark = self.mark()
@@ -2393,7 +2402,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @memoize(15)
     def disjunction(self) -> Optional[NodeType]:
         # disjunction: conjunction (('or' conjunction))+ | conjunction
         mark = self.mark()
@@ -2415,7 +2424,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @memoize(16)
     def conjunction(self) -> Optional[NodeType]:
         # conjunction: inversion (('and' inversion))+ | inversion
         mark = self.mark()
@@ -2437,7 +2446,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @memoize(17)
     def inversion(self) -> Optional[NodeType]:
         # inversion: 'not' inversion | comparison
         mark = self.mark()
@@ -2459,7 +2468,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def comparison(self) -> Optional[NodeType]:
         # comparison: bitwise_or compare_op_bitwise_or_pair+ | bitwise_or
         mark = self.mark()
@@ -2481,7 +2490,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def compare_op_bitwise_or_pair(self) -> Optional[NodeType]:
         # compare_op_bitwise_or_pair: eq_bitwise_or | noteq_bitwise_or | lte_bitwise_or | lt_bitwise_or | gte_bitwise_or | gt_bitwise_or | notin_bitwise_or | in_bitwise_or | isnot_bitwise_or | is_bitwise_or
         mark = self.mark()
@@ -2557,7 +2566,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def eq_bitwise_or(self) -> Optional[NodeType]:
         # eq_bitwise_or: '==' bitwise_or
         mark = self.mark()
@@ -2572,7 +2581,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def noteq_bitwise_or(self) -> Optional[NodeType]:
         # noteq_bitwise_or: ('!=') bitwise_or
         mark = self.mark()
@@ -2587,7 +2596,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def lte_bitwise_or(self) -> Optional[NodeType]:
         # lte_bitwise_or: '<=' bitwise_or
         mark = self.mark()
@@ -2602,7 +2611,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def lt_bitwise_or(self) -> Optional[NodeType]:
         # lt_bitwise_or: '<' bitwise_or
         mark = self.mark()
@@ -2617,7 +2626,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def gte_bitwise_or(self) -> Optional[NodeType]:
         # gte_bitwise_or: '>=' bitwise_or
         mark = self.mark()
@@ -2632,7 +2641,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def gt_bitwise_or(self) -> Optional[NodeType]:
         # gt_bitwise_or: '>' bitwise_or
         mark = self.mark()
@@ -2647,7 +2656,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def notin_bitwise_or(self) -> Optional[NodeType]:
         # notin_bitwise_or: 'not' 'in' bitwise_or
         mark = self.mark()
@@ -2664,7 +2673,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def in_bitwise_or(self) -> Optional[NodeType]:
         # in_bitwise_or: 'in' bitwise_or
         mark = self.mark()
@@ -2679,7 +2688,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def isnot_bitwise_or(self) -> Optional[NodeType]:
         # isnot_bitwise_or: 'is' 'not' bitwise_or
         mark = self.mark()
@@ -2696,7 +2705,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def is_bitwise_or(self) -> Optional[NodeType]:
         # is_bitwise_or: 'is' bitwise_or
         mark = self.mark()
@@ -2711,217 +2720,289 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize_left_rec
+    @memoize(18)
     def bitwise_or(self) -> Optional[NodeType]:
         # bitwise_or: bitwise_or '|' bitwise_xor | bitwise_xor
         mark = self.mark()
         cut = False
-        if (
-            (a := self.bitwise_or())
-            and
-            (literal := self.expect('|'))
-            and
-            (b := self.bitwise_xor())
-        ):
-            return [a, literal, b]
-        self.reset(mark)
-        if cut: return None
-        cut = False
         if (
             (bitwise_xor := self.bitwise_xor())
         ):
-            return [bitwise_xor]
+            return self._grow_bitwise_or([bitwise_xor])
         self.reset(mark)
         if cut: return None
         return None
 
-    @memoize_left_rec
+    def _grow_bitwise_or(self, _seed: NodeType) -> Optional[NodeType]:
+        # Grow bitwise_or: bitwise_or '|' bitwise_xor
+        while True:
+            mark = self.mark()
+            if (
+                (a := _seed)
+                and
+                (literal := self.expect('|'))
+                and
+                (b := self.bitwise_xor())
+            ):
+                _tree = [a, literal, b]
+                if not _tree or self.mark() <= mark:
+                    self.reset(mark)
+                    return _seed
+                _seed = _tree
+                continue
+            self.reset(mark)
+            return _seed
+
+    @memoize(19)
     def bitwise_xor(self) -> Optional[NodeType]:
         # bitwise_xor: bitwise_xor '^' bitwise_and | bitwise_and
         mark = self.mark()
         cut = False
-        if (
-            (a := self.bitwise_xor())
-            and
-            (literal := self.expect('^'))
-            and
-            (b := self.bitwise_and())
-        ):
-            return [a, literal, b]
-        self.reset(mark)
-        if cut: return None
-        cut = False
         if (
             (bitwise_and := self.bitwise_and())
         ):
-            return [bitwise_and]
+            return self._grow_bitwise_xor([bitwise_and])
         self.reset(mark)
         if cut: return None
         return None
 
-    @memoize_left_rec
+    def _grow_bitwise_xor(self, _seed: NodeType) -> Optional[NodeType]:
+        # Grow bitwise_xor: bitwise_xor '^' bitwise_and
+        while True:
+            mark = self.mark()
+            if (
+                (a := _seed)
+                and
+                (literal := self.expect('^'))
+                and
+                (b := self.bitwise_and())
+            ):
+                _tree = [a, literal, b]
+                if not _tree or self.mark() <= mark:
+                    self.reset(mark)
+                    return _seed
+                _seed = _tree
+                continue
+            self.reset(mark)
+            return _seed
+
+    @memoize(20)
     def bitwise_and(self) -> Optional[NodeType]:
         # bitwise_and: bitwise_and '&' shift_expr | shift_expr
         mark = self.mark()
         cut = False
-        if (
-            (a := self.bitwise_and())
-            and
-            (literal := self.expect('&'))
-            and
-            (b := self.shift_expr())
-        ):
-            return [a, literal, b]
-        self.reset(mark)
-        if cut: return None
-        cut = False
         if (
             (shift_expr := self.shift_expr())
         ):
-            return [shift_expr]
+            return self._grow_bitwise_and([shift_expr])
         self.reset(mark)
         if cut: return None
         return None
 
-    @memoize_left_rec
+    def _grow_bitwise_and(self, _seed: NodeType) -> Optional[NodeType]:
+        # Grow bitwise_and: bitwise_and '&' shift_expr
+        while True:
+            mark = self.mark()
+            if (
+                (a := _seed)
+                and
+                (literal := self.expect('&'))
+                and
+                (b := self.shift_expr())
+            ):
+                _tree = [a, literal, b]
+                if not _tree or self.mark() <= mark:
+                    self.reset(mark)
+                    return _seed
+                _seed = _tree
+                continue
+            self.reset(mark)
+            return _seed
+
+    @memoize(21)
     def shift_expr(self) -> Optional[NodeType]:
         # shift_expr: shift_expr '<<' sum | shift_expr '>>' sum | sum
         mark = self.mark()
         cut = False
-        if (
-            (a := self.shift_expr())
-            and
-            (literal := self.expect('<<'))
-            and
-            (b := self.sum())
-        ):
-            return [a, literal, b]
-        self.reset(mark)
-        if cut: return None
-        cut = False
-        if (
-            (a := self.shift_expr())
-            and
-            (literal := self.expect('>>'))
-            and
-            (b := self.sum())
-        ):
-            return [a, literal, b]
-        self.reset(mark)
-        if cut: return None
-        cut = False
         if (
             (sum := self.sum())
         ):
-            return [sum]
+            return self._grow_shift_expr([sum])
         self.reset(mark)
         if cut: return None
         return None
 
-    @memoize_left_rec
+    def _grow_shift_expr(self, _seed: NodeType) -> Optional[NodeType]:
+        # Grow shift_expr: shift_expr '<<' sum | shift_expr '>>' sum
+        while True:
+            mark = self.mark()
+            if (
+                (a := _seed)
+                and
+                (literal := self.expect('<<'))
+                and
+                (b := self.sum())
+            ):
+                _tree = [a, literal, b]
+                if not _tree or self.mark() <= mark:
+                    self.reset(mark)
+                    return _seed
+                _seed = _tree
+                continue
+            self.reset(mark)
+            if (
+                (a := _seed)
+                and
+                (literal := self.expect('>>'))
+                and
+                (b := self.sum())
+            ):
+                _tree = [a, literal, b]
+                if not _tree or self.mark() <= mark:
+                    self.reset(mark)
+                    return _seed
+                _seed = _tree
+                continue
+            self.reset(mark)
+            return _seed
+
+    @memoize(22)
     def sum(self) -> Optional[NodeType]:
         # sum: sum '+' term | sum '-' term | term
         mark = self.mark()
         cut = False
-        if (
-            (a := self.sum())
-            and
-            (literal := self.expect('+'))
-            and
-            (b := self.term())
-        ):
-            return [a, literal, b]
-        self.reset(mark)
-        if cut: return None
-        cut = False
-        if (
-            (a := self.sum())
-            and
-            (literal := self.expect('-'))
-            and
-            (b := self.term())
-        ):
-            return [a, literal, b]
-        self.reset(mark)
-        if cut: return None
-        cut = False
         if (
             (term := self.term())
         ):
-            return [term]
+            return self._grow_sum([term])
         self.reset(mark)
         if cut: return None
         return None
 
-    @memoize_left_rec
+    def _grow_sum(self, _seed: NodeType) -> Optional[NodeType]:
+        # Grow sum: sum '+' term | sum '-' term
+        while True:
+            mark = self.mark()
+            if (
+                (a := _seed)
+                and
+                (literal := self.expect('+'))
+                and
+                (b := self.term())
+            ):
+                _tree = [a, literal, b]
+                if not _tree or self.mark() <= mark:
+                    self.reset(mark)
+                    return _seed
+                _seed = _tree
+                continue
+            self.reset(mark)
+            if (
+                (a := _seed)
+                and
+                (literal := self.expect('-'))
+                and
+                (b := self.term())
+            ):
+                _tree = [a, literal, b]
+                if not _tree or self.mark() <= mark:
+                    self.reset(mark)
+                    return _seed
+                _seed = _tree
+                continue
+            self.reset(mark)
+            return _seed
+
+    @memoize(23)
     def term(self) -> Optional[NodeType]:
         # term: term '*' factor | term '/' factor | term '//' factor | term '%' factor | term '@' factor | factor
         mark = self.mark()
         cut = False
-        if (
-            (a := self.term())
-            and
-            (literal := self.expect('*'))
-            and
-            (b := self.factor())
-        ):
-            return [a, literal, b]
-        self.reset(mark)
-        if cut: return None
-        cut = False
-        if (
-            (a := self.term())
-            and
-            (literal := self.expect('/'))
-            and
-            (b := self.factor())
-        ):
-            return [a, literal, b]
-        self.reset(mark)
-        if cut: return None
-        cut = False
-        if (
-            (a := self.term())
-            and
-            (literal := self.expect('//'))
-            and
-            (b := self.factor())
-        ):
-            return [a, literal, b]
-        self.reset(mark)
-        if cut: return None
-        cut = False
-        if (
-            (a := self.term())
-            and
-            (literal := self.expect('%'))
-            and
-            (b := self.factor())
-        ):
-            return [a, literal, b]
-        self.reset(mark)
-        if cut: return None
-        cut = False
-        if (
-            (a := self.term())
-            and
-            (literal := self.expect('@'))
-            and
-            (b := self.factor())
-        ):
-            return [a, literal, b]
-        self.reset(mark)
-        if cut: return None
-        cut = False
         if (
             (factor := self.factor())
         ):
-            return [factor]
+            return self._grow_term([factor])
         self.reset(mark)
         if cut: return None
         return None
 
-    @memoize
+    def _grow_term(self, _seed: NodeType) -> Optional[NodeType]:
+        # Grow term: term '*' factor | term '/' factor | term '//' factor | term '%' factor | term '@' factor
+        while True:
+            mark = self.mark()
+            if (
+                (a := _seed)
+                and
+                (literal := self.expect('*'))
+                and
+                (b := self.factor())
+            ):
+                _tree = [a, literal, b]
+                if not _tree or self.mark() <= mark:
+                    self.reset(mark)
+                    return _seed
+                _seed = _tree
+                continue
+            self.reset(mark)
+            if (
+                (a := _seed)
+                and
+                (literal := self.expect('/'))
+                and
+                (b := self.factor())
+            ):
+                _tree = [a, literal, b]
+                if not _tree or self.mark() <= mark:
+                    self.reset(mark)
+                    return _seed
+                _seed = _tree
+                continue
+            self.reset(mark)
+            if (
+                (a := _seed)
+                and
+                (literal := self.expect('//'))
+                and
+                (b := self.factor())
+            ):
+                _tree = [a, literal, b]
+                if not _tree or self.mark() <= mark:
+                    self.reset(mark)
+                    return _seed
+                _seed = _tree
+                continue
+            self.reset(mark)
+            if (
+                (a := _seed)
+                and
+                (literal := self.expect('%'))
+                and
+                (b := self.factor())
+            ):
+                _tree = [a, literal, b]
+                if not _tree or self.mark() <= mark:
+                    self.reset(mark)
+                    return _seed
+                _seed = _tree
+                continue
+            self.reset(mark)
+            if (
+                (a := _seed)
+                and
+                (literal := self.expect('@'))
+                and
+                (b := self.factor())
+            ):
+                _tree = [a, literal, b]
+                if not _tree or self.mark() <= mark:
+                    self.reset(mark)
+                    return _seed
+                _seed = _tree
+                continue
+            self.reset(mark)
+            return _seed
+
+    @memoize(24)
     def factor(self) -> Optional[NodeType]:
         # factor: '+' factor | '-' factor | '~' factor | power
         mark = self.mark()
@@ -2961,7 +3042,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def power(self) -> Optional[NodeType]:
         # power: await_primary '**' factor | await_primary
         mark = self.mark()
@@ -2985,7 +3066,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @memoize(25)
     def await_primary(self) -> Optional[NodeType]:
         # await_primary: AWAIT primary | primary
         mark = self.mark()
@@ -3007,66 +3088,84 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize_left_rec
+    @memoize(26)
     def primary(self) -> Optional[NodeType]:
         # primary: primary '.' NAME | primary genexp | primary '(' arguments? ')' | primary '[' slices ']' | atom
         mark = self.mark()
         cut = False
-        if (
-            (a := self.primary())
-            and
-            (literal := self.expect('.'))
-            and
-            (b := self.name())
-        ):
-            return [a, literal, b]
-        self.reset(mark)
-        if cut: return None
-        cut = False
-        if (
-            (a := self.primary())
-            and
-            (b := self.genexp())
-        ):
-            return [a, b]
-        self.reset(mark)
-        if cut: return None
-        cut = False
-        if (
-            (a := self.primary())
-            and
-            (literal := self.expect('('))
-            and
-            (b := self.arguments(),)
-            and
-            (literal_1 := self.expect(')'))
-        ):
-            return [a, literal, b, literal_1]
-        self.reset(mark)
-        if cut: return None
-        cut = False
-        if (
-            (a := self.primary())
-            and
-            (literal := self.expect('['))
-            and
-            (b := self.slices())
-            and
-            (literal_1 := self.expect(']'))
-        ):
-            return [a, literal, b, literal_1]
-        self.reset(mark)
-        if cut: return None
-        cut = False
         if (
             (atom := self.atom())
         ):
-            return [atom]
+            return self._grow_primary([atom])
         self.reset(mark)
         if cut: return None
         return None
 
-    @memoize
+    def _grow_primary(self, _seed: NodeType) -> Optional[NodeType]:
+        # Grow primary: primary '.' NAME | primary genexp | primary '(' arguments? ')' | primary '[' slices ']'
+        while True:
+            mark = self.mark()
+            if (
+                (a := _seed)
+                and
+                (literal := self.expect('.'))
+                and
+                (b := self.name())
+            ):
+                _tree = [a, literal, b]
+                if not _tree or self.mark() <= mark:
+                    self.reset(mark)
+                    return _seed
+                _seed = _tree
+                continue
+            self.reset(mark)
+            if (
+                (a := _seed)
+                and
+                (b := self.genexp())
+            ):
+                _tree = [a, b]
+                if not _tree or self.mark() <= mark:
+                    self.reset(mark)
+                    return _seed
+                _seed = _tree
+                continue
+            self.reset(mark)
+            if (
+                (a := _seed)
+                and
+                (literal := self.expect('('))
+                and
+                (b := self.arguments(),)
+                and
+                (literal_1 := self.expect(')'))
+            ):
+                _tree = [a, literal, b, literal_1]
+                if not _tree or self.mark() <= mark:
+                    self.reset(mark)
+                    return _seed
+                _seed = _tree
+                continue
+            self.reset(mark)
+            if (
+                (a := _seed)
+                and
+                (literal := self.expect('['))
+                and
+                (b := self.slices())
+                and
+                (literal_1 := self.expect(']'))
+            ):
+                _tree = [a, literal, b, literal_1]
+                if not _tree or self.mark() <= mark:
+                    self.reset(mark)
+                    return _seed
+                _seed = _tree
+                continue
+            self.reset(mark)
+            return _seed
+
+    @logger
     def slices(self) -> Optional[NodeType]:
         # slices: slice !',' | ','.slice+ ','?
         mark = self.mark()
@@ -3090,7 +3189,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def slice(self) -> Optional[NodeType]:
         # slice: expression? ':' expression? [':' expression?] | expression
         mark = self.mark()
@@ -3116,7 +3215,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def atom(self) -> Optional[NodeType]:
         # atom: NAME | 'True' | 'False' | 'None' | &STRING strings | NUMBER | &'(' (tuple | group | genexp) | &'[' (list | listcomp) | &'{' (dict | set | dictcomp | setcomp) | '...'
         mark = self.mark()
@@ -3200,7 +3299,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @memoize(27)
     def strings(self) -> Optional[NodeType]:
         # strings: STRING+
         mark = self.mark()
@@ -3213,7 +3312,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def list(self) -> Optional[NodeType]:
         # list: '[' star_named_expressions? ']'
         mark = self.mark()
@@ -3230,7 +3329,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def listcomp(self) -> Optional[NodeType]:
         # listcomp: '[' named_expression ~ for_if_clauses ']' | invalid_comprehension
         mark = self.mark()
@@ -3258,7 +3357,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def tuple(self) -> Optional[NodeType]:
         # tuple: '(' [star_named_expression ',' star_named_expressions?] ')'
         mark = self.mark()
@@ -3275,7 +3374,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def group(self) -> Optional[NodeType]:
         # group: '(' (yield_expr | named_expression) ')' | invalid_group
         mark = self.mark()
@@ -3299,7 +3398,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def genexp(self) -> Optional[NodeType]:
         # genexp: '(' expression ~ for_if_clauses ')' | invalid_comprehension
         mark = self.mark()
@@ -3327,7 +3426,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def set(self) -> Optional[NodeType]:
         # set: '{' expressions_list '}'
         mark = self.mark()
@@ -3344,7 +3443,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def setcomp(self) -> Optional[NodeType]:
         # setcomp: '{' expression ~ for_if_clauses '}' | invalid_comprehension
         mark = self.mark()
@@ -3372,7 +3471,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def dict(self) -> Optional[NodeType]:
         # dict: '{' double_starred_kvpairs? '}'
         mark = self.mark()
@@ -3389,7 +3488,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def dictcomp(self) -> Optional[NodeType]:
         # dictcomp: '{' kvpair for_if_clauses '}' | invalid_dict_comprehension
         mark = self.mark()
@@ -3415,7 +3514,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def double_starred_kvpairs(self) -> Optional[NodeType]:
         # double_starred_kvpairs: ','.double_starred_kvpair+ ','?
         mark = self.mark()
@@ -3430,7 +3529,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def double_starred_kvpair(self) -> Optional[NodeType]:
         # double_starred_kvpair: '**' bitwise_or | kvpair
         mark = self.mark()
@@ -3452,7 +3551,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def kvpair(self) -> Optional[NodeType]:
         # kvpair: expression ':' expression
         mark = self.mark()
@@ -3469,20 +3568,20 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def for_if_clauses(self) -> Optional[NodeType]:
         # for_if_clauses: for_if_clause+
         mark = self.mark()
         cut = False
         if (
-            (_loop1_104 := self._loop1_104())
+            (a := self._loop1_104())
         ):
-            return [_loop1_104]
+            return [a]
         self.reset(mark)
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def for_if_clause(self) -> Optional[NodeType]:
         # for_if_clause: ASYNC 'for' star_targets 'in' ~ disjunction (('if' disjunction))* | 'for' star_targets 'in' ~ disjunction (('if' disjunction))* | invalid_for_target
         mark = self.mark()
@@ -3531,7 +3630,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def yield_expr(self) -> Optional[NodeType]:
         # yield_expr: 'yield' 'from' expression | 'yield' star_expressions?
         mark = self.mark()
@@ -3557,7 +3656,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @memoize(28)
     def arguments(self) -> Optional[NodeType]:
         # arguments: args ','? &')' | incorrect_arguments
         mark = self.mark()
@@ -3581,17 +3680,17 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def args(self) -> Optional[NodeType]:
         # args: ','.(starred_expression | named_expression !'=')+ [',' kwargs] | kwargs
         mark = self.mark()
         cut = False
         if (
-            (_gather_107 := self._gather_107())
+            (a := self._gather_107())
             and
-            (opt := self._tmp_109(),)
+            (b := self._tmp_109(),)
         ):
-            return [_gather_107, opt]
+            return [a, b]
         self.reset(mark)
         if cut: return None
         cut = False
@@ -3603,7 +3702,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def kwargs(self) -> Optional[NodeType]:
         # kwargs: ','.kwarg_or_starred+ ',' ','.kwarg_or_double_starred+ | ','.kwarg_or_starred+ | ','.kwarg_or_double_starred+
         mark = self.mark()
@@ -3634,7 +3733,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def starred_expression(self) -> Optional[NodeType]:
         # starred_expression: '*' expression
         mark = self.mark()
@@ -3649,7 +3748,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def kwarg_or_starred(self) -> Optional[NodeType]:
         # kwarg_or_starred: NAME '=' expression | starred_expression | invalid_kwarg
         mark = self.mark()
@@ -3680,7 +3779,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def kwarg_or_double_starred(self) -> Optional[NodeType]:
         # kwarg_or_double_starred: NAME '=' expression | '**' expression | invalid_kwarg
         mark = self.mark()
@@ -3713,7 +3812,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def star_targets(self) -> Optional[NodeType]:
         # star_targets: star_target !',' | star_target ((',' star_target))* ','?
         mark = self.mark()
@@ -3739,7 +3838,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def star_targets_seq(self) -> Optional[NodeType]:
         # star_targets_seq: ','.star_target+ ','?
         mark = self.mark()
@@ -3754,7 +3853,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @memoize(29)
     def star_target(self) -> Optional[NodeType]:
         # star_target: '*' (!'*' star_target) | t_primary '.' NAME !t_lookahead | t_primary '[' slices ']' !t_lookahead | star_atom
         mark = self.mark()
@@ -3804,7 +3903,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def star_atom(self) -> Optional[NodeType]:
         # star_atom: NAME | '(' star_target ')' | '(' star_targets_seq? ')' | '[' star_targets_seq? ']'
         mark = self.mark()
@@ -3850,7 +3949,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def single_target(self) -> Optional[NodeType]:
         # single_target: single_subscript_attribute_target | NAME | '(' single_target ')'
         mark = self.mark()
@@ -3881,7 +3980,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def single_subscript_attribute_target(self) -> Optional[NodeType]:
         # single_subscript_attribute_target: t_primary '.' NAME !t_lookahead | t_primary '[' slices ']' !t_lookahead
         mark = self.mark()
@@ -3915,7 +4014,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def del_targets(self) -> Optional[NodeType]:
         # del_targets: ','.del_target+ ','?
         mark = self.mark()
@@ -3930,7 +4029,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @memoize(30)
     def del_target(self) -> Optional[NodeType]:
         # del_target: t_primary '.' NAME !t_lookahead | t_primary '[' slices ']' !t_lookahead | del_t_atom
         mark = self.mark()
@@ -3971,7 +4070,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def del_t_atom(self) -> Optional[NodeType]:
         # del_t_atom: NAME | '(' del_target ')' | '(' del_targets? ')' | '[' del_targets? ']'
         mark = self.mark()
@@ -4017,7 +4116,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def targets(self) -> Optional[NodeType]:
         # targets: ','.target+ ','?
         mark = self.mark()
@@ -4032,7 +4131,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @memoize(31)
     def target(self) -> Optional[NodeType]:
         # target: t_primary '.' NAME !t_lookahead | t_primary '[' slices ']' !t_lookahead | t_atom
         mark = self.mark()
@@ -4073,76 +4172,94 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize_left_rec
+    @memoize(32)
     def t_primary(self) -> Optional[NodeType]:
         # t_primary: t_primary '.' NAME &t_lookahead | t_primary '[' slices ']' &t_lookahead | t_primary genexp &t_lookahead | t_primary '(' arguments? ')' &t_lookahead | atom &t_lookahead
         mark = self.mark()
         cut = False
-        if (
-            (a := self.t_primary())
-            and
-            (literal := self.expect('.'))
-            and
-            (b := self.name())
-            and
-            self.positive_lookahead(self.t_lookahead, )
-        ):
-            return [a, literal, b]
-        self.reset(mark)
-        if cut: return None
-        cut = False
-        if (
-            (a := self.t_primary())
-            and
-            (literal := self.expect('['))
-            and
-            (b := self.slices())
-            and
-            (literal_1 := self.expect(']'))
-            and
-            self.positive_lookahead(self.t_lookahead, )
-        ):
-            return [a, literal, b, literal_1]
-        self.reset(mark)
-        if cut: return None
-        cut = False
-        if (
-            (a := self.t_primary())
-            and
-            (b := self.genexp())
-            and
-            self.positive_lookahead(self.t_lookahead, )
-        ):
-            return [a, b]
-        self.reset(mark)
-        if cut: return None
-        cut = False
-        if (
-            (a := self.t_primary())
-            and
-            (literal := self.expect('('))
-            and
-            (b := self.arguments(),)
-            and
-            (literal_1 := self.expect(')'))
-            and
-            self.positive_lookahead(self.t_lookahead, )
-        ):
-            return [a, literal, b, literal_1]
-        self.reset(mark)
-        if cut: return None
-        cut = False
         if (
             (a := self.atom())
             and
             self.positive_lookahead(self.t_lookahead, )
         ):
-            return [a]
+            return self._grow_t_primary([a])
         self.reset(mark)
         if cut: return None
         return None
 
-    @memoize
+    def _grow_t_primary(self, _seed: NodeType) -> Optional[NodeType]:
+        # Grow t_primary: t_primary '.' NAME &t_lookahead | t_primary '[' slices ']' &t_lookahead | t_primary genexp &t_lookahead | t_primary '(' arguments? ')' &t_lookahead
+        while True:
+            mark = self.mark()
+            if (
+                (a := _seed)
+                and
+                (literal := self.expect('.'))
+                and
+                (b := self.name())
+                and
+                self.positive_lookahead(self.t_lookahead, )
+            ):
+                _tree = [a, literal, b]
+                if not _tree or self.mark() <= mark:
+                    self.reset(mark)
+                    return _seed
+                _seed = _tree
+                continue
+            self.reset(mark)
+            if (
+                (a := _seed)
+                and
+                (literal := self.expect('['))
+                and
+                (b := self.slices())
+                and
+                (literal_1 := self.expect(']'))
+                and
+                self.positive_lookahead(self.t_lookahead, )
+            ):
+                _tree = [a, literal, b, literal_1]
+                if not _tree or self.mark() <= mark:
+                    self.reset(mark)
+                    return _seed
+                _seed = _tree
+                continue
+            self.reset(mark)
+            if (
+                (a := _seed)
+                and
+                (b := self.genexp())
+                and
+                self.positive_lookahead(self.t_lookahead, )
+            ):
+                _tree = [a, b]
+                if not _tree or self.mark() <= mark:
+                    self.reset(mark)
+                    return _seed
+                _seed = _tree
+                continue
+            self.reset(mark)
+            if (
+                (a := _seed)
+                and
+                (literal := self.expect('('))
+                and
+                (b := self.arguments(),)
+                and
+                (literal_1 := self.expect(')'))
+                and
+                self.positive_lookahead(self.t_lookahead, )
+            ):
+                _tree = [a, literal, b, literal_1]
+                if not _tree or self.mark() <= mark:
+                    self.reset(mark)
+                    return _seed
+                _seed = _tree
+                continue
+            self.reset(mark)
+            return _seed
+
+    @logger
     def t_lookahead(self) -> Optional[NodeType]:
         # t_lookahead: '(' | '[' | '.'
         mark = self.mark()
@@ -4169,7 +4286,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def t_atom(self) -> Optional[NodeType]:
         # t_atom: NAME | '(' target ')' | '(' targets? ')' | '[' targets? ']'
         mark = self.mark()
@@ -4215,7 +4332,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def incorrect_arguments(self) -> Optional[NodeType]:
         # incorrect_arguments: args ',' '*' | expression for_if_clauses ',' [args | expression for_if_clauses] | args for_if_clauses | args ',' expression for_if_clauses | args ',' args
         mark = self.mark()
@@ -4278,7 +4395,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def invalid_kwarg(self) -> Optional[NodeType]:
         # invalid_kwarg: expression '='
         mark = self.mark()
@@ -4293,7 +4410,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def invalid_named_expression(self) -> Optional[NodeType]:
         # invalid_named_expression: expression ':=' expression
         mark = self.mark()
@@ -4310,7 +4427,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def invalid_assignment(self) -> Optional[NodeType]:
         # invalid_assignment: invalid_ann_assign_target ':' expression | star_named_expression ',' star_named_expressions* ':' expression | expression ':' expression | ((star_targets '='))* star_expressions '=' | ((star_targets '='))* yield_expr '=' | star_expressions augassign (yield_expr | star_expressions)
         mark = self.mark()
@@ -4386,7 +4503,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def invalid_ann_assign_target(self) -> Optional[NodeType]:
         # invalid_ann_assign_target: list | tuple | '(' invalid_ann_assign_target ')'
         mark = self.mark()
@@ -4417,7 +4534,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def invalid_del_stmt(self) -> Optional[NodeType]:
         # invalid_del_stmt: 'del' star_expressions
         mark = self.mark()
@@ -4432,7 +4549,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def invalid_block(self) -> Optional[NodeType]:
         # invalid_block: NEWLINE !INDENT
         mark = self.mark()
@@ -4447,7 +4564,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def invalid_comprehension(self) -> Optional[NodeType]:
         # invalid_comprehension: ('[' | '(' | '{') starred_expression for_if_clauses
         mark = self.mark()
@@ -4464,7 +4581,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def invalid_dict_comprehension(self) -> Optional[NodeType]:
         # invalid_dict_comprehension: '{' '**' bitwise_or for_if_clauses '}'
         mark = self.mark()
@@ -4485,7 +4602,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def invalid_parameters(self) -> Optional[NodeType]:
         # invalid_parameters: param_no_default* (slash_with_default | param_with_default+) param_no_default
         mark = self.mark()
@@ -4502,7 +4619,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def invalid_lambda_parameters(self) -> Optional[NodeType]:
         # invalid_lambda_parameters: lambda_param_no_default* (lambda_slash_with_default | lambda_param_with_default+) lambda_param_no_default
         mark = self.mark()
@@ -4519,7 +4636,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def invalid_star_etc(self) -> Optional[NodeType]:
         # invalid_star_etc: '*' (')' | ',' (')' | '**')) | '*' ',' TYPE_COMMENT
         mark = self.mark()
@@ -4545,7 +4662,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def invalid_lambda_star_etc(self) -> Optional[NodeType]:
         # invalid_lambda_star_etc: '*' (':' | ',' (':' | '**'))
         mark = self.mark()
@@ -4560,7 +4677,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def invalid_double_type_comments(self) -> Optional[NodeType]:
         # invalid_double_type_comments: TYPE_COMMENT NEWLINE TYPE_COMMENT NEWLINE INDENT
         mark = self.mark()
@@ -4581,7 +4698,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def invalid_with_item(self) -> Optional[NodeType]:
         # invalid_with_item: expression 'as' expression
         mark = self.mark()
@@ -4598,7 +4715,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def invalid_for_target(self) -> Optional[NodeType]:
         # invalid_for_target: ASYNC? 'for' star_expressions
         mark = self.mark()
@@ -4615,7 +4732,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def invalid_group(self) -> Optional[NodeType]:
         # invalid_group: '(' starred_expression ')'
         mark = self.mark()
@@ -4632,7 +4749,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def invalid_import_from_targets(self) -> Optional[NodeType]:
         # invalid_import_from_targets: import_from_as_names ','
         mark = self.mark()
@@ -4647,7 +4764,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def _loop0_1(self) -> Optional[NodeType]:
         # _loop0_1: NEWLINE
         mark = self.mark()
@@ -4662,7 +4779,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return children
 
-    @memoize
+    @logger
     def _loop0_2(self) -> Optional[NodeType]:
         # _loop0_2: NEWLINE
         mark = self.mark()
@@ -4677,7 +4794,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return children
 
-    @memoize
+    @logger
     def _loop0_4(self) -> Optional[NodeType]:
         # _loop0_4: ',' expression
         mark = self.mark()
@@ -4694,7 +4811,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return children
 
-    @memoize
+    @logger
     def _gather_3(self) -> Optional[NodeType]:
         # _gather_3: expression _loop0_4
         mark = self.mark()
@@ -4709,7 +4826,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def _loop0_6(self) -> Optional[NodeType]:
         # _loop0_6: ',' expression
         mark = self.mark()
@@ -4726,7 +4843,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return children
 
-    @memoize
+    @logger
     def _gather_5(self) -> Optional[NodeType]:
         # _gather_5: expression _loop0_6
         mark = self.mark()
@@ -4741,7 +4858,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def _loop0_8(self) -> Optional[NodeType]:
         # _loop0_8: ',' expression
         mark = self.mark()
@@ -4758,7 +4875,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return children
 
-    @memoize
+    @logger
     def _gather_7(self) -> Optional[NodeType]:
         # _gather_7: expression _loop0_8
         mark = self.mark()
@@ -4773,7 +4890,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def _loop0_10(self) -> Optional[NodeType]:
         # _loop0_10: ',' expression
         mark = self.mark()
@@ -4790,7 +4907,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return children
 
-    @memoize
+    @logger
     def _gather_9(self) -> Optional[NodeType]:
         # _gather_9: expression _loop0_10
         mark = self.mark()
@@ -4805,7 +4922,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def _loop1_11(self) -> Optional[NodeType]:
         # _loop1_11: statement
         mark = self.mark()
@@ -4820,7 +4937,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return children
 
-    @memoize
+    @logger
     def _loop0_13(self) -> Optional[NodeType]:
         # _loop0_13: ';' small_stmt
         mark = self.mark()
@@ -4837,7 +4954,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return children
 
-    @memoize
+    @logger
     def _gather_12(self) -> Optional[NodeType]:
         # _gather_12: small_stmt _loop0_13
         mark = self.mark()
@@ -4852,7 +4969,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def _tmp_14(self) -> Optional[NodeType]:
         # _tmp_14: 'import' | 'from'
         mark = self.mark()
@@ -4872,7 +4989,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def _tmp_15(self) -> Optional[NodeType]:
         # _tmp_15: 'def' | '@' | ASYNC
         mark = self.mark()
@@ -4899,7 +5016,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def _tmp_16(self) -> Optional[NodeType]:
         # _tmp_16: 'class' | '@'
         mark = self.mark()
@@ -4919,7 +5036,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def _tmp_17(self) -> Optional[NodeType]:
         # _tmp_17: 'with' | ASYNC
         mark = self.mark()
@@ -4939,7 +5056,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def _tmp_18(self) -> Optional[NodeType]:
         # _tmp_18: 'for' | ASYNC
         mark = self.mark()
@@ -4959,7 +5076,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def _tmp_19(self) -> Optional[NodeType]:
         # _tmp_19: '=' annotated_rhs
         mark = self.mark()
@@ -4974,7 +5091,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def _tmp_20(self) -> Optional[NodeType]:
         # _tmp_20: '(' single_target ')' | single_subscript_attribute_target
         mark = self.mark()
@@ -4998,7 +5115,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def _tmp_21(self) -> Optional[NodeType]:
         # _tmp_21: '=' annotated_rhs
         mark = self.mark()
@@ -5013,7 +5130,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def _loop1_22(self) -> Optional[NodeType]:
         # _loop1_22: (star_targets '=')
         mark = self.mark()
@@ -5028,7 +5145,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return children
 
-    @memoize
+    @logger
     def _tmp_23(self) -> Optional[NodeType]:
         # _tmp_23: yield_expr | star_expressions
         mark = self.mark()
@@ -5048,7 +5165,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def _tmp_24(self) -> Optional[NodeType]:
         # _tmp_24: yield_expr | star_expressions
         mark = self.mark()
@@ -5068,7 +5185,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def _loop0_26(self) -> Optional[NodeType]:
         # _loop0_26: ',' NAME
         mark = self.mark()
@@ -5085,7 +5202,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return children
 
-    @memoize
+    @logger
     def _gather_25(self) -> Optional[NodeType]:
         # _gather_25: NAME _loop0_26
         mark = self.mark()
@@ -5100,7 +5217,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def _loop0_28(self) -> Optional[NodeType]:
         # _loop0_28: ',' NAME
         mark = self.mark()
@@ -5117,7 +5234,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return children
 
-    @memoize
+    @logger
     def _gather_27(self) -> Optional[NodeType]:
         # _gather_27: NAME _loop0_28
         mark = self.mark()
@@ -5132,7 +5249,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def _tmp_29(self) -> Optional[NodeType]:
         # _tmp_29: ',' expression
         mark = self.mark()
@@ -5147,7 +5264,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def _tmp_30(self) -> Optional[NodeType]:
         # _tmp_30: ';' | NEWLINE
         mark = self.mark()
@@ -5167,7 +5284,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def _loop0_31(self) -> Optional[NodeType]:
         # _loop0_31: ('.' | '...')
         mark = self.mark()
@@ -5182,7 +5299,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return children
 
-    @memoize
+    @logger
     def _loop1_32(self) -> Optional[NodeType]:
         # _loop1_32: ('.' | '...')
         mark = self.mark()
@@ -5197,7 +5314,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return children
 
-    @memoize
+    @logger
     def _loop0_34(self) -> Optional[NodeType]:
         # _loop0_34: ',' import_from_as_name
         mark = self.mark()
@@ -5214,7 +5331,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return children
 
-    @memoize
+    @logger
     def _gather_33(self) -> Optional[NodeType]:
         # _gather_33: import_from_as_name _loop0_34
         mark = self.mark()
@@ -5229,7 +5346,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def _tmp_35(self) -> Optional[NodeType]:
         # _tmp_35: 'as' NAME
         mark = self.mark()
@@ -5244,7 +5361,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def _loop0_37(self) -> Optional[NodeType]:
         # _loop0_37: ',' dotted_as_name
         mark = self.mark()
@@ -5261,7 +5378,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return children
 
-    @memoize
+    @logger
     def _gather_36(self) -> Optional[NodeType]:
         # _gather_36: dotted_as_name _loop0_37
         mark = self.mark()
@@ -5276,7 +5393,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def _tmp_38(self) -> Optional[NodeType]:
         # _tmp_38: 'as' NAME
         mark = self.mark()
@@ -5291,7 +5408,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def _loop0_40(self) -> Optional[NodeType]:
         # _loop0_40: ',' with_item
         mark = self.mark()
@@ -5308,7 +5425,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return children
 
-    @memoize
+    @logger
     def _gather_39(self) -> Optional[NodeType]:
         # _gather_39: with_item _loop0_40
         mark = self.mark()
@@ -5323,7 +5440,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def _loop0_42(self) -> Optional[NodeType]:
         # _loop0_42: ',' with_item
         mark = self.mark()
@@ -5340,7 +5457,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return children
 
-    @memoize
+    @logger
     def _gather_41(self) -> Optional[NodeType]:
         # _gather_41: with_item _loop0_42
         mark = self.mark()
@@ -5355,7 +5472,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def _loop0_44(self) -> Optional[NodeType]:
         # _loop0_44: ',' with_item
         mark = self.mark()
@@ -5372,7 +5489,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return children
 
-    @memoize
+    @logger
     def _gather_43(self) -> Optional[NodeType]:
         # _gather_43: with_item _loop0_44
         mark = self.mark()
@@ -5387,7 +5504,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def _loop0_46(self) -> Optional[NodeType]:
         # _loop0_46: ',' with_item
         mark = self.mark()
@@ -5404,7 +5521,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return children
 
-    @memoize
+    @logger
     def _gather_45(self) -> Optional[NodeType]:
         # _gather_45: with_item _loop0_46
         mark = self.mark()
@@ -5419,7 +5536,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def _tmp_47(self) -> Optional[NodeType]:
         # _tmp_47: ',' | ')' | ':'
         mark = self.mark()
@@ -5446,7 +5563,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def _loop1_48(self) -> Optional[NodeType]:
         # _loop1_48: except_block
         mark = self.mark()
@@ -5461,7 +5578,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return children
 
-    @memoize
+    @logger
     def _tmp_49(self) -> Optional[NodeType]:
         # _tmp_49: 'as' NAME
         mark = self.mark()
@@ -5476,7 +5593,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def _tmp_50(self) -> Optional[NodeType]:
         # _tmp_50: 'from' expression
         mark = self.mark()
@@ -5491,7 +5608,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def _tmp_51(self) -> Optional[NodeType]:
         # _tmp_51: '->' expression
         mark = self.mark()
@@ -5506,7 +5623,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def _tmp_52(self) -> Optional[NodeType]:
         # _tmp_52: '->' expression
         mark = self.mark()
@@ -5521,7 +5638,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def _tmp_53(self) -> Optional[NodeType]:
         # _tmp_53: NEWLINE INDENT
         mark = self.mark()
@@ -5536,7 +5653,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def _loop0_54(self) -> Optional[NodeType]:
         # _loop0_54: param_no_default
         mark = self.mark()
@@ -5551,7 +5668,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return children
 
-    @memoize
+    @logger
     def _loop0_55(self) -> Optional[NodeType]:
         # _loop0_55: param_with_default
         mark = self.mark()
@@ -5566,7 +5683,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return children
 
-    @memoize
+    @logger
     def _loop0_56(self) -> Optional[NodeType]:
         # _loop0_56: param_with_default
         mark = self.mark()
@@ -5581,7 +5698,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return children
 
-    @memoize
+    @logger
     def _loop1_57(self) -> Optional[NodeType]:
         # _loop1_57: param_no_default
         mark = self.mark()
@@ -5596,7 +5713,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return children
 
-    @memoize
+    @logger
     def _loop0_58(self) -> Optional[NodeType]:
         # _loop0_58: param_with_default
         mark = self.mark()
@@ -5611,7 +5728,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return children
 
-    @memoize
+    @logger
     def _loop1_59(self) -> Optional[NodeType]:
         # _loop1_59: param_with_default
         mark = self.mark()
@@ -5626,7 +5743,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return children
 
-    @memoize
+    @logger
     def _loop1_60(self) -> Optional[NodeType]:
         # _loop1_60: param_no_default
         mark = self.mark()
@@ -5641,7 +5758,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return children
 
-    @memoize
+    @logger
     def _loop1_61(self) -> Optional[NodeType]:
         # _loop1_61: param_no_default
         mark = self.mark()
@@ -5656,7 +5773,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return children
 
-    @memoize
+    @logger
     def _loop0_62(self) -> Optional[NodeType]:
         # _loop0_62: param_no_default
         mark = self.mark()
@@ -5671,7 +5788,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return children
 
-    @memoize
+    @logger
     def _loop1_63(self) -> Optional[NodeType]:
         # _loop1_63: param_with_default
         mark = self.mark()
@@ -5686,7 +5803,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return children
 
-    @memoize
+    @logger
     def _loop0_64(self) -> Optional[NodeType]:
         # _loop0_64: param_no_default
         mark = self.mark()
@@ -5701,7 +5818,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return children
 
-    @memoize
+    @logger
     def _loop1_65(self) -> Optional[NodeType]:
         # _loop1_65: param_with_default
         mark = self.mark()
@@ -5716,7 +5833,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return children
 
-    @memoize
+    @logger
     def _loop0_66(self) -> Optional[NodeType]:
         # _loop0_66: param_maybe_default
         mark = self.mark()
@@ -5731,7 +5848,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return children
 
-    @memoize
+    @logger
     def _loop1_67(self) -> Optional[NodeType]:
         # _loop1_67: param_maybe_default
         mark = self.mark()
@@ -5746,7 +5863,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return children
 
-    @memoize
+    @logger
     def _loop1_68(self) -> Optional[NodeType]:
         # _loop1_68: ('@' named_expression NEWLINE)
         mark = self.mark()
@@ -5761,7 +5878,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return children
 
-    @memoize
+    @logger
     def _tmp_69(self) -> Optional[NodeType]:
         # _tmp_69: '(' arguments? ')'
         mark = self.mark()
@@ -5778,7 +5895,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def _loop0_71(self) -> Optional[NodeType]:
         # _loop0_71: ',' star_expression
         mark = self.mark()
@@ -5795,7 +5912,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return children
 
-    @memoize
+    @logger
     def _gather_70(self) -> Optional[NodeType]:
         # _gather_70: star_expression _loop0_71
         mark = self.mark()
@@ -5810,7 +5927,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def _loop1_72(self) -> Optional[NodeType]:
         # _loop1_72: (',' star_expression)
         mark = self.mark()
@@ -5825,7 +5942,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return children
 
-    @memoize
+    @logger
     def _loop0_74(self) -> Optional[NodeType]:
         # _loop0_74: ',' star_named_expression
         mark = self.mark()
@@ -5842,7 +5959,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return children
 
-    @memoize
+    @logger
     def _gather_73(self) -> Optional[NodeType]:
         # _gather_73: star_named_expression _loop0_74
         mark = self.mark()
@@ -5857,7 +5974,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def _loop1_75(self) -> Optional[NodeType]:
         # _loop1_75: (',' expression)
         mark = self.mark()
@@ -5872,7 +5989,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return children
 
-    @memoize
+    @logger
     def _loop0_76(self) -> Optional[NodeType]:
         # _loop0_76: lambda_param_no_default
         mark = self.mark()
@@ -5887,7 +6004,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return children
 
-    @memoize
+    @logger
     def _loop0_77(self) -> Optional[NodeType]:
         # _loop0_77: lambda_param_with_default
         mark = self.mark()
@@ -5902,7 +6019,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return children
 
-    @memoize
+    @logger
     def _loop0_78(self) -> Optional[NodeType]:
         # _loop0_78: lambda_param_with_default
         mark = self.mark()
@@ -5917,7 +6034,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return children
 
-    @memoize
+    @logger
     def _loop1_79(self) -> Optional[NodeType]:
         # _loop1_79: lambda_param_no_default
         mark = self.mark()
@@ -5932,7 +6049,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return children
 
-    @memoize
+    @logger
     def _loop0_80(self) -> Optional[NodeType]:
         # _loop0_80: lambda_param_with_default
         mark = self.mark()
@@ -5947,7 +6064,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return children
 
-    @memoize
+    @logger
     def _loop1_81(self) -> Optional[NodeType]:
         # _loop1_81: lambda_param_with_default
         mark = self.mark()
@@ -5962,7 +6079,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return children
 
-    @memoize
+    @logger
     def _loop1_82(self) -> Optional[NodeType]:
         # _loop1_82: lambda_param_no_default
         mark = self.mark()
@@ -5977,7 +6094,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return children
 
-    @memoize
+    @logger
     def _loop1_83(self) -> Optional[NodeType]:
         # _loop1_83: lambda_param_no_default
         mark = self.mark()
@@ -5992,7 +6109,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return children
 
-    @memoize
+    @logger
     def _loop0_84(self) -> Optional[NodeType]:
         # _loop0_84: lambda_param_no_default
         mark = self.mark()
@@ -6007,7 +6124,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return children
 
-    @memoize
+    @logger
     def _loop1_85(self) -> Optional[NodeType]:
         # _loop1_85: lambda_param_with_default
         mark = self.mark()
@@ -6022,7 +6139,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return children
 
-    @memoize
+    @logger
     def _loop0_86(self) -> Optional[NodeType]:
         # _loop0_86: lambda_param_no_default
         mark = self.mark()
@@ -6037,7 +6154,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return children
 
-    @memoize
+    @logger
     def _loop1_87(self) -> Optional[NodeType]:
         # _loop1_87: lambda_param_with_default
         mark = self.mark()
@@ -6052,7 +6169,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return children
 
-    @memoize
+    @logger
     def _loop0_88(self) -> Optional[NodeType]:
         # _loop0_88: lambda_param_maybe_default
         mark = self.mark()
@@ -6067,7 +6184,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return children
 
-    @memoize
+    @logger
     def _loop1_89(self) -> Optional[NodeType]:
         # _loop1_89: lambda_param_maybe_default
         mark = self.mark()
@@ -6082,7 +6199,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return children
 
-    @memoize
+    @logger
     def _loop1_90(self) -> Optional[NodeType]:
         # _loop1_90: ('or' conjunction)
         mark = self.mark()
@@ -6097,7 +6214,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return children
 
-    @memoize
+    @logger
     def _loop1_91(self) -> Optional[NodeType]:
         # _loop1_91: ('and' inversion)
         mark = self.mark()
@@ -6112,7 +6229,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return children
 
-    @memoize
+    @logger
     def _loop1_92(self) -> Optional[NodeType]:
         # _loop1_92: compare_op_bitwise_or_pair
         mark = self.mark()
@@ -6127,7 +6244,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return children
 
-    @memoize
+    @logger
     def _loop0_94(self) -> Optional[NodeType]:
         # _loop0_94: ',' slice
         mark = self.mark()
@@ -6144,7 +6261,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return children
 
-    @memoize
+    @logger
     def _gather_93(self) -> Optional[NodeType]:
         # _gather_93: slice _loop0_94
         mark = self.mark()
@@ -6159,7 +6276,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def _tmp_95(self) -> Optional[NodeType]:
         # _tmp_95: ':' expression?
         mark = self.mark()
@@ -6174,7 +6291,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def _tmp_96(self) -> Optional[NodeType]:
         # _tmp_96: tuple | group | genexp
         mark = self.mark()
@@ -6201,7 +6318,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def _tmp_97(self) -> Optional[NodeType]:
         # _tmp_97: list | listcomp
         mark = self.mark()
@@ -6221,7 +6338,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def _tmp_98(self) -> Optional[NodeType]:
         # _tmp_98: dict | set | dictcomp | setcomp
         mark = self.mark()
@@ -6255,7 +6372,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def _loop1_99(self) -> Optional[NodeType]:
         # _loop1_99: STRING
         mark = self.mark()
@@ -6270,7 +6387,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return children
 
-    @memoize
+    @logger
     def _tmp_100(self) -> Optional[NodeType]:
         # _tmp_100: star_named_expression ',' star_named_expressions?
         mark = self.mark()
@@ -6287,7 +6404,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def _tmp_101(self) -> Optional[NodeType]:
         # _tmp_101: yield_expr | named_expression
         mark = self.mark()
@@ -6307,7 +6424,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def _loop0_103(self) -> Optional[NodeType]:
         # _loop0_103: ',' double_starred_kvpair
         mark = self.mark()
@@ -6324,7 +6441,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return children
 
-    @memoize
+    @logger
     def _gather_102(self) -> Optional[NodeType]:
         # _gather_102: double_starred_kvpair _loop0_103
         mark = self.mark()
@@ -6339,7 +6456,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def _loop1_104(self) -> Optional[NodeType]:
         # _loop1_104: for_if_clause
         mark = self.mark()
@@ -6354,7 +6471,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return children
 
-    @memoize
+    @logger
     def _loop0_105(self) -> Optional[NodeType]:
         # _loop0_105: ('if' disjunction)
         mark = self.mark()
@@ -6369,7 +6486,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return children
 
-    @memoize
+    @logger
     def _loop0_106(self) -> Optional[NodeType]:
         # _loop0_106: ('if' disjunction)
         mark = self.mark()
@@ -6384,7 +6501,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return children
 
-    @memoize
+    @logger
     def _loop0_108(self) -> Optional[NodeType]:
         # _loop0_108: ',' (starred_expression | named_expression !'=')
         mark = self.mark()
@@ -6401,7 +6518,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return children
 
-    @memoize
+    @logger
     def _gather_107(self) -> Optional[NodeType]:
         # _gather_107: (starred_expression | named_expression !'=') _loop0_108
         mark = self.mark()
@@ -6416,7 +6533,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def _tmp_109(self) -> Optional[NodeType]:
         # _tmp_109: ',' kwargs
         mark = self.mark()
@@ -6424,14 +6541,14 @@ class GeneratedParser(Parser):
         if (
             (literal := self.expect(','))
             and
-            (kwargs := self.kwargs())
+            (k := self.kwargs())
         ):
-            return [literal, kwargs]
+            return [literal, k]
         self.reset(mark)
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def _loop0_111(self) -> Optional[NodeType]:
         # _loop0_111: ',' kwarg_or_starred
         mark = self.mark()
@@ -6448,7 +6565,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return children
 
-    @memoize
+    @logger
     def _gather_110(self) -> Optional[NodeType]:
         # _gather_110: kwarg_or_starred _loop0_111
         mark = self.mark()
@@ -6463,7 +6580,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def _loop0_113(self) -> Optional[NodeType]:
         # _loop0_113: ',' kwarg_or_double_starred
         mark = self.mark()
@@ -6480,7 +6597,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return children
 
-    @memoize
+    @logger
     def _gather_112(self) -> Optional[NodeType]:
         # _gather_112: kwarg_or_double_starred _loop0_113
         mark = self.mark()
@@ -6495,7 +6612,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def _loop0_115(self) -> Optional[NodeType]:
         # _loop0_115: ',' kwarg_or_starred
         mark = self.mark()
@@ -6512,7 +6629,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return children
 
-    @memoize
+    @logger
     def _gather_114(self) -> Optional[NodeType]:
         # _gather_114: kwarg_or_starred _loop0_115
         mark = self.mark()
@@ -6527,7 +6644,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def _loop0_117(self) -> Optional[NodeType]:
         # _loop0_117: ',' kwarg_or_double_starred
         mark = self.mark()
@@ -6544,7 +6661,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return children
 
-    @memoize
+    @logger
     def _gather_116(self) -> Optional[NodeType]:
         # _gather_116: kwarg_or_double_starred _loop0_117
         mark = self.mark()
@@ -6559,7 +6676,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def _loop0_118(self) -> Optional[NodeType]:
         # _loop0_118: (',' star_target)
         mark = self.mark()
@@ -6574,7 +6691,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return children
 
-    @memoize
+    @logger
     def _loop0_120(self) -> Optional[NodeType]:
         # _loop0_120: ',' star_target
         mark = self.mark()
@@ -6591,7 +6708,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return children
 
-    @memoize
+    @logger
     def _gather_119(self) -> Optional[NodeType]:
         # _gather_119: star_target _loop0_120
         mark = self.mark()
@@ -6606,7 +6723,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def _tmp_121(self) -> Optional[NodeType]:
         # _tmp_121: !'*' star_target
         mark = self.mark()
@@ -6621,7 +6738,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def _loop0_123(self) -> Optional[NodeType]:
         # _loop0_123: ',' del_target
         mark = self.mark()
@@ -6638,7 +6755,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return children
 
-    @memoize
+    @logger
     def _gather_122(self) -> Optional[NodeType]:
         # _gather_122: del_target _loop0_123
         mark = self.mark()
@@ -6653,7 +6770,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def _loop0_125(self) -> Optional[NodeType]:
         # _loop0_125: ',' target
         mark = self.mark()
@@ -6670,7 +6787,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return children
 
-    @memoize
+    @logger
     def _gather_124(self) -> Optional[NodeType]:
         # _gather_124: target _loop0_125
         mark = self.mark()
@@ -6685,7 +6802,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def _tmp_126(self) -> Optional[NodeType]:
         # _tmp_126: args | expression for_if_clauses
         mark = self.mark()
@@ -6707,7 +6824,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def _loop0_127(self) -> Optional[NodeType]:
         # _loop0_127: star_named_expressions
         mark = self.mark()
@@ -6722,7 +6839,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return children
 
-    @memoize
+    @logger
     def _loop0_128(self) -> Optional[NodeType]:
         # _loop0_128: (star_targets '=')
         mark = self.mark()
@@ -6737,7 +6854,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return children
 
-    @memoize
+    @logger
     def _loop0_129(self) -> Optional[NodeType]:
         # _loop0_129: (star_targets '=')
         mark = self.mark()
@@ -6752,7 +6869,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return children
 
-    @memoize
+    @logger
     def _tmp_130(self) -> Optional[NodeType]:
         # _tmp_130: yield_expr | star_expressions
         mark = self.mark()
@@ -6772,7 +6889,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def _tmp_131(self) -> Optional[NodeType]:
         # _tmp_131: '[' | '(' | '{'
         mark = self.mark()
@@ -6799,7 +6916,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def _loop0_132(self) -> Optional[NodeType]:
         # _loop0_132: param_no_default
         mark = self.mark()
@@ -6814,7 +6931,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return children
 
-    @memoize
+    @logger
     def _tmp_133(self) -> Optional[NodeType]:
         # _tmp_133: slash_with_default | param_with_default+
         mark = self.mark()
@@ -6834,7 +6951,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def _loop0_134(self) -> Optional[NodeType]:
         # _loop0_134: lambda_param_no_default
         mark = self.mark()
@@ -6849,7 +6966,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return children
 
-    @memoize
+    @logger
     def _tmp_135(self) -> Optional[NodeType]:
         # _tmp_135: lambda_slash_with_default | lambda_param_with_default+
         mark = self.mark()
@@ -6869,7 +6986,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def _tmp_136(self) -> Optional[NodeType]:
         # _tmp_136: ')' | ',' (')' | '**')
         mark = self.mark()
@@ -6891,7 +7008,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def _tmp_137(self) -> Optional[NodeType]:
         # _tmp_137: ':' | ',' (':' | '**')
         mark = self.mark()
@@ -6913,7 +7030,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def _tmp_138(self) -> Optional[NodeType]:
         # _tmp_138: star_targets '='
         mark = self.mark()
@@ -6928,7 +7045,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def _tmp_139(self) -> Optional[NodeType]:
         # _tmp_139: '.' | '...'
         mark = self.mark()
@@ -6948,7 +7065,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def _tmp_140(self) -> Optional[NodeType]:
         # _tmp_140: '.' | '...'
         mark = self.mark()
@@ -6968,7 +7085,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def _tmp_141(self) -> Optional[NodeType]:
         # _tmp_141: '@' named_expression NEWLINE
         mark = self.mark()
@@ -6985,7 +7102,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def _tmp_142(self) -> Optional[NodeType]:
         # _tmp_142: ',' star_expression
         mark = self.mark()
@@ -7000,7 +7117,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def _tmp_143(self) -> Optional[NodeType]:
         # _tmp_143: ',' expression
         mark = self.mark()
@@ -7015,7 +7132,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def _tmp_144(self) -> Optional[NodeType]:
         # _tmp_144: 'or' conjunction
         mark = self.mark()
@@ -7030,7 +7147,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def _tmp_145(self) -> Optional[NodeType]:
         # _tmp_145: 'and' inversion
         mark = self.mark()
@@ -7045,7 +7162,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def _tmp_146(self) -> Optional[NodeType]:
         # _tmp_146: 'if' disjunction
         mark = self.mark()
@@ -7060,7 +7177,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def _tmp_147(self) -> Optional[NodeType]:
         # _tmp_147: 'if' disjunction
         mark = self.mark()
@@ -7075,7 +7192,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def _tmp_148(self) -> Optional[NodeType]:
         # _tmp_148: starred_expression | named_expression !'='
         mark = self.mark()
@@ -7097,7 +7214,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def _tmp_149(self) -> Optional[NodeType]:
         # _tmp_149: ',' star_target
         mark = self.mark()
@@ -7112,7 +7229,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def _tmp_150(self) -> Optional[NodeType]:
         # _tmp_150: star_targets '='
         mark = self.mark()
@@ -7127,7 +7244,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def _tmp_151(self) -> Optional[NodeType]:
         # _tmp_151: star_targets '='
         mark = self.mark()
@@ -7142,7 +7259,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def _loop1_152(self) -> Optional[NodeType]:
         # _loop1_152: param_with_default
         mark = self.mark()
@@ -7157,7 +7274,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return children
 
-    @memoize
+    @logger
     def _loop1_153(self) -> Optional[NodeType]:
         # _loop1_153: lambda_param_with_default
         mark = self.mark()
@@ -7172,7 +7289,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return children
 
-    @memoize
+    @logger
     def _tmp_154(self) -> Optional[NodeType]:
         # _tmp_154: ')' | '**'
         mark = self.mark()
@@ -7192,7 +7309,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def _tmp_155(self) -> Optional[NodeType]:
         # _tmp_155: ':' | '**'
         mark = self.mark()
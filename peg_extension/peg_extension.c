@@ -1,5 +1,136 @@
 #include "pegen.h"
 
+/* Parse budget.  Each generated rule function decrements the countdown
+   that _PyPegen_budget_countdown points to and calls _PyPegen_check_budget()
+   when it goes below zero; see CHECK_BUDGET in pegen/c_generator.py.
+
+   CPython's Parser struct has no room for the budget, and the Parser is
+   created inside _PyPegen_run_parser_from_*(), so each parse keeps its
+   budget on the C stack of parse_file() or parse_string() and points a
+   thread-local variable at it for the duration of the parse.  Parses in
+   other threads (the GIL can switch threads while a parse runs Python
+   code, e.g. a __del__ method) and nested parses each see their own
+   budget.  The pointer is NULL when there is no budget, which is the
+   cheapest case for the rule functions. */
+
+#ifdef _MSC_VER
+#define PEGEN_THREAD_LOCAL __declspec(thread)
+#else
+#define PEGEN_THREAD_LOCAL _Thread_local
+#endif
+
+// Rule calls between clock readings when a parse has a deadline.
+#define BUDGET_CHECK_INTERVAL 1024
+
+typedef struct {
+    Py_ssize_t countdown;  // Must be first; see _PyPegen_check_budget()
+    Py_ssize_t countdown_start;
+    Py_ssize_t fuel;  // Negative for no limit
+    double deadline;  // A time.monotonic() value; negative for none
+    Py_ssize_t calls;  // Rule calls before the current countdown
+    Py_ssize_t *saved;  // The enclosing parse's countdown, if any
+} ParseBudget;
+
+PEGEN_THREAD_LOCAL Py_ssize_t *_PyPegen_budget_countdown = NULL;
+static PyObject *ParseBudgetExceeded = NULL;
+#if PY_VERSION_HEX < 0x030D0000
+static PyObject *time_monotonic = NULL;
+#endif
+
+// Return the time.monotonic() clock, or -1 with an exception set.
+static double
+monotonic(void)
+{
+#if PY_VERSION_HEX >= 0x030D0000
+    PyTime_t t;
+    if (PyTime_Monotonic(&t) < 0) {
+        return -1;
+    }
+    return PyTime_AsSecondsDouble(t);
+#else
+    PyObject *value = PyObject_CallObject(time_monotonic, NULL);
+    if (value == NULL) {
+        return -1;
+    }
+    double seconds = PyFloat_AsDouble(value);
+    Py_DECREF(value);
+    return seconds;
+#endif
+}
+
+static void
+start_countdown(ParseBudget *budget)
+{
+    Py_ssize_t count = PY_SSIZE_T_MAX;
+    if (budget->fuel >= 0) {
+        count = budget->fuel - budget->calls;
+    }
+    if (budget->deadline >= 0 && count > BUDGET_CHECK_INTERVAL) {
+        count = BUDGET_CHECK_INTERVAL;
+    }
+    budget->countdown_start = budget->countdown = count;
+}
+
+// Make budget the current thread's budget, if there is a limit; undo with
+// end_budget().
+static void
+start_budget(ParseBudget *budget, Py_ssize_t fuel, double deadline)
+{
+    budget->fuel = fuel;
+    budget->deadline = deadline;
+    budget->calls = 0;
+    budget->saved = _PyPegen_budget_countdown;
+    start_countdown(budget);
+    _PyPegen_budget_countdown = fuel >= 0 || deadline >= 0 ? &budget->countdown : NULL;
+}
+
+static void
+end_budget(ParseBudget *budget)
+{
+    _PyPegen_budget_countdown = budget->saved;
+}
+
+// Return 1 with an exception (usually ParseBudgetExceeded) set if the
+// budget is used up, else restart the countdown and return 0.
+int
+_PyPegen_check_budget(Parser *p)
+{
+    // countdown is the first member, so this points to the whole budget.
+    ParseBudget *budget = (ParseBudget *)_PyPegen_budget_countdown;
+    budget->calls += budget->countdown_start + 1;
+    const char *reason = NULL;
+    if (budget->fuel >= 0 && budget->calls > budget->fuel) {
+        reason = "fuel";
+    }
+    else if (budget->deadline >= 0) {
+        double now = monotonic();
+        if (now == -1 && PyErr_Occurred()) {
+            return 1;
+        }
+        if (now >= budget->deadline) {
+            reason = "deadline";
+        }
+    }
+    if (reason == NULL) {
+        start_countdown(budget);
+        return 0;
+    }
+    // Report the furthest token looked at, like a SyntaxError would.
+    int lineno = 0, offset = 0;
+    if (p->fill > 0) {
+        Token *t = p->tokens[p->fill - 1];
+        lineno = t->lineno;
+        offset = t->col_offset + 1;
+    }
+    PyObject *exc = PyObject_CallFunction(ParseBudgetExceeded, "snii", reason,
+                                          budget->calls - 1, lineno, offset);
+    if (exc != NULL) {
+        PyErr_SetObject(ParseBudgetExceeded, exc);
+        Py_DECREF(exc);
+    }
+    return 1;
+}
+
 PyObject *
 _build_return_object(mod_ty module, int mode, PyObject *filename_ob, PyArena *arena)
 {
@@ -22,10 +153,13 @@ _build_return_object(mod_ty module, int mode, PyObject *filename_ob, PyArena *ar
 static PyObject *
 parse_file(PyObject *self, PyObject *args, PyObject *kwds)
 {
-    static char *keywords[] = {"file", "mode", NULL};
+    static char *keywords[] = {"file", "mode", "fuel", "deadline", NULL};
     const char *filename;
     int mode = 2;
-    if (!PyArg_ParseTupleAndKeywords(args, kwds, "s|i", keywords, &filename, &mode)) {
+    Py_ssize_t fuel = -1;
+    double deadline = -1;
+    if (!PyArg_ParseTupleAndKeywords(args, kwds, "s|i$nd", keywords, &filename, &mode, &fuel,
+                                     &deadline)) {
         return NULL;
     }
     if (mode < 0 || mode > 2) {
@@ -45,8 +179,11 @@ parse_file(PyObject *self, PyObject *args, PyObject *kwds)
     }
 
     PyCompilerFlags flags = _PyCompilerFlags_INIT;
+    ParseBudget budget;
+    start_budget(&budget, fuel, deadline);
     mod_ty res =
         _PyPegen_run_parser_from_file(filename, Py_file_input, filename_ob, &flags, arena);
+    end_budget(&budget);
     if (res == NULL) {
         goto error;
     }
@@ -62,10 +199,13 @@ error:
 static PyObject *
 parse_string(PyObject *self, PyObject *args, PyObject *kwds)
 {
-    static char *keywords[] = {"str", "mode", NULL};
+    static char *keywords[] = {"str", "mode", "fuel", "deadline", NULL};
     const char *the_string;
     int mode = 2;
-    if (!PyArg_ParseTupleAndKeywords(args, kwds, "s|i", keywords, &the_string, &mode)) {
+    Py_ssize_t fuel = -1;
+    double deadline = -1;
+    if (!PyArg_ParseTupleAndKeywords(args, kwds, "s|i$nd", keywords, &the_string, &mode, &fuel,
+                                     &deadline)) {
         return NULL;
     }
     if (mode < 0 || mode > 2) {
@@ -85,8 +225,11 @@ parse_string(PyObject *self, PyObject *args, PyObject *kwds)
     }
 
     PyCompilerFlags flags = _PyCompilerFlags_INIT;
+    ParseBudget budget;
+    start_budget(&budget, fuel, deadline);
     mod_ty res =
         _PyPegen_run_parser_from_string(the_string, Py_file_input, filename_ob, &flags, arena);
+    end_budget(&budget);
     if (res == NULL) {
         goto error;
     }
@@ -136,9 +279,11 @@ dump_memo_stats(PyObject *Py_UNUSED(self), PyObject *Py_UNUSED(ignored))
 
 static PyMethodDef ParseMethods[] = {
     {"parse_file", (PyCFunction)(void (*)(void))parse_file, METH_VARARGS | METH_KEYWORDS,
-     "Parse a file."},
+     "Parse a file.\n\n"
+     "fuel limits the number of rule calls, and deadline (a time.monotonic()\n"
+     "value) the time; going over either raises ParseBudgetExceeded."},
     {"parse_string", (PyCFunction)(void (*)(void))parse_string, METH_VARARGS | METH_KEYWORDS,
-     "Parse a string."},
+     "Parse a string; fuel and deadline are as for parse_file()."},
     {"clear_memo_stats", clear_memo_stats, METH_NOARGS},
     {"dump_memo_stats", dump_memo_stats, METH_NOARGS},
     {"get_memo_stats", get_memo_stats, METH_NOARGS},
@@ -155,5 +300,46 @@ static struct PyModuleDef parsemodule = {
 PyMODINIT_FUNC
 PyInit_parse(void)
 {
-    return PyModule_Create(&parsemodule);
+    PyObject *m = PyModule_Create(&parsemodule);
+    if (m == NULL) {
+        return NULL;
+    }
+    if (ParseBudgetExceeded == NULL) {
+        // Share the exception with the Python runtime if it's around.
+        PyObject *runtime = PyImport_ImportModule("pegen.parser");
+        if (runtime != NULL) {
+            ParseBudgetExceeded = PyObject_GetAttrString(runtime, "ParseBudgetExceeded");
+            Py_DECREF(runtime);
+        }
+        if (ParseBudgetExceeded == NULL) {
+            PyErr_Clear();
+            ParseBudgetExceeded = PyErr_NewException("parse.ParseBudgetExceeded", NULL, NULL);
+            if (ParseBudgetExceeded == NULL) {
+                Py_DECREF(m);
+                return NULL;
+            }
+        }
+    }
+#if PY_VERSION_HEX < 0x030D0000
+    if (time_monotonic == NULL) {
+        PyObject *time = PyImport_ImportModule("time");
+        if (time == NULL) {
+            Py_DECREF(m);
+            return NULL;
+        }
+        time_monotonic = PyObject_GetAttrString(time, "monotonic");
+        Py_DECREF(time);
+        if (time_monotonic == NULL) {
+            Py_DECREF(m);
+            return NULL;
+        }
+    }
+#endif
+    Py_INCREF(ParseBudgetExceeded);
+    if (PyModule_AddObject(m, "ParseBudgetExceeded", ParseBudgetExceeded) < 0) {
+        Py_DECREF(ParseBudgetExceeded);
+        Py_DECREF(m);
+        return NULL;
+    }
+    return m;
 }
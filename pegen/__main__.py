@@ -35,6 +35,7 @@ def generate_c_code(
             args.verbose,
             keep_asserts_in_extension=False if args.optimized else True,
             skip_actions=args.skip_actions,
+            two_pass=args.two_pass,
         )
         return grammar, parser, tokenizer, gen
     except Exception as err:
@@ -49,17 +50,28 @@ def generate_python_code(
     args: argparse.Namespace,
 ) -> Tuple[Grammar, Parser, Tokenizer, ParserGenerator]:
     from pegen.build import build_python_parser_and_generator
+    from pegen.parser import load_memo_policy
 
     verbose = args.verbose
     verbose_tokenizer = verbose >= 3
     verbose_parser = verbose == 2 or verbose >= 4
     try:
+        memo_policy = None
+        if args.memo_policy:
+            with open(args.memo_policy) as file:
+                memo_policy = load_memo_policy(file)
         grammar, parser, tokenizer, gen = build_python_parser_and_generator(
             args.grammar_filename,
             args.output,
             verbose_tokenizer,
             verbose_parser,
             skip_actions=args.skip_actions,
+            fast=args.fast,
+            inline=args.inline,
+            memoize_all=args.memoize_all,
+            prune_cuts=args.prune_cuts,
+            memo_policy=memo_policy,
+            two_pass=args.two_pass,
         )
         return grammar, parser, tokenizer, gen
     except Exception as err:
@@ -103,6 +115,11 @@ c_parser.add_argument(
     action="store_true",
     help="Suppress code emission for rule actions",
 )
+c_parser.add_argument(
+    "--two-pass",
+    action="store_true",
+    help="Only try the invalid_ rules in a second pass, when the first one fails",
+)
 
 python_parser = subparsers.add_parser("python", help="Generate Python code")
 python_parser.set_defaults(func=generate_python_code)
@@ -119,6 +136,36 @@ python_parser.add_argument(
     action="store_true",
     help="Suppress code emission for rule actions",
 )
+python_parser.add_argument(
+    "--fast",
+    action="store_true",
+    help="Generate a parser without tracing, reach bookkeeping and dummy-token hooks",
+)
+python_parser.add_argument(
+    "--inline",
+    action="store_true",
+    help="Inline memo lookups and token matches into the rule methods (implies --fast)",
+)
+python_parser.add_argument(
+    "--memoize-all",
+    action="store_true",
+    help="Memoize every rule, not just those marked (memo)",
+)
+python_parser.add_argument(
+    "--prune-cuts",
+    action="store_true",
+    help="Delete memo entries made obsolete by a cut (~); rarely worth it",
+)
+python_parser.add_argument(
+    "--memo-policy",
+    metavar="FILE",
+    help="Memoize the rules as decided by a policy saved by --learn-memo-policy",
+)
+python_parser.add_argument(
+    "--two-pass",
+    action="store_true",
+    help="Only try the invalid_ rules in a second pass, when the first one fails",
+)
 
 
 def main() -> None:
@@ -157,9 +204,16 @@ def main() -> None:
             else:
                 name = next(iter(scc))
                 if name in gen.first_graph[name]:
-                    print("  # Left-recursive")
+                    if grammar.rules[name].left_rec_loop:
+                        print("  # Left-recursive, parsed with a loop")
+                    else:
+                        print("  # Left-recursive")
                 else:
                     print()
+        ll1_rules = [name for name, rule in grammar.rules.items() if rule.ll1]
+        print(f"LL(1) rules: {len(ll1_rules)} of {len(grammar.rules)}")
+        for name in ll1_rules:
+            print(" ", name)
 
     if args.verbose:
         dt = t1 - t0
@@ -174,7 +228,7 @@ def main() -> None:
             print()
         print("Caches sizes:")
         print(f"  token array : {len(tokenizer._tokens):10}")
-        print(f"        cache : {len(parser._cache):10}")
+        print(f"        cache : {parser.memo_size():10}")
         if not print_memstats():
             print("(Can't find psutil; install it for memory stats.)")
 
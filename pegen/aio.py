@@ -0,0 +1,118 @@
+"""Parse from asyncio code without blocking the event loop.
+
+Usage:
+
+    async for result in aiter_parse(GeneratedParser, chunks):
+        ...  # A statement's tree, or a SyntaxError
+
+    tree = await parse_in_executor(GeneratedParser, text)
+
+aiter_parse() parses a statement at a time on the event loop thread,
+from an async iterable of text chunks or tokens.  It only yields to
+other tasks between lines: a statement is parsed in one go once it's
+complete (for a compound statement, once its last block has ended),
+so this suits input made of many smallish statements.
+
+parse_in_executor() runs a whole parse in an executor.  If the task
+awaiting it is cancelled, the parse stops at the next token it reads.
+"""
+
+import asyncio
+import concurrent.futures
+import io
+import threading
+import token
+import tokenize
+from typing import Any, AsyncIterable, AsyncIterator, Iterator, List, Optional, Type, Union
+
+from pegen.parser import Parser
+from pegen.push import PushParser
+from pegen.tokenizer import Tokenizer
+
+
+class ParseCancelled(Exception):
+    """Raised in the worker thread to stop a parse whose task was cancelled."""
+
+
+async def aiter_parse(
+    parser_class: Type[Parser],
+    source: AsyncIterable[Union[str, tokenize.TokenInfo]],
+    *,
+    rule: str = "statement",
+    filename: str = "<unknown>",
+    yield_every: int = 1000,
+) -> AsyncIterator[Any]:
+    """Yield the tree of each statement in source, or a SyntaxError if it fails.
+
+    source yields either text chunks or tokens (as from tokenize), not
+    a mix of both.  Control goes back to the event loop after each line
+    (or logical line of tokens) once yield_every tokens have been parsed
+    since the last time.  The parser can't stop within a statement, so
+    a long compound statement holds up the loop until it's parsed.
+    """
+    push = PushParser(parser_class, rule=rule, filename=filename)
+    tokenizer = push.tokenizer
+    last_yield = tokenizer.mark()
+    pending: List[tokenize.TokenInfo] = []
+
+    async def pause() -> None:
+        nonlocal last_yield
+        if tokenizer.mark() - last_yield >= yield_every:
+            await asyncio.sleep(0)
+            last_yield = tokenizer.mark()
+
+    async for item in source:
+        if isinstance(item, str):
+            # Feed a line at a time, so that a large chunk doesn't hold up the loop.
+            for line in item.splitlines(keepends=True):
+                for result in push.feed(line):
+                    yield result
+                await pause()
+        else:
+            pending.append(item)
+            if item.type in (token.NEWLINE, token.ENDMARKER):
+                tokens, pending = pending, []
+                for result in push.feed_tokens(tokens):
+                    yield result
+                await pause()
+    if pending:
+        for result in push.feed_tokens(pending):
+            yield result
+    for result in push.close():
+        yield result
+
+
+async def parse_in_executor(
+    parser_class: Type[Parser],
+    text: str,
+    *,
+    rule: str = "start",
+    filename: str = "<unknown>",
+    executor: Optional[concurrent.futures.Executor] = None,
+) -> Any:
+    """Parse text with the given rule in executor; return the tree.
+
+    Raises SyntaxError if the rule fails.  executor defaults to the
+    event loop's default executor.
+    """
+    cancelled = threading.Event()
+
+    def tokens() -> Iterator[tokenize.TokenInfo]:
+        for tok in tokenize.generate_tokens(io.StringIO(text).readline):
+            if cancelled.is_set():
+                raise ParseCancelled
+            yield tok
+
+    def parse() -> Any:
+        parser = parser_class(Tokenizer(tokens()))
+        tree = parser.parse_rule(rule)
+        if tree is None:
+            raise parser.make_syntax_error(filename)
+        return tree
+
+    loop = asyncio.get_running_loop()
+    try:
+        return await loop.run_in_executor(executor, parse)
+    except asyncio.CancelledError:
+        cancelled.set()
+        raise
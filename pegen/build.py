@@ -29,6 +29,23 @@ def get_extra_flags(compiler_flags: str, compiler_py_flags_nodist: str) -> List[
     return f"{flags} {py_flags_nodist}".split()
 
 
+def find_cpython_root() -> pathlib.Path:
+    """Return the CPython checkout whose sources compile_c_extension() builds with.
+
+    Raise ValueError if there is none.
+    """
+    cpython_root_str = os.getenv("CPYTHON_ROOT")
+    if cpython_root_str:
+        return pathlib.Path(cpython_root_str)
+    cpython_root = MOD_DIR.parent.parent / "cpython"
+    if not (cpython_root / "Python").is_dir():
+        # This is Guido's convention. :-)
+        cpython_root = pathlib.Path.home() / "cpython"
+    if not (cpython_root / "Python").is_dir():
+        raise ValueError("No CPython repository found. Please use the CPYTHON_ROOT env variable.")
+    return cpython_root
+
+
 def compile_c_extension(
     generated_source_path: str,
     build_dir: Optional[str] = None,
@@ -60,18 +77,7 @@ def compile_c_extension(
     extra_link_args = get_extra_flags("LDFLAGS", "PY_LDFLAGS_NODIST")
     if keep_asserts:
         extra_compile_args.append("-UNDEBUG")
-    cpython_root_str = os.getenv("CPYTHON_ROOT")
-    if cpython_root_str:
-        cpython_root: pathlib.Path = pathlib.Path(cpython_root_str)
-    else:
-        cpython_root = MOD_DIR.parent.parent / "cpython"
-        if not (cpython_root / "Python").is_dir():
-            # This is Guido's convention. :-)
-            cpython_root = pathlib.Path.home() / "cpython"
-        if not (cpython_root / "Python").is_dir():
-            raise ValueError(
-                "No CPython repository found. Please use the CPYTHON_ROOT env variable."
-            )
+    cpython_root = find_cpython_root()
     extension = [
         Extension(
             extension_name,
@@ -164,12 +170,19 @@ def build_c_generator(
     verbose_c_extension: bool = False,
     keep_asserts_in_extension: bool = True,
     skip_actions: bool = False,
+    two_pass: bool = False,
 ) -> ParserGenerator:
     with open(tokens_file, "r") as tok_file:
         all_tokens, exact_tok, non_exact_tok = generate_token_definitions(tok_file)
     with open(output_file, "w") as file:
         gen: ParserGenerator = CParserGenerator(
-            grammar, all_tokens, exact_tok, non_exact_tok, file, skip_actions=skip_actions
+            grammar,
+            all_tokens,
+            exact_tok,
+            non_exact_tok,
+            file,
+            skip_actions=skip_actions,
+            two_pass=two_pass,
         )
         gen.generate(grammar_file)
 
@@ -189,9 +202,25 @@ def build_python_generator(
     grammar_file: str,
     output_file: str,
     skip_actions: bool = False,
+    fast: bool = False,
+    inline: bool = False,
+    memoize_all: bool = False,
+    prune_cuts: bool = False,
+    memo_policy: Optional[Dict[str, bool]] = None,
+    two_pass: bool = False,
 ) -> ParserGenerator:
     with open(output_file, "w") as file:
-        gen: ParserGenerator = PythonParserGenerator(grammar, file, skip_actions=skip_actions)
+        gen: ParserGenerator = PythonParserGenerator(
+            grammar,
+            file,
+            skip_actions=skip_actions,
+            fast=fast,
+            inline=inline,
+            memoize_all=memoize_all,
+            prune_cuts=prune_cuts,
+            memo_policy=memo_policy,
+            two_pass=two_pass,
+        )
         gen.generate(grammar_file)
     return gen
 
@@ -206,6 +235,7 @@ def build_c_parser_and_generator(
     verbose_c_extension: bool = False,
     keep_asserts_in_extension: bool = True,
     skip_actions: bool = False,
+    two_pass: bool = False,
 ) -> Tuple[Grammar, Parser, Tokenizer, ParserGenerator]:
     """Generate rules, C parser, tokenizer, parser generator for a given grammar
 
@@ -224,6 +254,8 @@ def build_c_parser_and_generator(
         keep_asserts_in_extension (bool, optional): Whether to keep the assert statements
           when compiling the extension module. Defaults to True.
         skip_actions (bool, optional): Whether to pretend no rule has any actions.
+        two_pass (bool, optional): Whether to leave the alternatives using invalid_
+          rules for a second pass, made only if the first one fails. Defaults to False.
     """
     grammar, parser, tokenizer = build_parser(grammar_file, verbose_tokenizer, verbose_parser)
     gen = build_c_generator(
@@ -235,6 +267,7 @@ def build_c_parser_and_generator(
         verbose_c_extension,
         keep_asserts_in_extension,
         skip_actions=skip_actions,
+        two_pass=two_pass,
     )
 
     return grammar, parser, tokenizer, gen
@@ -246,6 +279,12 @@ def build_python_parser_and_generator(
     verbose_tokenizer: bool = False,
     verbose_parser: bool = False,
     skip_actions: bool = False,
+    fast: bool = False,
+    inline: bool = False,
+    memoize_all: bool = False,
+    prune_cuts: bool = False,
+    memo_policy: Optional[Dict[str, bool]] = None,
+    two_pass: bool = False,
 ) -> Tuple[Grammar, Parser, Tokenizer, ParserGenerator]:
     """Generate rules, python parser, tokenizer, parser generator for a given grammar
 
@@ -257,6 +296,19 @@ def build_python_parser_and_generator(
         verbose_parser (bool, optional): Whether to display additional output
           when generating the parser. Defaults to False.
         skip_actions (bool, optional): Whether to pretend no rule has any actions.
+        fast (bool, optional): Whether to generate a FastParser subclass, without
+          tracing, reach bookkeeping and dummy-token hooks. Defaults to False.
+        inline (bool, optional): Whether to inline memo lookups and token matches
+          into the rule methods; implies fast. Defaults to False.
+        memoize_all (bool, optional): Whether to memoize every rule instead of only
+          those marked (memo). Defaults to False.
+        prune_cuts (bool, optional): Whether to delete memo entries made obsolete by a
+          cut (~). Defaults to False.
+        memo_policy (dict, optional): Rule name -> whether to memoize it, e.g. from
+          pegen.parser.load_memo_policy(); overrides (memo) and memoize_all.
+        two_pass (bool, optional): Whether to leave the alternatives using invalid_
+          rules for a second pass, made by Parser.parse_rule() only if the first one
+          fails. Defaults to False.
     """
     grammar, parser, tokenizer = build_parser(grammar_file, verbose_tokenizer, verbose_parser)
     gen = build_python_generator(
@@ -264,5 +316,11 @@ def build_python_parser_and_generator(
         grammar_file,
         output_file,
         skip_actions=skip_actions,
+        fast=fast,
+        inline=inline,
+        memoize_all=memoize_all,
+        prune_cuts=prune_cuts,
+        memo_policy=memo_policy,
+        two_pass=two_pass,
     )
     return grammar, parser, tokenizer, gen
@@ -1,7 +1,7 @@
 import ast
 from dataclasses import field, dataclass
 import re
-from typing import Any, Dict, IO, Optional, List, Text, Tuple, Set
+from typing import Any, Dict, IO, Optional, List, Sequence, Text, Tuple, Set
 from enum import Enum
 
 from pegen import grammar
@@ -23,7 +23,7 @@ from pegen.grammar import (
     Rule,
     StringLeaf,
 )
-from pegen.parser_generator import ParserGenerator
+from pegen.parser_generator import left_rec_tails, ParserGenerator, uses_invalid_rule
 
 
 EXTENSION_PREFIX = """\
@@ -39,6 +39,109 @@ extern int Py_DebugFlag;
 """
 
 
+# Declarations for the parse budget check at the start of each rule
+# function.  The budget is kept per parse by peg_extension.c, which points
+# the thread-local countdown at it (NULL for no budget); a header can
+# define CHECK_BUDGET(p) as 0 to leave it out.
+BUDGET_DECLARATIONS = """\
+#ifndef PEGEN_THREAD_LOCAL
+#ifdef _MSC_VER
+#define PEGEN_THREAD_LOCAL __declspec(thread)
+#else
+#define PEGEN_THREAD_LOCAL _Thread_local
+#endif
+#endif
+#ifndef CHECK_BUDGET
+extern PEGEN_THREAD_LOCAL Py_ssize_t *_PyPegen_budget_countdown;
+int _PyPegen_check_budget(Parser *p);
+#define CHECK_BUDGET(p) \\
+    (_PyPegen_budget_countdown != NULL && --*_PyPegen_budget_countdown < 0 && \\
+     _PyPegen_check_budget(p))
+#endif
+"""
+
+
+# The type of the next token, for the FIRST set switches and the inlined
+# token lookaheads; -1 if it can't be read.
+PEEK_TOKEN_TYPE = """\
+static inline int
+peek_token_type(Parser *p)
+{
+    if (p->mark == p->fill && _PyPegen_fill_token(p) < 0) {
+        p->error_indicator = 1;
+        return -1;
+    }
+    return p->tokens[p->mark]->type;
+}
+"""
+
+
+# Alternatives that need an invalid_ rule, which is only there for a
+# better error message, check CALL_INVALID_RULES(p) in parsers generated
+# with two passes.  The trailer runs the start rule as
+#
+#     begin_first_pass(p);
+#     do {
+#         result = start_rule(p);
+#     } while (begin_second_pass(p, result));
+#
+# The first pass goes without invalid_ rules; the second pass only
+# happens if the first fails without an error.  Like CPython's own second
+# pass, it drops the memo entries of the first, which are allocated from
+# p->arena and freed with it.  The Parser struct of CPython 3.9 has no
+# field for the pass, so the Parser in its second pass is kept in a
+# thread-local variable.  A parse started from an action (f-strings are
+# parsed that way) has a Parser of its own, so it's in its first pass
+# unless it fails, which fails the enclosing parse too.
+TWO_PASS_FUNCTIONS = """\
+static PEGEN_THREAD_LOCAL Parser *second_pass_parser = NULL;
+
+#define CALL_INVALID_RULES(p) ((p) == second_pass_parser)
+
+static inline void
+begin_first_pass(Parser *p)
+{
+    UNUSED(p);  // A new Parser starts in its first pass.
+}
+
+static inline int
+begin_second_pass(Parser *p, void *result)
+{
+    if (result != NULL || CALL_INVALID_RULES(p) || p->error_indicator || PyErr_Occurred()) {
+        if (CALL_INVALID_RULES(p)) {
+            second_pass_parser = NULL;
+        }
+        return 0;
+    }
+    // The memo entries of the first pass don't hold for the second.
+    for (int i = 0; i < p->fill; i++) {
+        p->tokens[i]->memo = NULL;
+    }
+    p->mark = 0;
+    second_pass_parser = p;
+    return 1;
+}
+"""
+
+
+# The same functions for parsers generated with a single pass.
+ONE_PASS_FUNCTIONS = """\
+static inline void
+begin_first_pass(Parser *p)
+{
+    UNUSED(p);
+}
+
+static inline int
+begin_second_pass(Parser *p, void *result)
+{
+    UNUSED(p);
+    UNUSED(result);
+    return 0;
+}
+"""
+
+
 EXTENSION_SUFFIX = """
 void *
 _PyPegen_parse(Parser *p)
@@ -47,7 +150,12 @@ _PyPegen_parse(Parser *p)
     p->keywords = reserved_keywords;
     p->n_keyword_lists = n_keyword_lists;
 
-    return start_rule(p);
+    void *result;
+    begin_first_pass(p);
+    do {
+        result = start_rule(p);
+    } while (begin_second_pass(p, result));
+    return result;
 }
 """
 
@@ -229,11 +337,22 @@ class CCallMakerVisitor(GrammarVisitor):
 
     def lookahead_call_helper(self, node: Lookahead, positive: int) -> FunctionCall:
         call = self.generate_call(node.node)
-        if call.nodetype == NodeTypes.NAME_TOKEN:
+        if call.nodetype in {
+            NodeTypes.NAME_TOKEN,
+            NodeTypes.NUMBER_TOKEN,
+            NodeTypes.STRING_TOKEN,
+            NodeTypes.GENERIC_TOKEN,
+            NodeTypes.KEYWORD,
+        }:
+            # Only the type matters, so look at it without calling anything.
+            if call.nodetype in BASE_NODETYPES.values() and isinstance(node.node, NameLeaf):
+                type = node.node.value
+            else:
+                type = call.arguments[1]
             return FunctionCall(
-                function=f"_PyPegen_lookahead_with_name",
-                arguments=[positive, call.function, *call.arguments],
+                function=f"(peek_token_type(p) {'==' if positive else '!='} {type})",
                 return_type="int",
+                comment=f"token={node.node}",
             )
         elif call.nodetype == NodeTypes.SOFT_KEYWORD:
             return FunctionCall(
@@ -241,13 +360,6 @@ class CCallMakerVisitor(GrammarVisitor):
                 arguments=[positive, call.function, *call.arguments],
                 return_type="int",
             )
-        elif call.nodetype in {NodeTypes.GENERIC_TOKEN, NodeTypes.KEYWORD}:
-            return FunctionCall(
-                function=f"_PyPegen_lookahead_with_int",
-                arguments=[positive, call.function, *call.arguments],
-                return_type="int",
-                comment=f"token={node.node}",
-            )
         else:
             return FunctionCall(
                 function=f"_PyPegen_lookahead",
@@ -335,14 +447,26 @@ class CParserGenerator(ParserGenerator, GrammarVisitor):
         file: Optional[IO[Text]],
         debug: bool = False,
         skip_actions: bool = False,
+        left_rec_loops: bool = True,
+        first_set_guards: bool = True,
+        ll1_rules: bool = True,
+        two_pass: bool = False,
     ):
-        super().__init__(grammar, tokens, file)
+        super().__init__(grammar, tokens, file, left_rec_loops=left_rec_loops, ll1_rules=ll1_rules)
         self.callmakervisitor: CCallMakerVisitor = CCallMakerVisitor(
             self, exact_tokens, non_exact_tokens
         )
         self._varname_counter = 0
         self.debug = debug
         self.skip_actions = skip_actions
+        self.success_label = "done"  # Where an alternative that matched goes
+        self.seed_item: Optional[NamedItem] = None  # Left-recursive call in a tail
+        self.first_set_guards = first_set_guards
+        self.two_pass = two_pass  # Skip invalid_ rules until a first pass fails
+        self.predictive = False  # Emitting an LL(1) rule predictively
+        # Mask variable and bit of the alternatives _print_first_token_switch()
+        # guards, by id().
+        self.alt_guards: Dict[int, Tuple[str, int]] = {}
 
     def add_level(self) -> None:
         self.print("D(p->level++);")
@@ -405,6 +529,9 @@ class CParserGenerator(ParserGenerator, GrammarVisitor):
         subheader = self.grammar.metas.get("subheader", "")
         if subheader:
             self.print(subheader)
+        self.print(BUDGET_DECLARATIONS)
+        self.print(PEEK_TOKEN_TYPE)
+        self.print(TWO_PASS_FUNCTIONS if self.two_pass else ONE_PASS_FUNCTIONS)
         self._setup_keywords()
         for i, (rulename, rule) in enumerate(self.todo.items(), 1000):
             comment = "  // Left-recursive" if rule.left_recursive else ""
@@ -497,6 +624,13 @@ class CParserGenerator(ParserGenerator, GrammarVisitor):
             self.add_return("NULL")
         self.print("}")
 
+    def _check_budget(self) -> None:
+        self.print("if (CHECK_BUDGET(p)) {")
+        with self.indent():
+            self.print("p->error_indicator = 1;")
+            self.add_return("NULL")
+        self.print("}")
+
     def _set_up_rule_memoization(self, node: Rule, result_type: str) -> None:
         self.print("{")
         with self.indent():
@@ -527,15 +661,109 @@ class CParserGenerator(ParserGenerator, GrammarVisitor):
         self.print(f"static {result_type}")
         self.print(f"{node.name}_raw(Parser *p)")
 
+    def _token_type(self, terminal: str) -> Optional[str]:
+        # The C token type of a terminal in a FIRST set, if it has one.
+        if terminal in self.callmakervisitor.non_exact_tokens:
+            return terminal
+        if terminal[0] not in "'\"":
+            return None  # A helper rule
+        val = ast.literal_eval(terminal)
+        if re.match(r"[a-zA-Z_]\w*\Z", val):
+            if terminal.endswith('"'):
+                return "NAME"  # Soft keywords are names to the tokenizer.
+            keyword_type = self.callmakervisitor.keyword_cache.get(val)
+            return None if keyword_type is None else str(keyword_type)
+        exact_type = self.callmakervisitor.exact_tokens.get(val)
+        return None if exact_type is None else str(exact_type)
+
+    def first_token_types(self, items: Sequence[NamedItem]) -> Optional[Dict[str, str]]:
+        """Return the token types items can start with, mapped to a terminal of each.
+
+        Return None if they aren't known, as when items can match the
+        empty string.
+        """
+        if not self.first_set_guards:
+            return None
+        first = self.first_sets.first_set(items)
+        if not first or "" in first:
+            return None
+        types: Dict[str, str] = {}
+        for terminal in sorted(first):
+            type = self._token_type(terminal)
+            if type is None:
+                return None
+            types.setdefault(type, terminal)
+        return types
+
+    def _print_first_token_switch(
+        self, alts: Sequence[Alt], var: str, is_tail: bool = False
+    ) -> None:
+        # Switch on the next token's type to set var to a mask of the
+        # alternatives that can start with it, and have visit_Alt() skip
+        # the others.  Up to 32 alternatives get a bit.
+        always = 0
+        masks: Dict[str, int] = {}
+        terminals: Dict[str, str] = {}
+        for i, alt in enumerate(alts[:32]):
+            types = self.first_token_types(alt.items[is_tail:])
+            if types is None:
+                always |= 1 << i
+                continue
+            self.alt_guards[id(alt)] = var, 1 << i
+            for type, terminal in types.items():
+                masks[type] = masks.get(type, 0) | 1 << i
+                terminals.setdefault(type, terminal)
+        if not masks:
+            return
+        cases: Dict[int, List[str]] = {}
+        for type in sorted(masks):
+            cases.setdefault(masks[type] | always, []).append(type)
+        self.print(f"unsigned int {var};")
+        self.print("switch (peek_token_type(p)) {")
+        with self.indent():
+            for mask, case_types in cases.items():
+                for type in case_types:
+                    comment = f"  // {terminals[type]}" if type.isdigit() else ""
+                    self.print(f"case {type}:{comment}")
+                with self.indent():
+                    self.print(f"{var} = {mask:#x};")
+                    self.print("break;")
+            self.print("default:")
+            with self.indent():
+                self.print(f"{var} = {always:#x};")
+        self.print("}")
+
+    def _print_predictive_switch(self, alts: Sequence[Alt], rulename: str) -> None:
+        # Switch on the next token's type straight to the only alternative
+        # of an LL(1) rule that can start with it.
+        self.print("switch (peek_token_type(p)) {")
+        with self.indent():
+            for alt in alts:
+                types = self.first_token_types(alt.items)
+                assert types is not None
+                for type in sorted(types):
+                    comment = f"  // {types[type]}" if type.isdigit() else ""
+                    self.print(f"case {type}:{comment}")
+                with self.indent():
+                    self.predictive = True
+                    self.visit(alt, is_loop=False, is_gather=False, rulename=rulename)
+                    self.predictive = False
+                    self.print("break;")
+        self.print("}")
+
     def _should_memoize(self, node: Rule) -> bool:
+        if node.left_rec_loop:
+            return True  # Like the other left-recursive rules
         return node.memo and not node.left_recursive
 
     def _handle_default_rule_body(self, node: Rule, rhs: Rhs, result_type: str) -> None:
         memoize = self._should_memoize(node)
+        predictive = node.ll1 and all(self.first_token_types(alt.items) for alt in rhs.alts)
 
         with self.indent():
             self.add_level()
             self._check_for_errors()
+            self._check_budget()
             self.print(f"{result_type} _res = NULL;")
             if memoize:
                 self.print(f"if (_PyPegen_is_memoized(p, {node.name}_type, &_res)) {{")
@@ -543,14 +771,20 @@ class CParserGenerator(ParserGenerator, GrammarVisitor):
                     self.add_return("_res")
                 self.print("}")
             self.print("int _mark = p->mark;")
+            if predictive and not memoize and all(len(alt.items) == 1 for alt in rhs.alts):
+                self.print("UNUSED(_mark); // Only used by D() when nothing needs resetting")
             if any(alt.action and "EXTRA" in alt.action for alt in rhs.alts):
                 self._set_up_token_start_metadata_extraction()
-            self.visit(
-                rhs,
-                is_loop=False,
-                is_gather=node.is_gather(),
-                rulename=node.name,
-            )
+            if predictive:
+                self._print_predictive_switch(rhs.alts, node.name)
+            else:
+                self._print_first_token_switch(rhs.alts, "_alts")
+                self.visit(
+                    rhs,
+                    is_loop=False,
+                    is_gather=node.is_gather(),
+                    rulename=node.name,
+                )
             if self.debug:
                 self.print(f'D(fprintf(stderr, "Fail at %d: {node.name}\\n", p->mark));')
             self.print("_res = NULL;")
@@ -560,6 +794,53 @@ class CParserGenerator(ParserGenerator, GrammarVisitor):
                 self.print(f"_PyPegen_insert_memo(p, _mark, {node.name}_type, _res);")
             self.add_return("_res")
 
+    def _handle_left_rec_loop_body(self, node: Rule, rhs: Rhs, result_type: str) -> None:
+        # Match a seed, then add tails to it for as long as one matches and
+        # gets further, stopping like _set_up_rule_memoization() does.  _mark
+        # is the end of the last seed.
+        tails = left_rec_tails(node)
+
+        with self.indent():
+            self.add_level()
+            self._check_for_errors()
+            self._check_budget()
+            self.print(f"{result_type} _res = NULL;")
+            self.print(f"if (_PyPegen_is_memoized(p, {node.name}_type, &_res)) {{")
+            with self.indent():
+                self.add_return("_res")
+            self.print("}")
+            self.print("int _mark = p->mark;")
+            self.print("int _start_mark = p->mark;")
+            self.print(f"{result_type} _seed = NULL;")
+            if any(alt.action and "EXTRA" in alt.action for alt in rhs.alts):
+                self._set_up_token_start_metadata_extraction()
+            self.success_label = "grow"
+            self._print_first_token_switch(rhs.alts[len(tails) :], "_alts")
+            for alt in rhs.alts[len(tails) :]:
+                self.visit(alt, is_loop=False, is_gather=False, rulename=node.name)
+            self.print("_res = NULL;")
+        self.print("  grow:")
+        with self.indent():
+            self.print("if (_res == NULL || p->mark <= _mark) {")
+            with self.indent():
+                self.print("p->mark = _mark;")
+                self.print("_res = _seed;")
+                self.print("goto done;")
+            self.print("}")
+            self.print("_seed = _res;")
+            self.print("_mark = p->mark;")
+            self._print_first_token_switch(tails, "_tail_alts", is_tail=True)
+            for alt in tails:
+                self.seed_item = alt.items[0]
+                self.visit(alt, is_loop=False, is_gather=False, rulename=node.name)
+            self.seed_item = None
+            self.success_label = "done"
+            self.print("_res = _seed;")
+        self.print("  done:")
+        with self.indent():
+            self.print(f"_PyPegen_insert_memo(p, _start_mark, {node.name}_type, _res);")
+            self.add_return("_res")
+
     def _handle_loop_rule_body(self, node: Rule, rhs: Rhs) -> None:
         memoize = self._should_memoize(node)
         is_repeat1 = node.name.startswith("_loop1")
@@ -567,6 +848,7 @@ class CParserGenerator(ParserGenerator, GrammarVisitor):
         with self.indent():
             self.add_level()
             self._check_for_errors()
+            self._check_budget()
             self.print("void *_res = NULL;")
             if memoize:
                 self.print(f"if (_PyPegen_is_memoized(p, {node.name}_type, &_res)) {{")
@@ -614,18 +896,21 @@ class CParserGenerator(ParserGenerator, GrammarVisitor):
 
         for line in str(node).splitlines():
             self.print(f"// {line}")
-        if node.left_recursive and node.leader:
+        grows_seed = node.left_recursive and node.leader and not node.left_rec_loop
+        if grows_seed:
             self.print(f"static {result_type} {node.name}_raw(Parser *);")
 
         self.print(f"static {result_type}")
         self.print(f"{node.name}_rule(Parser *p)")
 
-        if node.left_recursive and node.leader:
+        if grows_seed:
             self._set_up_rule_memoization(node, result_type)
 
         self.print("{")
         if is_loop:
             self._handle_loop_rule_body(node, rhs)
+        elif node.left_rec_loop:
+            self._handle_left_rec_loop_body(node, rhs, result_type)
         else:
             self._handle_default_rule_body(node, rhs, result_type)
         self.print("}")
@@ -634,6 +919,9 @@ class CParserGenerator(ParserGenerator, GrammarVisitor):
         call = self.callmakervisitor.generate_call(node)
         if call.assigned_variable:
             call.assigned_variable = self.dedupe(call.assigned_variable)
+        if node is self.seed_item:
+            call.function = "_seed"
+            call.arguments = []
         self.print(call)
 
     def visit_Rhs(
@@ -718,7 +1006,7 @@ class CParserGenerator(ParserGenerator, GrammarVisitor):
                 self.emit_default_action(is_gather, node)
 
             # As the current option has parsed correctly, do not continue with the rest.
-            self.print(f"goto done;")
+            self.print(f"goto {self.success_label};")
         self.print("}")
 
     def handle_alt_loop(self, node: Alt, is_gather: bool, rulename: Optional[str]) -> None:
@@ -755,7 +1043,18 @@ class CParserGenerator(ParserGenerator, GrammarVisitor):
     def visit_Alt(
         self, node: Alt, is_loop: bool, is_gather: bool, rulename: Optional[str]
     ) -> None:
-        self.print(f"{{ // {node}")
+        guards = []
+        if id(node) in self.alt_guards:
+            var, bit = self.alt_guards.pop(id(node))
+            guards.append(f"{var} & {bit:#x}")
+        if self.two_pass and not is_loop and not is_gather and uses_invalid_rule(node):
+            guards.append("CALL_INVALID_RULES(p)")
+        if len(guards) > 1:
+            self.print(f"if (({guards[0]}) && {guards[1]}) {{ // {node}")
+        elif guards:
+            self.print(f"if ({guards[0]}) {{ // {node}")
+        else:
+            self.print(f"{{ // {node}")
         with self.indent():
             self._check_for_errors()
             node_str = str(node).replace('"', '\\"')
@@ -781,7 +1080,8 @@ class CParserGenerator(ParserGenerator, GrammarVisitor):
                 else:
                     self.handle_alt_normal(node, is_gather, rulename)
 
-            self.print("p->mark = _mark;")
+            if not self.predictive or len(node.items) > 1:
+                self.print("p->mark = _mark;")  # A single item doesn't move on failure.
             node_str = str(node).replace('"', '\\"')
             self.print(
                 f"D(fprintf(stderr, \"%*c%s {rulename}[%d-%d]: %s failed!\\n\", p->level, ' ',\n"
@@ -3,9 +3,8 @@
 import argparse
 import pprint
 import sys
-from typing import Set, Dict
+from typing import Any, Dict, Sequence, Set
 
-from pegen.build import build_parser
 from pegen.grammar import (
     Alt,
     Cut,
@@ -36,44 +35,105 @@ argparser.add_argument("grammar_file", help="The grammar file")
 
 
 class FirstSetCalculator(GrammarVisitor):
+    """Calculate the FIRST sets of the rules of a grammar.
+
+    The FIRST set of a rule holds the terminals a match of it can start
+    with: token names like NAME, and literals like "'+'" (quotes and
+    all).  It also holds "" if the rule can match the empty string.
+
+    Both the sets and the rules' nullability are computed as fixed
+    points, so rules in left-recursive cycles get complete sets.  The
+    sets are sound for ruling out alternatives by the current token: a
+    negative lookahead only takes terminals out when it's a single
+    token tested before anything is consumed.
+    """
+
     def __init__(self, rules: Dict[str, Rule]) -> None:
         self.rules = rules
-        for rule in rules.values():
-            rule.nullable_visit(rules)
-        self.first_sets: Dict[str, Set[str]] = dict()
-        self.in_process: Set[str] = set()
+        self.nullables: Set[str] = set()
+        self.first_sets: Dict[str, Set[str]] = {name: set() for name in rules}
+        self.calculated = False
+        changed = True
+        while changed:
+            changed = False
+            for name, rule in rules.items():
+                if name not in self.nullables and self.is_nullable(rule.rhs):
+                    self.nullables.add(name)
+                    changed = True
 
     def calculate(self) -> Dict[str, Set[str]]:
-        for name, rule in self.rules.items():
-            self.visit(rule)
+        if not self.calculated:
+            changed = True
+            while changed:
+                changed = False
+                for name, rule in self.rules.items():
+                    terminals = self.visit(rule.rhs)
+                    if name in self.nullables:
+                        terminals.add("")
+                    if terminals != self.first_sets[name]:
+                        self.first_sets[name] = terminals
+                        changed = True
+            self.calculated = True
         return self.first_sets
 
-    def visit_Alt(self, item: Alt) -> Set[str]:
+    def first_set(self, items: Sequence[NamedItem]) -> Set[str]:
+        """Return the FIRST set of a sequence of items, like an alternative's."""
+        self.calculate()
+        result = self.items_first_set(items)
+        if all(self.is_nullable(item) for item in items):
+            result.add("")
+        return result
+
+    def is_nullable(self, node: Any) -> bool:
+        """Can node match the empty string (as far as is known so far)?"""
+        if isinstance(node, NamedItem):
+            return self.is_nullable(node.item)
+        if isinstance(node, NameLeaf):
+            return node.value in self.nullables
+        if isinstance(node, (Opt, Repeat0, Lookahead, Cut)):
+            return True
+        if isinstance(node, (Repeat1, Gather)):
+            return self.is_nullable(node.node)
+        if isinstance(node, Group):
+            return self.is_nullable(node.rhs)
+        if isinstance(node, Rhs):
+            return any(self.is_nullable(alt) for alt in node.alts)
+        if isinstance(node, Alt):
+            return all(self.is_nullable(item) for item in node.items)
+        return False
+
+    def is_token(self, node: Any) -> bool:
+        return isinstance(node, StringLeaf) or (
+            isinstance(node, NameLeaf) and node.value not in self.rules
+        )
+
+    def items_first_set(self, items: Sequence[NamedItem]) -> Set[str]:
         result: Set[str] = set()
         to_remove: Set[str] = set()
-        for other in item.items:
-            new_terminals = self.visit(other)
-            if isinstance(other.item, NegativeLookahead):
-                to_remove |= new_terminals
-            result |= new_terminals
-            if to_remove:
-                result -= to_remove
-
-            # If the set of new terminals can start with the empty string,
-            # it means that the item is completelly nullable and we should
-            # also considering at least the next item in case the current
-            # one fails to parse.
-
-            if "" in new_terminals:
+        consumed = False  # May an item before this one have consumed a token?
+        for item in items:
+            node = item.item
+            if isinstance(node, NegativeLookahead):
+                # It can only rule out the current token if it's tested on it.
+                if not consumed and self.is_token(node.node):
+                    to_remove |= self.visit(node.node)
                 continue
-
-            if not isinstance(other.item, (Opt, NegativeLookahead, Repeat0)):
+            result |= self.visit(item)
+            if isinstance(node, PositiveLookahead):
+                # What follows starts with the same token.
+                if not self.is_nullable(node.node):
+                    break
+                continue
+            if not self.is_nullable(item):
                 break
-
+            if not isinstance(node, Cut):
+                consumed = True
         # Do not allow the empty string to propagate.
         result.discard("")
+        return result - to_remove
 
-        return result
+    def visit_Alt(self, item: Alt) -> Set[str]:
+        return self.items_first_set(item.items)
 
     def visit_Cut(self, item: Cut) -> Set[str]:
         return set()
@@ -85,7 +145,7 @@ class FirstSetCalculator(GrammarVisitor):
         return self.visit(item.node)
 
     def visit_NegativeLookahead(self, item: NegativeLookahead) -> Set[str]:
-        return self.visit(item.node)
+        return set()
 
     def visit_NamedItem(self, item: NamedItem) -> Set[str]:
         return self.visit(item.item)
@@ -105,14 +165,7 @@ class FirstSetCalculator(GrammarVisitor):
     def visit_NameLeaf(self, item: NameLeaf) -> Set[str]:
         if item.value not in self.rules:
             return {item.value}
-
-        if item.value not in self.first_sets:
-            self.first_sets[item.value] = self.visit(self.rules[item.value])
-            return self.first_sets[item.value]
-        elif item.value in self.in_process:
-            return set()
-
-        return self.first_sets[item.value]
+        return set(self.first_sets[item.value])
 
     def visit_StringLeaf(self, item: StringLeaf) -> Set[str]:
         return {item.value}
@@ -124,19 +177,12 @@ class FirstSetCalculator(GrammarVisitor):
         return result
 
     def visit_Rule(self, item: Rule) -> Set[str]:
-        if item.name in self.in_process:
-            return set()
-        elif item.name not in self.first_sets:
-            self.in_process.add(item.name)
-            terminals = self.visit(item.rhs)
-            if item.nullable:
-                terminals.add("")
-            self.first_sets[item.name] = terminals
-            self.in_process.remove(item.name)
-        return self.first_sets[item.name]
+        return self.calculate()[item.name]
 
 
 def main() -> None:
+    from pegen.build import build_parser  # Not at the top; it imports the generators.
+
     args = argparser.parse_args()
 
     try:
@@ -77,6 +77,8 @@ class Rule:
         self.nullable = False
         self.left_recursive = False
         self.leader = False
+        self.left_rec_loop = False  # Parsed by a loop instead of seed growing
+        self.ll1 = False  # The next token picks the only alternative to try
         rhs.set_rule_name(name)
 
     def is_loop(self) -> bool:
@@ -7,7 +7,7 @@ import tokenize
 
 from typing import Any, List, Optional, Set, Tuple
 
-from pegen.parser import memoize, memoize_left_rec, logger, Parser
+from pegen.parser import memoize, memoize_left_rec, memoize_involved, logger, Parser
 
 # TODO: Replace List[Any] with List[NodeType] once recursive type alias are in
 NodeType = Tuple[str, int, List[Any]]
@@ -42,7 +42,7 @@ from pegen.grammar import (
 
 class GeneratedParser(Parser):
 
-    @memoize
+    @logger
     def start(self) -> Optional[Grammar]:
         # start: grammar $
         mark = self.mark()
@@ -57,7 +57,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def grammar(self) -> Optional[Grammar]:
         # grammar: metas rules | rules
         mark = self.mark()
@@ -79,7 +79,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def metas(self) -> Optional[MetaList]:
         # metas: meta metas | meta
         mark = self.mark()
@@ -101,7 +101,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def meta(self) -> Optional[MetaTuple]:
         # meta: "@" NAME NEWLINE | "@" NAME NAME NEWLINE | "@" NAME STRING NEWLINE
         mark = self.mark()
@@ -144,7 +144,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def rules(self) -> Optional[RuleList]:
         # rules: rule rules | rule
         mark = self.mark()
@@ -166,7 +166,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def rule(self) -> Optional[Rule]:
         # rule: rulename memoflag? ":" alts NEWLINE INDENT more_alts DEDENT | rulename memoflag? ":" NEWLINE INDENT more_alts DEDENT | rulename memoflag? ":" alts NEWLINE
         mark = self.mark()
@@ -227,7 +227,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @memoize(10)
     def rulename(self) -> Optional[RuleName]:
         # rulename: NAME '[' NAME '*' ']' | NAME '[' NAME ']' | NAME
         mark = self.mark()
@@ -268,7 +268,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def memoflag(self) -> Optional[str]:
         # memoflag: '(' 'memo' ')'
         mark = self.mark()
@@ -285,7 +285,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @memoize(11)
     def alts(self) -> Optional[Rhs]:
         # alts: alt "|" alts | alt
         mark = self.mark()
@@ -309,7 +309,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def more_alts(self) -> Optional[Rhs]:
         # more_alts: "|" alts NEWLINE more_alts | "|" alts NEWLINE
         mark = self.mark()
@@ -339,7 +339,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def alt(self) -> Optional[Alt]:
         # alt: items '$' action | items '$' | items action | items
         mark = self.mark()
@@ -381,7 +381,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @memoize(12)
     def items(self) -> Optional[NamedItemList]:
         # items: named_item items | named_item
         mark = self.mark()
@@ -403,7 +403,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def named_item(self) -> Optional[NamedItem]:
         # named_item: NAME '[' NAME '*' ']' '=' ~ item | NAME '[' NAME ']' '=' ~ item | NAME '=' ~ item | item | lookahead
         mark = self.mark()
@@ -476,7 +476,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def lookahead(self) -> Optional[LookaheadOrCut]:
         # lookahead: '&' ~ atom | '!' ~ atom | '~'
         mark = self.mark()
@@ -511,7 +511,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def item(self) -> Optional[Item]:
         # item: '[' ~ alts ']' | atom '?' | atom '*' | atom '+' | atom '.' atom '+' | atom
         mark = self.mark()
@@ -577,7 +577,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def atom(self) -> Optional[Plain]:
         # atom: '(' ~ alts ')' | NAME | STRING
         mark = self.mark()
@@ -610,7 +610,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def action(self) -> Optional[str]:
         # action: "{" ~ target_atoms "}"
         mark = self.mark()
@@ -629,7 +629,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @memoize(13)
     def target_atoms(self) -> Optional[str]:
         # target_atoms: target_atom target_atoms | target_atom
         mark = self.mark()
@@ -651,7 +651,7 @@ class GeneratedParser(Parser):
         if cut: return None
         return None
 
-    @memoize
+    @logger
     def target_atom(self) -> Optional[str]:
         # target_atom: "{" ~ target_atoms "}" | NAME | NUMBER | STRING | "?" | ":" | !"}" OP
         mark = self.mark()
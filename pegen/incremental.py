@@ -0,0 +1,259 @@
+"""Reparse an edited buffer, reusing the tokens and memo entries outside the edit.
+
+Usage:
+
+    inc = IncrementalParser(GeneratedParser, text)
+    tree = inc.parse()
+    tree = inc.edit((3, 4), (3, 7), "spam")  # Replace columns 4-7 of line 3
+
+Positions are (row, column) pairs like those of tokenize: rows start
+at 1, columns at 0.
+"""
+
+import itertools
+import token
+import tokenize
+from typing import Any, Dict, Iterator, List, Tuple, Type
+
+from pegen.parser import FastParser, MemoEntry, Parser
+from pegen.tokenizer import Mark, Tokenizer
+
+Position = Tuple[int, int]
+
+
+def read_tokens(lines: Iterator[str]) -> Iterator[tokenize.TokenInfo]:
+    """Yield the tokens of lines that Tokenizer would pass on to a parser."""
+    tokenizer = Tokenizer(tokenize.generate_tokens(lambda: next(lines, "")))
+    while True:
+        try:
+            tokenizer.fetch()
+        except StopIteration:
+            return
+        tok = tokenizer._tokens.pop()
+        yield tok
+        if tok.type == token.ENDMARKER:
+            return
+
+
+def paren_level(tok: tokenize.TokenInfo) -> int:
+    """Return how tok changes the bracket nesting level tokenize keeps track of."""
+    if tok.type == token.OP:
+        if tok.string in "([{":
+            return 1
+        if tok.string in ")]}":
+            return -1
+    return 0
+
+
+def shift_token(tok: tokenize.TokenInfo, rows: int) -> tokenize.TokenInfo:
+    if tok.start[0] == 0:
+        return tok  # Made up by Tokenizer.fix_token_error()
+    start, end = tok.start, tok.end
+    return tok._replace(start=(start[0] + rows, start[1]), end=(end[0] + rows, end[1]))
+
+
+class IncrementalParser:
+    """Parse a buffer, then reparse it after each edit.
+
+    An edit re-tokenizes from the start of the logical line containing
+    it until the new tokens are back in sync with the old ones (at a
+    NEWLINE after the edit, with the same indentation stack); the
+    tokens after that are reused, with their rows shifted if the edit
+    added or removed lines.
+
+    tokenize lets the bracket nesting level go negative when a closing
+    bracket has no opening one, which changes how it tokenizes all the
+    following lines; while that's the case every edit re-tokenizes the
+    whole buffer.
+
+    The memo entries that didn't look at the re-tokenized tokens are
+    kept.  Those after them are only kept (with their positions
+    shifted) when the edit doesn't change the number of lines, since
+    their trees hold tokens with the old rows.  FastParser subclasses
+    don't record how far ahead a memo entry looked, so with those no
+    memo entries are reused.
+    """
+
+    def __init__(self, parser_class: Type[Parser], text: str, *, rule: str = "start"):
+        self.parser_class = parser_class
+        self.rule = rule
+        self.lines = text.splitlines(keepends=True)
+        self.tokens = list(read_tokens(iter(self.lines)))
+        self.unbalanced = False  # Whether some closing bracket has no opening one
+        level = 0
+        for tok in self.tokens:
+            level += paren_level(tok)
+            if level < 0:
+                self.unbalanced = True
+                break
+        self.parser = self.make_parser({}, {}, {})
+        # Range of token positions re-tokenized by the last edit.
+        self.damage: Tuple[Mark, Mark] = (0, len(self.tokens))
+
+    @property
+    def text(self) -> str:
+        return "".join(self.lines)
+
+    def make_parser(
+        self,
+        memo: Dict[Mark, Dict[Any, MemoEntry]],
+        failures: Dict[Mark, int],
+        failure_bits: Dict[Any, int],
+    ) -> Parser:
+        tokenizer = Tokenizer(iter(()))
+        tokenizer._tokens = self.tokens
+        parser = self.parser_class(tokenizer)
+        parser._memo = memo
+        parser._failures = failures
+        parser._failure_bits = failure_bits
+        return parser
+
+    def parse(self) -> Any:
+        """Parse the current text; return the tree, or None for a syntax error.
+
+        Use self.parser.make_syntax_error() to find out where it is.
+        """
+        self.parser.reset(0)
+        return self.parser.parse_rule(self.rule)
+
+    def edit(self, start: Position, end: Position, text: str) -> Any:
+        """Replace the text from start up to end with text, then parse()."""
+        lines = self.lines
+        tokens = self.tokens
+        start_row, start_col = start
+        end_row, end_col = end
+        assert (1, 0) <= start <= end, (start, end)
+        old_count = len(lines[start_row - 1 : end_row])
+        head = lines[start_row - 1][:start_col] if start_row <= len(lines) else ""
+        tail = lines[end_row - 1][end_col:] if end_row <= len(lines) else ""
+        new_lines = (head + text + tail).splitlines(keepends=True)
+        if new_lines and not new_lines[-1].endswith(("\n", "\r")) and end_row < len(lines):
+            # The line break at the end of the range was deleted.
+            new_lines[-1] += lines[end_row]
+            old_count += 1
+        lines[start_row - 1 : start_row - 1 + old_count] = new_lines
+        line_delta = len(new_lines) - old_count
+        last_row = start_row + len(new_lines) - 1  # Last edited row in the new text
+
+        # Restart after the last NEWLINE before the edited rows, where
+        # the bracket nesting level is 0 unless the buffer is unbalanced.
+        begin = 0 if self.unbalanced else self.first_token_at(start_row)
+        while begin > 0 and not (
+            tokens[begin - 1].type == token.NEWLINE and tokens[begin - 1].start[0] < start_row
+        ):
+            begin -= 1
+        restart_row = tokens[begin - 1].start[0] + 1 if begin > 0 else 1
+        indents = self.indents_at(begin)
+
+        # Prefix lines recreating the indentation stack; each gives INDENT NAME NEWLINE.
+        prefix = [indent + "x\n" for indent in indents]
+        row_delta = restart_row - 1 - len(prefix)
+        source = itertools.chain(prefix, (lines[i] for i in range(restart_row - 1, len(lines))))
+        new_tokens = itertools.islice(read_tokens(source), 3 * len(prefix), None)
+
+        stack = list(indents)
+        old_stack = list(indents)
+        level = old_level = min_level = 0
+        old = begin
+        retokenized: List[tokenize.TokenInfo] = []
+        synced = False
+        for tok in new_tokens:
+            tok = shift_token(tok, row_delta)
+            retokenized.append(tok)
+            level += paren_level(tok)
+            min_level = min(min_level, level)
+            if tok.type == token.INDENT:
+                stack.append(tok.string)
+            elif tok.type == token.DEDENT:
+                stack.pop()
+            elif tok.type == token.NEWLINE and tok.start[0] >= last_row and not self.unbalanced:
+                # Find the old NEWLINE at the same place, if any.
+                row = tok.start[0] - line_delta
+                while old < len(tokens) and 0 < tokens[old].start[0] <= row:
+                    old_tok = tokens[old]
+                    old += 1
+                    old_level += paren_level(old_tok)
+                    if old_tok.type == token.INDENT:
+                        old_stack.append(old_tok.string)
+                    elif old_tok.type == token.DEDENT:
+                        old_stack.pop()
+                    elif old_tok.type == token.NEWLINE and old_tok.start[0] == row:
+                        # The lines after it are the same, so if tokenize
+                        # is in the same state the tokens will be too.
+                        synced = old_level == level and old_stack == stack
+                        break
+                if synced:
+                    break
+        stop = old if synced else len(tokens)
+        # The level was 0 at begin, and the old tokens after stop don't
+        # make it negative, or self.unbalanced would have been set.
+        self.unbalanced = min_level < 0
+        rest = tokens[stop:]
+        if line_delta:
+            rest = [shift_token(tok, line_delta) for tok in rest]
+        tokens[begin:] = retokenized + rest
+        self.damage = begin, begin + len(retokenized)
+
+        # Keep the memo entries before the damage that didn't look into it,
+        # and those after it if their trees are still right.
+        delta = len(retokenized) - (stop - begin)
+        memo: Dict[Mark, Dict[Any, MemoEntry]] = {}
+        failures: Dict[Mark, int] = {}
+        if not issubclass(self.parser_class, FastParser):
+            for mark, table in self.parser._memo.items():
+                if mark < begin:
+                    table = {key: entry for key, entry in table.items() if entry[2] <= begin}
+                    if table:
+                        memo[mark] = table
+                elif mark >= stop and not line_delta:
+                    if delta:
+                        table = {
+                            key: (entry[0], entry[1] + delta, entry[2] + delta)
+                            for key, entry in table.items()
+                        }
+                    memo[mark + delta] = table
+            # Failure bits have reach mark + 1.
+            for mark, bits in self.parser._failures.items():
+                if mark < begin:
+                    failures[mark] = bits
+                elif mark >= stop and not line_delta:
+                    failures[mark + delta] = bits
+        self.parser = self.make_parser(memo, failures, self.parser._failure_bits)
+        return self.parse()
+
+    def first_token_at(self, row: int) -> Mark:
+        """Return the position of the first token starting at or after row."""
+        tokens = self.tokens
+        lo, hi = 0, len(tokens)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            # Tokens made up by fix_token_error() at the end have row 0.
+            if 0 < tokens[mid].start[0] < row:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def indents_at(self, pos: Mark) -> List[str]:
+        """Return the indentation stack (INDENT strings, outermost first) at pos.
+
+        This only looks back as far as the start of the enclosing
+        top-level statement.
+        """
+        tokens = self.tokens
+        indents: List[str] = []
+        dedents = 0
+        while pos > 0:
+            pos -= 1
+            tok = tokens[pos]
+            if tok.type == token.DEDENT:
+                dedents += 1
+            elif tok.type == token.INDENT:
+                if dedents:
+                    dedents -= 1
+                else:
+                    indents.append(tok.string)
+            elif tok.start[1] == 0 and (pos == 0 or tokens[pos - 1].type == token.NEWLINE):
+                break  # A top-level statement starts here.
+        indents.reverse()
+        return indents
@@ -1,12 +1,29 @@
 import argparse
+import json
+import pprint
 import sys
+import threading
 import time
 import token
 import tokenize
 import traceback
 
 from abc import abstractmethod
-from typing import Any, Callable, cast, ClassVar, Dict, Optional, Set, Tuple, Type, TypeVar
+from typing import (
+    Any,
+    Callable,
+    cast,
+    ClassVar,
+    Dict,
+    IO,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    TypeVar,
+)
 
 from pegen.tokenizer import exact_token_types
 from pegen.tokenizer import Mark
@@ -14,13 +31,14 @@ from pegen.tokenizer import Tokenizer
 
 T = TypeVar("T")
 P = TypeVar("P", bound="Parser")
+FP = TypeVar("FP", bound="FastParser")
 F = TypeVar("F", bound=Callable[..., Any])
 
 
 def logger(method: F) -> F:
     """For non-memoized functions that we want to be logged.
 
-    (In practice this is only non-leader left-recursive functions.)
+    (In practice these are the rules that aren't memoized.)
     """
     method_name = method.__name__
 
@@ -40,142 +58,301 @@ def logger(method: F) -> F:
     return cast(F, logger_wrapper)
 
 
-def memoize(method: F) -> F:
-    """Memoize a symbol method."""
-    method_name = method.__name__
+def memoize(rule_id: int) -> Callable[[F], F]:
+    """Memoize a symbol method under the given rule ID.
 
-    def memoize_wrapper(self: P, *args: object) -> T:
-        mark = self.mark()
-        key = mark, method_name, args
-        # Fast path: cache hit, and not verbose.
-        if key in self._cache and not self._verbose:
-            tree, endmark, reach = self._cache[key]
-            self.reset(endmark)
-            self.update_reach(reach)
-            return tree
-        # Slow path: no cache hit, or verbose.
-        verbose = self._verbose
-        argsr = ",".join(repr(arg) for arg in args)
-        fill = "  " * self._level
-        if key not in self._cache:
-            if verbose:
-                print(f"{fill}{method_name}({argsr}) ... (looking at {self.showpeek()})")
-            self._level += 1
-            prior_reach = self.reset_reach(mark)
-            tree = method(self, *args)
-            reach = self.reset_reach(prior_reach)
-            self.update_reach(reach)
-            self._level -= 1
-            if verbose:
-                print(f"{fill}... {method_name}({argsr}) -> {tree!s:.200}")
-            endmark = self.mark()
-            self._cache[key] = tree, endmark, reach
-        else:
-            tree, endmark, reach = self._cache[key]
+    The memo is a dict of dicts: the outer dict is indexed by token
+    position, the inner one by rule ID (or by a (rule ID, args) tuple
+    for methods taking arguments, like expect()).  Failures that only
+    looked at the token at that position are not stored as entries but
+    as a bit in the int for that position in _failures; see
+    Parser.failure_bit().
+    """
+
+    def decorator(method: F) -> F:
+        method_name = method.__name__
+
+        def memoize_wrapper(self: P, *args: object) -> T:
+            mark = self.mark()
+            key = (rule_id, args) if args else rule_id
+            table = self._memo.get(mark)
+            if table is None:
+                table = self._memo[mark] = {}
+            entry = table.get(key)
+            if entry is None and mark in self._failures:
+                bit = self._failure_bits.get(key)
+                if bit is not None and self._failures[mark] >> bit & 1:
+                    entry = None, mark, mark + 1
+            # Fast path: cache hit, and not verbose.
+            if entry is not None and not self._verbose:
+                tree, endmark, reach = entry
+                self.reset(endmark)
+                self.update_reach(reach)
+                return tree
+            # Slow path: no cache hit, or verbose.
+            verbose = self._verbose
             if verbose:
-                print(f"{fill}{method_name}({argsr}) -> {tree!s:.200}")
-            self.reset(endmark)
-            self.update_reach(reach)
-        return tree
+                argsr = ",".join(repr(arg) for arg in args)
+                fill = "  " * self._level
+            if entry is None:
+                if verbose:
+                    print(f"{fill}{method_name}({argsr}) ... (looking at {self.showpeek()})")
+                self._level += 1
+                prior_reach = self.reset_reach(mark)
+                tree = method(self, *args)
+                reach = self.reset_reach(prior_reach)
+                self.update_reach(reach)
+                self._level -= 1
+                if verbose:
+                    print(f"{fill}... {method_name}({argsr}) -> {tree!s:.200}")
+                endmark = self.mark()
+                if tree is None and endmark == mark and reach == mark + 1:
+                    failures = self._failures
+                    bits = failures.get(mark)
+                    failures[mark] = (bits or 0) | 1 << self.failure_bit(key)
+                    # The reach index has one FAILURES key per position.
+                    if bits is None and self._reach_index is not None:
+                        self.index_reach(mark, FAILURES, reach)
+                else:
+                    table[key] = tree, endmark, reach
+                    if self._reach_index is not None:
+                        self.index_reach(mark, key, reach)
+            else:
+                tree, endmark, reach = entry
+                if verbose:
+                    print(f"{fill}{method_name}({argsr}) -> {tree!s:.200}")
+                self.reset(endmark)
+                self.update_reach(reach)
+            return tree
 
-    memoize_wrapper.__wrapped__ = method  # type: ignore
-    return cast(F, memoize_wrapper)
+        memoize_wrapper.__wrapped__ = method  # type: ignore
+        memoize_wrapper.rule_id = rule_id  # type: ignore
+        return cast(F, memoize_wrapper)
 
+    return decorator
 
-def memoize_left_rec(method: Callable[[P], Optional[T]]) -> Callable[[P], Optional[T]]:
-    """Memoize a left-recursive symbol method."""
-    method_name = method.__name__
 
-    def memoize_left_rec_wrapper(self: P) -> Optional[T]:
-        mark = self.mark()
-        key = mark, method_name, ()
-        # Fast path: cache hit, and not verbose.
-        if key in self._cache and not self._verbose:
-            tree, endmark, reach = self._cache[key]
-            self.reset(endmark)
-            self.update_reach(reach)
-            return tree
-        # Slow path: no cache hit, or verbose.
-        verbose = self._verbose
-        fill = "  " * self._level
-        if key not in self._cache:
-            if verbose:
-                print(f"{fill}{method_name} ... (looking at {self.showpeek()})")
-            self._level += 1
-
-            # For left-recursive rules we manipulate the cache and
-            # loop until the rule shows no progress, then pick the
-            # previous result.  For an explanation why this works, see
-            # https://github.com/PhilippeSigaud/Pegged/wiki/Left-Recursion
-            # (But we use the memoization cache instead of a static
-            # variable; perhaps this is similar to a paper by Warth et al.
-            # (http://web.cs.ucla.edu/~todd/research/pub.php?id=pepm08).
-
-            # Prime the cache with a failure.
-            self._cache[key] = None, mark, mark
-            lastresult, lastmark = None, mark
-            depth = 0
-            if verbose:
-                print(f"{fill}Recursive {method_name} at {mark} depth {depth}")
+def memoize_left_rec(
+    rule_id: int,
+) -> Callable[[Callable[[P], Optional[T]]], Callable[[P], Optional[T]]]:
+    """Memoize a left-recursive symbol method under the given rule ID."""
 
-            while True:
-                self.reset(mark)
-                prior_reach = self.reset_reach(mark)
-                result = method(self)
-                endmark = self.mark()
-                reach = self.reset_reach(prior_reach)
+    def decorator(method: Callable[[P], Optional[T]]) -> Callable[[P], Optional[T]]:
+        method_name = method.__name__
+
+        def memoize_left_rec_wrapper(self: P) -> Optional[T]:
+            mark = self.mark()
+            table = self._memo.get(mark)
+            if table is None:
+                table = self._memo[mark] = {}
+            # Fast path: cache hit, and not verbose.
+            if rule_id in table and not self._verbose:
+                tree, endmark, reach = table[rule_id]
+                self.reset(endmark)
                 self.update_reach(reach)
-                depth += 1
+                return tree
+            # Slow path: no cache hit, or verbose.
+            verbose = self._verbose
+            # Only build this when needed: at deep nesting it's long.
+            fill = "  " * self._level if verbose else ""
+            if rule_id not in table:
                 if verbose:
-                    print(
-                        f"{fill}Recursive {method_name} at {mark} depth {depth}: {result!s:.200} to {endmark}"
-                    )
-                if not result:
-                    if verbose:
-                        print(f"{fill}Fail with {lastresult!s:.200} to {lastmark}")
-                    break
-                if endmark <= lastmark:
+                    print(f"{fill}{method_name} ... (looking at {self.showpeek()})")
+                self._level += 1
+
+                # For left-recursive rules we manipulate the cache and
+                # loop until the rule shows no progress, then pick the
+                # previous result.  For an explanation why this works, see
+                # https://github.com/PhilippeSigaud/Pegged/wiki/Left-Recursion
+                # (But we use the memoization cache instead of a static
+                # variable; perhaps this is similar to a paper by Warth et al.
+                # (http://web.cs.ucla.edu/~todd/research/pub.php?id=pepm08).
+
+                # Prime the cache with a failure.
+                table[rule_id] = None, mark, mark
+                lastresult, lastmark = None, mark
+                depth = 0
+                if verbose:
+                    print(f"{fill}Recursive {method_name} at {mark} depth {depth}")
+                self._growing.append(mark)
+
+                while True:
+                    self._involved_memo = {}  # The seed changed; see memoize_involved().
+                    self.reset(mark)
+                    prior_reach = self.reset_reach(mark)
+                    result = method(self)
+                    endmark = self.mark()
+                    reach = self.reset_reach(prior_reach)
+                    self.update_reach(reach)
+                    depth += 1
                     if verbose:
-                        print(f"{fill}Bailing with {lastresult!s:.200} to {lastmark}")
-                    break
-                self._cache[key] = lastresult, lastmark, reach = result, endmark, reach
+                        print(
+                            f"{fill}Recursive {method_name} at {mark} depth {depth}: {result!s:.200} to {endmark}"
+                        )
+                    if not result:
+                        if verbose:
+                            print(f"{fill}Fail with {lastresult!s:.200} to {lastmark}")
+                        break
+                    if endmark <= lastmark:
+                        if verbose:
+                            print(f"{fill}Bailing with {lastresult!s:.200} to {lastmark}")
+                        break
+                    table[rule_id] = lastresult, lastmark, reach = result, endmark, reach
 
-            self.reset(lastmark)
-            self.update_reach(reach)
-            tree = lastresult
+                self._growing.pop()
+                self._involved_memo = {}
+                self.reset(lastmark)
+                self.update_reach(reach)
+                tree = lastresult
 
-            self._level -= 1
-            if verbose:
-                print(f"{fill}{method_name}() -> {tree!s:.200} [cached]")
-            if tree:
-                endmark = self.mark()
+                self._level -= 1
+                if verbose:
+                    print(f"{fill}{method_name}() -> {tree!s:.200} [cached]")
+                if tree:
+                    endmark = self.mark()
+                else:
+                    endmark = mark
+                    self.reset(endmark)
+                table[rule_id] = tree, endmark, reach
+                if self._reach_index is not None:
+                    self.index_reach(mark, rule_id, reach)
             else:
-                endmark = mark
-                self.reset(endmark)
-            self._cache[key] = tree, endmark, reach
-        else:
-            tree, endmark, reach = self._cache[key]
-            if verbose:
-                print(f"{fill}{method_name}() -> {tree!s:.200} [fresh]")
-            if tree:
+                tree, endmark, reach = table[rule_id]
+                if verbose:
+                    print(f"{fill}{method_name}() -> {tree!s:.200} [fresh]")
+                if tree:
+                    self.reset(endmark)
+            return tree
+
+        memoize_left_rec_wrapper.__wrapped__ = method  # type: ignore
+        return memoize_left_rec_wrapper
+
+    return decorator
+
+
+def memoize_involved(rule_id: int) -> Callable[[F], F]:
+    """Memoize a non-leader rule of a left-recursive cycle under the given rule ID.
+
+    Its results depend on the seeds of the leaders being grown by
+    memoize_left_rec(), so they go in a separate table, which is
+    replaced by an empty one whenever a seed changes.  Thus they are
+    only reused within one seed-growing iteration (or between two),
+    which is where the rule would otherwise be parsed again and again.
+    """
+
+    def decorator(method: F) -> F:
+        logged = logger(method)
+
+        def memoize_involved_wrapper(self: P, *args: object) -> T:
+            mark = self.mark()
+            key = mark, rule_id
+            memo = self._involved_memo
+            entry = memo.get(key)
+            if entry is not None:
+                tree, endmark, reach = entry
+                if self._verbose:
+                    fill = "  " * self._level
+                    print(f"{fill}{method.__name__}() -> {tree!s:.200} [involved]")
                 self.reset(endmark)
-        return tree
+                self.update_reach(reach)
+                return tree
+            prior_reach = self.reset_reach(mark)
+            tree = logged(self, *args)
+            reach = self.reset_reach(prior_reach)
+            self.update_reach(reach)
+            # Don't store a result that may have seen a seed before and after it changed.
+            if memo is self._involved_memo:
+                memo[key] = tree, self.mark(), reach
+            return tree
+
+        memoize_involved_wrapper.__wrapped__ = method  # type: ignore
+        return cast(F, memoize_involved_wrapper)
+
+    return decorator
+
+
+# Memo entries: (tree, endmark, reach); a FastParser leaves out the reach.
+MemoEntry = Tuple[Any, Mark, Mark]
+FastMemoEntry = Tuple[Any, Mark]
+
+# Reach index key of the failure bits (see Parser.failure_bit()).
+FAILURES = -1
+
+# Rule IDs of the token methods below.  Generated parsers number their
+# own rules starting at FIRST_RULE_ID.
+NAME_ID = 0
+NUMBER_ID = 1
+STRING_ID = 2
+OP_ID = 3
+EXPECT_ID = 4
+EXPECT_KEYWORD_ID = 5
+FIRST_RULE_ID = 10
+
+# Names of the token methods, which set_budget() wraps along with the rules.
+TOKEN_METHODS = ("name", "number", "string", "op", "expect", "expect_keyword")
+
+# Rule calls between clock readings when a parse has a deadline.
+BUDGET_CHECK_INTERVAL = 1024
+
+
+class ParseBudgetExceeded(Exception):
+    """Raised when a parse uses up its fuel or runs past its deadline.
+
+    reason is "fuel" or "deadline", and calls the number of rule calls
+    made.  lineno and offset locate the furthest token looked at; as
+    with SyntaxError, offset counts from 1.
+    """
 
-    memoize_left_rec_wrapper.__wrapped__ = method  # type: ignore
-    return memoize_left_rec_wrapper
+    def __init__(self, reason: str, calls: int, lineno: int, offset: int):
+        super().__init__(reason, calls, lineno, offset)
+        self.reason = reason
+        self.calls = calls
+        self.lineno = lineno
+        self.offset = offset
+
+    def __str__(self) -> str:
+        what = "ran out of fuel" if self.reason == "fuel" else "ran past its deadline"
+        return (
+            f"parse {what} after {self.calls} rule calls,"
+            f" having got to line {self.lineno}, column {self.offset}"
+        )
 
 
 class Parser:
     """Parsing base class."""
 
-    def __init__(self, tokenizer: Tokenizer, *, verbose: bool = False):
+    def __init__(
+        self,
+        tokenizer: Tokenizer,
+        *,
+        verbose: bool = False,
+        commit_rule: Optional[str] = None,
+        window: Optional[int] = None,
+        fuel: Optional[int] = None,
+        deadline: Optional[float] = None,
+    ):
         self._tokenizer = tokenizer
         self._verbose = verbose
         self._level = 0
-        self._cache: Dict[Tuple[Mark, str, Tuple[Any, ...]], Tuple[Any, Mark, Mark]] = {}
+        # Position -> rule ID (or (rule ID, args)) -> (tree, endmark, reach).
+        self._memo: Dict[Mark, Dict[Any, MemoEntry]] = {}
+        self._failures: Dict[Mark, int] = {}  # Position -> bits of the keys that failed there
+        self._failure_bits: Dict[Any, int] = {}  # Key -> bit number
+        # (Position, rule ID) -> memo entry, for rules involved in left
+        # recursion; see memoize_involved().
+        self._involved_memo: Dict[Tuple[Mark, int], MemoEntry] = {}
+        # Positions of the left-recursive rules growing a seed, outermost first.
+        self._growing: List[Mark] = []
+        # Reach -> (position, key) of the memo entries with that reach;
+        # built by the first clear_excess() call.
+        self._reach_index: Optional[Dict[Mark, List[Tuple[Mark, Any]]]] = None
+        self._max_indexed_reach = 0
         self._dummy_pos: Optional[Mark] = None
         self._dummy_count: Optional[int] = None
         self._dummy_inserted: Optional[Mark] = None
+        # Token types and literals tried at the furthest position.
+        self._expected_pos: Mark = -1
+        self._expected: Set[str] = set()
         # Pass through common tokenizer methods.
         # TODO: Rename to _mark and _reset.
         self.mark = self._tokenizer.mark
@@ -183,8 +360,29 @@ class Parser:
         self.get_reach = self._tokenizer.get_reach
         self.update_reach = self._tokenizer.update_reach
         self.reset_reach = self._tokenizer.reset_reach
+        # Eviction policies; see commit().
+        self._commit_depth = 0
+        if commit_rule is not None:
+            self.commit_at(commit_rule)
+        if window is not None:
+            self._tokenizer.set_window(window, self.evict_memo)
+        # Budget; see set_budget().
+        self._budgeted = False
+        self._fuel: Optional[int] = None
+        self._deadline: Optional[float] = None
+        self._calls = 0  # Rule calls before the current countdown
+        self._countdown = self._countdown_start = 0
+        if fuel is not None or deadline is not None:
+            self.set_budget(fuel, deadline)
 
     _keywords: Set[str] = set()
+    # Parsers generated with two passes set _two_pass; their alternatives
+    # using invalid_ rules are only tried while call_invalid_rules is set.
+    # See parse_rule().
+    _two_pass = False
+    call_invalid_rules = True
+    # Set on the subclasses made by make_adaptive_parser_class().
+    _memo_policy: ClassVar[Optional["AdaptiveMemoPolicy"]] = None
 
     @abstractmethod
     def start(self) -> Any:
@@ -194,7 +392,7 @@ class Parser:
         tok = self._tokenizer.peek()
         return f"{tok.start[0]}.{tok.start[1]}: {token.tok_name[tok.type]}:{tok.string!r}"
 
-    @memoize
+    @memoize(NAME_ID)
     def name(self) -> Optional[tokenize.TokenInfo]:
         self.check_for_dummy("NAME")
         tok = self._tokenizer.peek()
@@ -204,7 +402,7 @@ class Parser:
             return self._tokenizer.getnext()
         return None
 
-    @memoize
+    @memoize(NUMBER_ID)
     def number(self) -> Optional[tokenize.TokenInfo]:
         self.check_for_dummy("NUMBER")
         tok = self._tokenizer.peek()
@@ -212,7 +410,7 @@ class Parser:
             return self._tokenizer.getnext()
         return None
 
-    @memoize
+    @memoize(STRING_ID)
     def string(self) -> Optional[tokenize.TokenInfo]:
         self.check_for_dummy("STRING")
         tok = self._tokenizer.peek()
@@ -220,7 +418,7 @@ class Parser:
             return self._tokenizer.getnext()
         return None
 
-    @memoize
+    @memoize(OP_ID)
     def op(self) -> Optional[tokenize.TokenInfo]:
         self.check_for_dummy("OP")
         tok = self._tokenizer.peek()
@@ -228,7 +426,7 @@ class Parser:
             return self._tokenizer.getnext()
         return None
 
-    @memoize
+    @memoize(EXPECT_ID)
     def expect(self, type: str) -> Optional[tokenize.TokenInfo]:
         self.check_for_dummy(type)
         tok = self._tokenizer.peek()
@@ -246,7 +444,7 @@ class Parser:
             return self._tokenizer.getnext()
         return None
 
-    @memoize
+    @memoize(EXPECT_KEYWORD_ID)
     def expect_keyword(self, type: str) -> Optional[tokenize.TokenInfo]:
         self.check_for_dummy(type)
         tok = self._tokenizer.peek()
@@ -272,11 +470,303 @@ class Parser:
             "pegen parse failure", (filename, tok.start[0], 1 + tok.start[1], tok.line)
         )
 
+    def failure_bit(self, key: Any) -> int:
+        """Return the bit number representing key in FAILURES masks.
+
+        Numbers are handed out in order of first failure, so that the
+        masks stay small.
+        """
+        bits = self._failure_bits
+        bit = bits.get(key)
+        if bit is None:
+            bit = bits[key] = len(bits)
+        return bit
+
+    def memo_size(self) -> int:
+        """Return the total number of memo entries (counting failure bits)."""
+        size = 0
+        for table in self._memo.values():
+            size += len(table)
+        for failures in self._failures.values():
+            size += bin(failures).count("1")
+        return size
+
+    def commit(self, pos: Mark) -> None:
+        """Delete memo entries and tokens before pos.
+
+        This bounds memory use on long inputs, but the parser can no
+        longer backtrack before pos: looking at an evicted token raises
+        IndexError.
+        """
+        self.evict_memo(pos)
+        self._involved_memo = {}
+        self._tokenizer.evict(pos)
+
+    def evict_memo(self, pos: Mark) -> None:
+        """Delete memo entries before pos, but keep the tokens.
+
+        This is what window=N does every N tokens, with pos N tokens
+        back.  Tokens are only evicted by commit(): without knowing
+        where the rules still running started, backtracking could take
+        the parser to any of them.  Deleted entries just have to be
+        parsed again, except for the seeds being grown by
+        memoize_left_rec(), whose tables are kept.
+        """
+        if self._growing:
+            pos = min(pos, self._growing[0])
+        for mark in [mark for mark in self._memo if mark < pos]:
+            del self._memo[mark]
+        for mark in [mark for mark in self._failures if mark < pos]:
+            del self._failures[mark]
+
+    def commit_at(self, rule: str) -> None:
+        """Commit each time rule is called outside another call of it.
+
+        E.g. for rule="statement" this commits at the start of each
+        top-level statement.  No rule enclosing those calls may backtrack
+        before them, except to fail.
+        """
+        method = getattr(self, rule)
+
+        def commit_wrapper() -> Any:
+            if not self._commit_depth:
+                self.commit(self._tokenizer._index)
+            self._commit_depth += 1
+            tree = method()
+            self._commit_depth -= 1
+            return tree
+
+        setattr(self, rule, commit_wrapper)
+
+    def cut(self, mark: Mark) -> bool:
+        """Delete the memo tables strictly between mark and the current position.
+
+        Generated parsers call this at a cut (~) when pruning is enabled,
+        with mark being where the current alternative started.  The cut
+        keeps the rule from trying another alternative at mark, so only
+        a caller backtracking over the same tokens could still use those
+        entries.  Always returns True.
+        """
+        memo = self._memo
+        failures = self._failures
+        for pos in range(mark + 1, self._tokenizer._index):
+            memo.pop(pos, None)
+            failures.pop(pos, None)
+        return True
+
+    def set_budget(self, fuel: Optional[int] = None, deadline: Optional[float] = None) -> None:
+        """Limit the parse to fuel rule calls, ending by deadline (a time.monotonic() value).
+
+        Going over either raises ParseBudgetExceeded, after which the
+        parser can't be used any more.  Every call of a rule or token
+        method counts, memo hits included.  The calls are counted by
+        wrappers set on the instance (like commit_at() does), so parsers
+        without a budget don't pay for it.  Each call of set_budget()
+        starts the count from zero.
+        """
+        self._fuel = fuel
+        self._deadline = deadline
+        self._calls = 0
+        self.start_countdown()
+        if self._budgeted:
+            return
+        self._budgeted = True
+        names = set(TOKEN_METHODS)
+        for cls in type(self).__mro__:
+            if cls is Parser or cls is FastParser:
+                break
+            for name, value in vars(cls).items():
+                if callable(value) and not name.startswith("__"):
+                    names.add(name)
+        for name in names:
+            setattr(self, name, self.budget_wrapper(getattr(self, name)))
+
+    def budget_wrapper(self, method: Callable[..., T]) -> Callable[..., T]:
+        def budget_wrapper(*args: object) -> T:
+            self._countdown -= 1
+            if self._countdown < 0:
+                self.check_budget()
+            return method(*args)
+
+        return budget_wrapper
+
+    def start_countdown(self) -> None:
+        """Set the number of rule calls until check_budget() is called."""
+        count = sys.maxsize
+        if self._fuel is not None:
+            count = self._fuel - self._calls
+        if self._deadline is not None:
+            count = min(count, BUDGET_CHECK_INTERVAL)
+        self._countdown = self._countdown_start = count
+
+    def check_budget(self) -> None:
+        """Raise ParseBudgetExceeded if the budget is used up, else restart the countdown.
+
+        This is called by the wrappers set by set_budget() for the
+        call that takes the countdown below zero.
+        """
+        self._calls += self._countdown_start + 1
+        reason = None
+        if self._fuel is not None and self._calls > self._fuel:
+            reason = "fuel"
+        elif self._deadline is not None and time.monotonic() >= self._deadline:
+            reason = "deadline"
+        if reason is not None:
+            tok = self._tokenizer.diagnose()
+            raise ParseBudgetExceeded(reason, self._calls - 1, tok.start[0], tok.start[1] + 1)
+        self.start_countdown()
+
+    def parse_rule(self, rule: str = "start") -> Any:
+        """Call rule at the current position; return its tree, or None if it fails.
+
+        A parser generated with two passes first tries rule without the
+        alternatives that use invalid_ (or incorrect_) rules, which are
+        there only for better error messages.  If that fails it goes back
+        and tries again with them, so a syntax error costs two parses,
+        but the tree and the error position are those of a single pass.
+        """
+        method = getattr(self, rule)
+        if not self._two_pass:
+            return method()
+        mark = self.mark()
+        reach = self.get_reach()
+        expected = self._expected_pos, set(self._expected)
+        self.call_invalid_rules = False
+        try:
+            tree = method()
+        finally:
+            self.call_invalid_rules = True
+        if tree is not None:
+            return tree
+        # The memo entries of the first pass don't hold for the second.
+        self.clear_from(mark)
+        self.reset(mark)
+        self.reset_reach(reach)
+        self._expected_pos, self._expected = expected
+        tree = method()
+        self.clear_from(mark)  # Nor those of the second for a later first pass.
+        return tree
+
+    def clear_from(self, pos: Mark) -> None:
+        """Delete all memo entries at pos and after."""
+        for mark in [mark for mark in self._memo if mark >= pos]:
+            del self._memo[mark]
+        for mark in [mark for mark in self._failures if mark >= pos]:
+            del self._failures[mark]
+        self._involved_memo = {}
+
+    def iter_parse(
+        self,
+        rule: str = "statement",
+        filename: str = "<unknown>",
+        *,
+        errors: Optional[List[SyntaxError]] = None,
+    ) -> Iterator[Any]:
+        """Parse rule repeatedly up to the ENDMARKER, yielding each tree.
+
+        Memo entries and tokens before each tree are evicted (see
+        commit()), so memory use doesn't grow with the input.  Raises
+        SyntaxError if rule fails before the end of the input, unless
+        an errors list is given: then the error is appended to it and
+        parsing resumes after the next NEWLINE (see resync()).
+        """
+        tokenizer = self._tokenizer
+        depth = 0  # Blocks entered by the statements skipped by resync()
+        resynced = False
+        while True:
+            mark = tokenizer._index
+            self.commit(mark)
+            tok = tokenizer.peek()
+            if tok.type == token.ENDMARKER:
+                return
+            # Skip the INDENT of the block of a statement that failed,
+            # and the DEDENTs closing blocks whose start was skipped.
+            if tok.type == token.INDENT and resynced or tok.type == token.DEDENT and depth > 0:
+                tokenizer.getnext()
+                depth += 1 if tok.type == token.INDENT else -1
+                continue
+            self.reset_reach(mark)
+            tree = self.parse_rule(rule)
+            resynced = False
+            if not tree:
+                err = self.make_syntax_error(filename)
+                if errors is None:
+                    raise err
+                errors.append(err)
+                depth += self.resync(mark)
+                resynced = True
+                continue
+            yield tree
+
+    def resync(self, mark: Mark) -> int:
+        """Skip the tokens of a statement that failed to parse, starting at mark.
+
+        This moves to just after the first NEWLINE at or after the
+        furthest token looked at (or to the ENDMARKER).  Returns the
+        number of INDENT tokens minus the number of DEDENT tokens skipped.
+        """
+        tokenizer = self._tokenizer
+        self.reset(mark)
+        error_pos = self.get_reach() - 1
+        depth = 0
+        while True:
+            tok = tokenizer.peek()
+            if tok.type == token.ENDMARKER:
+                break
+            tokenizer.getnext()
+            if tok.type == token.INDENT:
+                depth += 1
+            elif tok.type == token.DEDENT:
+                depth -= 1
+            elif tok.type == token.NEWLINE and tokenizer._index > error_pos:
+                break
+        return depth
+
+    def index_reach(self, mark: Mark, key: Any, reach: Mark) -> None:
+        """Add the memo entry for key at mark to the reach index."""
+        assert self._reach_index is not None
+        self._reach_index.setdefault(reach, []).append((mark, key))
+        if reach > self._max_indexed_reach:
+            self._max_indexed_reach = reach
+
     def clear_excess(self, pos: Mark) -> None:
-        """Delete cache entries with reach > pos."""
-        to_delete = [key for key, (tree, mark, reach) in self._cache.items() if reach > pos]
-        for key in to_delete:
-            del self._cache[key]
+        """Delete cache entries with reach > pos.
+
+        The first call indexes all entries by reach, and the index is
+        kept up to date after that, so further calls (error recovery
+        makes many) only visit the entries they delete.
+        """
+        if self._reach_index is None:
+            self._reach_index = {}
+            for mark in self._memo:
+                for key, entry in self._memo[mark].items():
+                    self.index_reach(mark, key, entry[2])
+            for mark in self._failures:
+                self.index_reach(mark, FAILURES, mark + 1)
+        self._involved_memo = {}
+        memo = self._memo
+        failures = self._failures
+        for reach in range(pos + 1, self._max_indexed_reach + 1):
+            for mark, key in self._reach_index.pop(reach, ()):
+                if key == FAILURES:
+                    failures.pop(mark, None)
+                    continue
+                table = memo.get(mark)
+                if table is None or key not in table:
+                    continue  # Already gone (e.g. by commit() or cut()).
+                # The key may have been stored again since, with a lower reach.
+                if table[key][2] > pos:
+                    del table[key]
+        self._max_indexed_reach = min(self._max_indexed_reach, pos)
+
+    def get_expected(self) -> Tuple[Mark, Set[str]]:
+        """Return the furthest position where tokens were tried, and what was tried there.
+
+        These are the arguments of the token methods (e.g. "NAME" or
+        "+") called there, whether or not they matched.  FastParser
+        doesn't keep track of these, and returns (-1, set()).
+        """
+        return self._expected_pos, self._expected
 
     def insert_dummy(self, pos: Mark, count: int) -> None:
         """Pretend there's a dummy token at pos.
@@ -292,8 +782,18 @@ class Parser:
         self._dummy_inserted = None
 
     def check_for_dummy(self, type: str) -> None:
-        """Check whether this is the position where we should insert a dummy token."""
-        if self._dummy_pos is None or self._dummy_pos != self.mark():
+        """Check whether this is the position where we should insert a dummy token.
+
+        Also record type in the expected set if this is the furthest
+        position tried so far; see get_expected().
+        """
+        mark = self.mark()
+        if mark >= self._expected_pos:
+            if mark > self._expected_pos:
+                self._expected_pos = mark
+                self._expected = set()
+            self._expected.add(type)
+        if self._dummy_pos is None or self._dummy_pos != mark:
             return
         assert self._dummy_count is not None
         if self._dummy_count > 0:
@@ -303,7 +803,7 @@ class Parser:
         self._dummy_pos = None
         self._dummy_count = None
         tok = tokenize.TokenInfo(make_dummy_token_type(type), type, (0, 0), (0, 0), "")
-        self._tokenizer._tokens.insert(pos, tok)  # TODO: Make an API for this
+        self._tokenizer.insert_token(pos, tok)
         self._dummy_inserted = pos
 
     def still_dummy(self) -> bool:
@@ -313,20 +813,342 @@ class Parser:
         if self._dummy_inserted is None:
             tok = None
         else:
-            tok = self._tokenizer._tokens[self._dummy_inserted]
-            del self._tokenizer._tokens[self._dummy_inserted]  # TODO: Make an API for this
+            tok = self._tokenizer.undo_edit()
         self._dummy_inserted = None
         self._dummy_count = None
         self._dummy_pos = None
         return tok
 
     def delete_token(self, pos: Mark) -> tokenize.TokenInfo:
-        tok = self._tokenizer._tokens[pos]
-        del self._tokenizer._tokens[pos]
-        return tok
+        """Pretend the token at pos isn't there; see Tokenizer.delete_token()."""
+        return self._tokenizer.delete_token(pos)
 
     def insert_token(self, pos: Mark, tok: tokenize.TokenInfo) -> None:
-        self._tokenizer._tokens.insert(pos, tok)
+        """Pretend tok is at pos, or put it back if delete_token(pos) took it out."""
+        if self._tokenizer.get_edit() == (pos, None):
+            self._tokenizer.undo_edit()
+        else:
+            self._tokenizer.insert_token(pos, tok)
+
+
+def fast_memoize(rule_id: int) -> Callable[[F], F]:
+    """Memoize a symbol method of a FastParser under the given rule ID.
+
+    Like memoize(), but without tracing output and reach bookkeeping;
+    memo entries are (tree, endmark) pairs, and all failures go into
+    the failure bits.
+    """
+
+    def decorator(method: F) -> F:
+        def fast_memoize_wrapper(self: FP, *args: object) -> Optional[T]:
+            tokenizer = self._tokenizer
+            mark = tokenizer._index
+            key = (rule_id, args) if args else rule_id
+            table = self._memo.get(mark)
+            if table is None:
+                table = self._memo[mark] = {}
+            entry = table.get(key)
+            if entry is not None:
+                tree, tokenizer._index = entry
+                return tree
+            failures = self._failures.get(mark)
+            if failures is not None:
+                bit = self._failure_bits.get(key)
+                if bit is not None and failures >> bit & 1:
+                    return None
+            tree = method(self, *args)
+            if tree is None and tokenizer._index == mark:
+                self._failures[mark] = (failures or 0) | 1 << self.failure_bit(key)
+            else:
+                table[key] = tree, tokenizer._index
+            return tree
+
+        fast_memoize_wrapper.__wrapped__ = method  # type: ignore
+        fast_memoize_wrapper.rule_id = rule_id  # type: ignore
+        return cast(F, fast_memoize_wrapper)
+
+    return decorator
+
+
+def fast_memoize_left_rec(
+    rule_id: int,
+) -> Callable[[Callable[[FP], Optional[T]]], Callable[[FP], Optional[T]]]:
+    """Memoize a left-recursive symbol method of a FastParser under the given rule ID."""
+
+    def decorator(method: Callable[[FP], Optional[T]]) -> Callable[[FP], Optional[T]]:
+        def fast_memoize_left_rec_wrapper(self: FP) -> Optional[T]:
+            tokenizer = self._tokenizer
+            mark = tokenizer._index
+            table = self._memo.get(mark)
+            if table is None:
+                table = self._memo[mark] = {}
+            entry = table.get(rule_id)
+            if entry is not None:
+                tree, endmark = entry
+                if tree:
+                    tokenizer._index = endmark
+                return tree
+            # Grow the seed; see memoize_left_rec() for an explanation.
+            table[rule_id] = None, mark
+            lastresult, lastmark = None, mark
+            self._growing.append(mark)
+            while True:
+                self._involved_memo = {}
+                tokenizer._index = mark
+                result = method(self)
+                endmark = tokenizer._index
+                if not result or endmark <= lastmark:
+                    break
+                table[rule_id] = lastresult, lastmark = result, endmark
+            self._growing.pop()
+            self._involved_memo = {}
+            tokenizer._index = lastmark
+            table[rule_id] = lastresult, lastmark
+            return lastresult
+
+        fast_memoize_left_rec_wrapper.__wrapped__ = method  # type: ignore
+        return fast_memoize_left_rec_wrapper
+
+    return decorator
+
+
+def fast_memoize_involved(rule_id: int) -> Callable[[F], F]:
+    """Like memoize_involved(), for a FastParser; memo entries are (tree, endmark) pairs."""
+
+    def decorator(method: F) -> F:
+        def fast_memoize_involved_wrapper(self: FP, *args: object) -> T:
+            tokenizer = self._tokenizer
+            key = tokenizer._index, rule_id
+            memo = self._involved_memo
+            entry = memo.get(key)
+            if entry is not None:
+                tree, tokenizer._index = entry
+                return tree
+            tree = method(self, *args)
+            if memo is self._involved_memo:
+                memo[key] = tree, tokenizer._index
+            return tree
+
+        fast_memoize_involved_wrapper.__wrapped__ = method  # type: ignore
+        return cast(F, fast_memoize_involved_wrapper)
+
+    return decorator
+
+
+class FastParser(Parser):
+    """Parsing base class for production use.
+
+    The token methods and the fast_memoize wrappers skip tracing, reach
+    bookkeeping and the dummy-token hooks used by pegen.testutil, so
+    verbose output, clear_excess() and insert_dummy() have no effect.
+    make_syntax_error() still works, since the tokenizer keeps track of
+    the furthest token looked at.
+    """
+
+    # Position -> rule ID (or (rule ID, args)) -> (tree, endmark); the
+    # rules of inline parsers store None for a failure.
+    _memo: Dict[Mark, Dict[Any, Optional[FastMemoEntry]]]  # type: ignore
+    _involved_memo: Dict[Tuple[Mark, int], FastMemoEntry]  # type: ignore
+
+    @fast_memoize(NAME_ID)
+    def name(self) -> Optional[tokenize.TokenInfo]:
+        tok = self._tokenizer.peek()
+        if tok.type == token.NAME and tok.string not in self._keywords:
+            return self._tokenizer.getnext()
+        return None
+
+    @fast_memoize(NUMBER_ID)
+    def number(self) -> Optional[tokenize.TokenInfo]:
+        tok = self._tokenizer.peek()
+        if tok.type == token.NUMBER:
+            return self._tokenizer.getnext()
+        return None
+
+    @fast_memoize(STRING_ID)
+    def string(self) -> Optional[tokenize.TokenInfo]:
+        tok = self._tokenizer.peek()
+        if tok.type == token.STRING:
+            return self._tokenizer.getnext()
+        return None
+
+    @fast_memoize(OP_ID)
+    def op(self) -> Optional[tokenize.TokenInfo]:
+        tok = self._tokenizer.peek()
+        if tok.type == token.OP:
+            return self._tokenizer.getnext()
+        return None
+
+    @fast_memoize(EXPECT_ID)
+    def expect(self, type: str) -> Optional[tokenize.TokenInfo]:
+        # Same matching rules as Parser.expect().
+        tok = self._tokenizer.peek()
+        if tok.string == type:
+            if type in self._keywords:
+                return None
+            return self._tokenizer.getnext()
+        if type in exact_token_types:
+            if tok.type == exact_token_types[type]:
+                return self._tokenizer.getnext()
+        if type in token.__dict__:
+            if tok.type == token.__dict__[type]:
+                return self._tokenizer.getnext()
+        return None
+
+    @fast_memoize(EXPECT_KEYWORD_ID)
+    def expect_keyword(self, type: str) -> Optional[tokenize.TokenInfo]:
+        tok = self._tokenizer.peek()
+        if tok.string == type:
+            return self._tokenizer.getnext()
+        return None
+
+    def positive_lookahead(self, func: Callable[..., T], *args: object) -> T:
+        tokenizer = self._tokenizer
+        mark = tokenizer._index
+        ok = func(*args)
+        tokenizer._index = mark
+        return ok
+
+    def negative_lookahead(self, func: Callable[..., object], *args: object) -> bool:
+        tokenizer = self._tokenizer
+        mark = tokenizer._index
+        ok = func(*args)
+        tokenizer._index = mark
+        return not ok
+
+    def clear_excess(self, pos: Mark) -> None:
+        """Delete all cache entries (there's no reach to go by)."""
+        self._memo.clear()
+        self._failures.clear()
+        self._involved_memo = {}
+
+
+class AdaptiveMemoPolicy:
+    """Per-class memo policy learned from hit rates.
+
+    During the warmup (a number of memo lookups, over all parsers using
+    the policy) hits and misses are counted per rule.  After that,
+    memoization is turned off for the rules whose hit rate is below the
+    threshold.  The policy can be saved with dump() and loaded again
+    with load(), which gives a frozen policy.
+    """
+
+    def __init__(self, names: Dict[int, str], *, warmup: int = 100_000, threshold: float = 0.05):
+        self.names = names  # Rule ID -> method name
+        self.warmup = warmup
+        self.threshold = threshold
+        self.learning = True
+        self.lookups = 0
+        self.hits: Dict[int, int] = {}
+        self.misses: Dict[int, int] = {}
+        self.disabled: Set[int] = set()
+
+    def record(self, rule_id: int, hit: bool) -> None:
+        if hit:
+            self.hits[rule_id] = self.hits.get(rule_id, 0) + 1
+        else:
+            self.misses[rule_id] = self.misses.get(rule_id, 0) + 1
+        self.lookups += 1
+        if self.lookups >= self.warmup:
+            self.freeze()
+
+    def hit_rate(self, rule_id: int) -> Optional[float]:
+        hits = self.hits.get(rule_id, 0)
+        total = hits + self.misses.get(rule_id, 0)
+        return hits / total if total else None
+
+    def freeze(self) -> None:
+        """Stop learning and turn off memoization for rules with a low hit rate."""
+        self.learning = False
+        for rule_id in self.names:
+            rate = self.hit_rate(rule_id)
+            if rate is not None and rate < self.threshold:
+                self.disabled.add(rule_id)
+
+    def dump(self, file: IO[str]) -> None:
+        rules = {}
+        for rule_id, name in sorted(self.names.items()):
+            # Rules that were never looked up have no say (null) either way.
+            memoize = None
+            if self.hit_rate(rule_id) is not None:
+                memoize = rule_id not in self.disabled
+            rules[name] = {
+                "hits": self.hits.get(rule_id, 0),
+                "misses": self.misses.get(rule_id, 0),
+                "memoize": memoize,
+            }
+        policy = {"warmup": self.warmup, "threshold": self.threshold, "rules": rules}
+        json.dump(policy, file, indent=2)
+        file.write("\n")
+
+    def load(self, file: IO[str]) -> None:
+        """Replace the policy with a frozen one saved by dump()."""
+        rules = load_memo_policy(file)
+        self.learning = False
+        self.disabled = {
+            rule_id for rule_id, name in self.names.items() if not rules.get(name, True)
+        }
+
+
+def load_memo_policy(file: IO[str]) -> Dict[str, bool]:
+    """Read a policy saved by AdaptiveMemoPolicy.dump(); return {rule name: memoize?}."""
+    policy = json.load(file)
+    return {
+        name: rule["memoize"]
+        for name, rule in policy["rules"].items()
+        if rule["memoize"] is not None
+    }
+
+
+def adaptive_memoize(policy: AdaptiveMemoPolicy, rule_id: int, memoized: F, method: F) -> F:
+    """Consult policy before calling a memoized method."""
+
+    def adaptive_memoize_wrapper(self: P, *args: object) -> T:
+        if rule_id in policy.disabled:
+            return method(self, *args)
+        if policy.learning:
+            mark = self._tokenizer._index
+            table = self._memo.get(mark)
+            key = (rule_id, args) if args else rule_id
+            hit = False
+            if table is not None:
+                hit = key in table
+            failures = self._failures.get(mark)
+            if not hit and failures is not None and key in self._failure_bits:
+                hit = bool(failures >> self._failure_bits[key] & 1)
+            policy.record(rule_id, hit)
+        return memoized(self, *args)
+
+    adaptive_memoize_wrapper.__wrapped__ = method  # type: ignore
+    return cast(F, adaptive_memoize_wrapper)
+
+
+def make_adaptive_parser_class(
+    parser_class: Type[P],
+    *,
+    warmup: int = 100_000,
+    threshold: float = 0.05,
+    policy_file: Optional[IO[str]] = None,
+) -> Type[P]:
+    """Return a subclass of parser_class using an AdaptiveMemoPolicy.
+
+    All parsers of the subclass share the policy, as _memo_policy.
+    Rules using memoize_left_rec() always stay memoized.  If
+    policy_file is given the policy is loaded from it instead of
+    learned.
+    """
+    names: Dict[int, str] = {}
+    namespace: Dict[str, Any] = {}
+    policy = AdaptiveMemoPolicy(names, warmup=warmup, threshold=threshold)
+    for name in dir(parser_class):
+        value = getattr(parser_class, name)
+        rule_id = getattr(value, "rule_id", None)
+        if rule_id is not None:
+            names[rule_id] = name
+            namespace[name] = adaptive_memoize(policy, rule_id, value, value.__wrapped__)
+    if policy_file is not None:
+        policy.load(policy_file)
+    namespace["_memo_policy"] = policy
+    return cast(Type[P], type(parser_class.__name__, (parser_class,), namespace))
 
 
 def make_dummy_token_type(type: str) -> int:
@@ -335,6 +1157,78 @@ def make_dummy_token_type(type: str) -> int:
     return getattr(token, type, token.ERRORTOKEN)
 
 
+# Default C stack per Python call for run_deep(), an upper bound: parsing
+# nested brackets with data/python_parser.py, a call takes about 600
+# bytes on CPython 3.8, and 185 on 3.11 (which inlines most Python calls).
+STACK_BYTES_PER_FRAME = 1024
+DEFAULT_DEEP_STACK_SIZE = 512 * 1024 * 1024
+
+_deep_lock = threading.Lock()
+_deep_calls = 0
+_saved_recursion_limit = 0
+
+
+def run_deep(
+    func: Callable[[], T],
+    *,
+    stack_size: int = DEFAULT_DEEP_STACK_SIZE,
+    frame_size: int = STACK_BYTES_PER_FRAME,
+) -> T:
+    """Call func() on a thread with a stack of stack_size bytes; return its result.
+
+    A generated parser recurses some 40 calls deep for each level of
+    brackets in Python code, so deep nesting runs into the recursion
+    limit long before it's a problem for the parser itself.  While
+    func() runs, the recursion limit is raised to stack_size //
+    frame_size, the number of Python calls of frame_size bytes of C
+    stack that fit, so that going too deep raises RecursionError
+    instead of crashing.
+
+    The recursion limit is process-wide, so this isn't thread-safe:
+    while func() runs, other threads get the raised limit too (and
+    may crash where they would have raised RecursionError), and a
+    limit set by another thread meanwhile is undone when the last
+    run_deep() call returns, which restores the limit from before
+    the first one.
+
+    The stack is only allocated as it's used, so a large stack_size
+    doesn't cost much unless the parse goes deep.  This works for C
+    extension parsers too, which recurse on the C stack.
+    """
+    global _deep_calls, _saved_recursion_limit
+    result: List[T] = []
+    error: List[BaseException] = []
+
+    def run() -> None:
+        try:
+            result.append(func())
+        except BaseException as err:
+            error.append(err)
+
+    with _deep_lock:
+        if not _deep_calls:
+            _saved_recursion_limit = sys.getrecursionlimit()
+        _deep_calls += 1
+        sys.setrecursionlimit(max(sys.getrecursionlimit(), stack_size // frame_size))
+    try:
+        with _deep_lock:
+            old_stack_size = threading.stack_size(stack_size)
+            try:
+                thread = threading.Thread(target=run, name="pegen-deep")
+                thread.start()
+            finally:
+                threading.stack_size(old_stack_size)
+        thread.join()
+    finally:
+        with _deep_lock:
+            _deep_calls -= 1
+            if not _deep_calls:
+                sys.setrecursionlimit(_saved_recursion_limit)
+    if error:
+        raise error[0]
+    return result[0]
+
+
 def simple_parser_main(parser_class: Type[Parser]) -> None:
     argparser = argparse.ArgumentParser()
     argparser.add_argument(
@@ -347,6 +1241,49 @@ def simple_parser_main(parser_class: Type[Parser]) -> None:
     argparser.add_argument(
         "-q", "--quiet", action="store_true", help="Don't print the parsed program"
     )
+    argparser.add_argument(
+        "--commit-rule",
+        metavar="RULE",
+        help="Evict memo entries and tokens before each top-level call of RULE",
+    )
+    argparser.add_argument(
+        "--window",
+        type=int,
+        metavar="N",
+        help="Evict memo entries (but not tokens) more than N tokens back",
+    )
+    argparser.add_argument(
+        "--learn-memo-policy",
+        metavar="FILE",
+        help="Learn which rules are worth memoizing from hit rates; save the policy in FILE",
+    )
+    argparser.add_argument(
+        "--stream",
+        metavar="RULE",
+        help="Parse and print one RULE at a time instead of calling start()",
+    )
+    argparser.add_argument(
+        "--all-errors",
+        action="store_true",
+        help="With --stream, skip to the next line after a syntax error and report them all",
+    )
+    argparser.add_argument(
+        "--fuel",
+        type=int,
+        metavar="N",
+        help="Give up after N rule calls",
+    )
+    argparser.add_argument(
+        "--timeout",
+        type=float,
+        metavar="SEC",
+        help="Give up after SEC seconds",
+    )
+    argparser.add_argument(
+        "--deep",
+        action="store_true",
+        help="Parse on a thread with a large stack, for deeply nested input",
+    )
     argparser.add_argument("filename", help="Input file ('-' to use stdin)")
 
     args = argparser.parse_args()
@@ -354,6 +1291,9 @@ def simple_parser_main(parser_class: Type[Parser]) -> None:
     verbose_tokenizer = verbose >= 3
     verbose_parser = verbose == 2 or verbose >= 4
 
+    if args.learn_memo_policy:
+        parser_class = make_adaptive_parser_class(parser_class)
+
     t0 = time.time()
 
     filename = args.filename
@@ -365,8 +1305,31 @@ def simple_parser_main(parser_class: Type[Parser]) -> None:
     try:
         tokengen = tokenize.generate_tokens(file.readline)
         tokenizer = Tokenizer(tokengen, verbose=verbose_tokenizer)
-        parser = parser_class(tokenizer, verbose=verbose_parser)
-        tree = parser.start()
+        parser = parser_class(
+            tokenizer,
+            verbose=verbose_parser,
+            commit_rule=args.commit_rule,
+            window=args.window,
+            fuel=args.fuel,
+            deadline=None if args.timeout is None else time.monotonic() + args.timeout,
+        )
+        if args.stream:
+            errors: Optional[List[SyntaxError]] = [] if args.all_errors else None
+            try:
+                for tree in parser.iter_parse(args.stream, filename, errors=errors):
+                    if not args.quiet:
+                        pprint.pprint(tree, indent=2)
+            except SyntaxError as err:
+                traceback.print_exception(err.__class__, err, None)
+                sys.exit(1)
+            if errors:
+                for error in errors:
+                    traceback.print_exception(error.__class__, error, None)
+                sys.exit(1)
+        elif args.deep:
+            tree = run_deep(parser.parse_rule)
+        else:
+            tree = parser.parse_rule()
         try:
             if file.isatty():
                 endpos = 0
@@ -374,20 +1337,32 @@ def simple_parser_main(parser_class: Type[Parser]) -> None:
                 endpos = file.tell()
         except IOError:
             endpos = 0
-        if not tree:
-            err = parser.make_syntax_error(filename)
-            traceback.print_exception(err.__class__, err, None)
+        if not args.stream and not tree:
+            error = parser.make_syntax_error(filename)
+            traceback.print_exception(error.__class__, error, None)
             sys.exit(1)
+    except ParseBudgetExceeded as err:
+        traceback.print_exception(err.__class__, err, None)
+        sys.exit(1)
     finally:
         if file is not sys.stdin:
             file.close()
 
     t1 = time.time()
 
-    if not args.quiet:
-        import pprint
+    if not args.quiet and not args.stream:
+        if args.deep:
+            run_deep(lambda: pprint.pprint(tree, indent=2))
+        else:
+            pprint.pprint(tree, indent=2)
 
-        pprint.pprint(tree, indent=2)
+    if args.learn_memo_policy:
+        policy = parser._memo_policy
+        assert policy is not None
+        if policy.learning:
+            policy.freeze()
+        with open(args.learn_memo_policy, "w") as policy_file:
+            policy.dump(policy_file)
 
     if verbose:
         dt = t1 - t0
@@ -404,5 +1379,5 @@ def simple_parser_main(parser_class: Type[Parser]) -> None:
             print()
         print("Caches sizes:")
         print(f"  token array : {len(tokenizer._tokens):10}")
-        print(f"        cache : {len(parser._cache):10}")
+        print(f"        cache : {parser.memo_size():10}")
         ## print_memstats()
@@ -1,18 +1,24 @@
+import ast
 import contextlib
+import re
+import token
 from abc import abstractmethod
 
 from typing import AbstractSet, Dict, IO, Iterator, List, Optional, Set, Text, Tuple
 
 from pegen import sccutils
+from pegen.first_sets import FirstSetCalculator
 from pegen.grammar import (
     Grammar,
     Rule,
     Rhs,
     Alt,
+    Cut,
     NamedItem,
     Plain,
     NameLeaf,
     Gather,
+    PositiveLookahead,
 )
 from pegen.grammar import GrammarError, GrammarVisitor
 
@@ -37,7 +43,16 @@ class ParserGenerator:
 
     callmakervisitor: GrammarVisitor
 
-    def __init__(self, grammar: Grammar, tokens: Dict[int, str], file: Optional[IO[Text]]):
+    def __init__(
+        self,
+        grammar: Grammar,
+        tokens: Dict[int, str],
+        file: Optional[IO[Text]],
+        *,
+        left_rec_loops: bool = True,
+        ll1_rules: bool = True,
+        reserved_keywords: bool = True,
+    ):
         self.grammar = grammar
         self.tokens = tokens
         self.rules = grammar.rules
@@ -51,6 +66,13 @@ class ParserGenerator:
         self.level = 0
         compute_nullables(self.rules)
         self.first_graph, self.first_sccs = compute_left_recursives(self.rules)
+        self.first_sets = FirstSetCalculator(self.rules)
+        compute_left_rec_loops(self.rules, self.first_sccs, self.first_sets, left_rec_loops)
+        self.ll1_rules = ll1_rules
+        self.reserved_keywords = reserved_keywords  # Can a NAME token be a keyword?
+        if ll1_rules:
+            for rule in self.rules.values():
+                rule.ll1 = is_ll1_rule(rule, self.first_sets, reserved_keywords)
         self.todo = self.rules.copy()  # Rules to generate
         self.counter = 0  # For name_rule()/name_loop()
         self.keyword_counter = 499  # For keyword_type()
@@ -114,7 +136,9 @@ class ParserGenerator:
     def name_node(self, rhs: Rhs) -> str:
         self.counter += 1
         name = f"_tmp_{self.counter}"  # TODO: Pick a nicer name.
-        self.todo[name] = Rule(name, None, rhs)
+        self.todo[name] = rule = Rule(name, None, rhs)
+        if self.ll1_rules:
+            rule.ll1 = is_ll1_rule(rule, self.first_sets, self.reserved_keywords)
         return name
 
     def name_loop(self, node: Plain, is_repeat1: bool) -> str:
@@ -200,6 +224,132 @@ def compute_left_recursives(
     return graph, sccs
 
 
+def compute_left_rec_loops(
+    rules: Dict[str, Rule],
+    sccs: List[AbstractSet[str]],
+    first_sets: FirstSetCalculator,
+    enabled: bool = True,
+) -> None:
+    """Mark the left-recursive rules that can be parsed with a loop.
+
+    These are directly left-recursive rules whose alternatives are some
+    of the form `rule tail` followed by some that don't start with the
+    rule, as in `expr: expr '+' term | term`.  Such a rule is parsed by
+    matching one of the latter alternatives (the seed) and then tails
+    for as long as one matches and gets further, each making a new
+    seed.  That gives the same left-associative tree as growing the
+    seed with memoize_left_rec(), without reparsing the alternatives
+    each round.
+
+    memoize_left_rec() fails when the seed matches the empty string,
+    so rules with a nullable seed alternative are left alone.  That
+    uses the nullability of first_sets: Rule.nullable misses rules
+    reached a second time, as in `c c`.  A cut in a tail would end the
+    loop differently, so such rules are left alone too, as are all
+    other left-recursive rules.
+    """
+    for rule in rules.values():
+        rule.left_rec_loop = False
+    if not enabled:
+        return
+    for scc in sccs:
+        name = min(scc)
+        if len(scc) > 1 or name not in rules:
+            continue
+        rule = rules[name]
+        if not rule.left_recursive:
+            continue
+        tails = left_rec_tails(rule)
+        alts = rule.flatten().alts
+        if not tails or len(tails) == len(alts):
+            continue
+        if any(first_sets.is_nullable(alt) for alt in alts[len(tails) :]):
+            continue
+        if any(rule.name in alt.initial_names() for alt in alts[len(tails) :]):
+            continue
+        if any(isinstance(item.item, Cut) for alt in tails for item in alt.items):
+            continue
+        rule.left_rec_loop = True
+
+
+def left_rec_tails(rule: Rule) -> List[Alt]:
+    """Return the leading alternatives of rule that start with a call of rule itself."""
+    tails = []
+    for alt in rule.flatten().alts:
+        item = alt.items[0].item if alt.items else None
+        if not isinstance(item, NameLeaf) or item.value != rule.name:
+            break
+        tails.append(alt)
+    return tails
+
+
+def is_invalid_rule_name(name: str) -> bool:
+    """Is name that of a rule that's only there for a better error message?"""
+    return name.startswith("invalid_") or name.startswith("incorrect_")
+
+
+def uses_invalid_rule(alt: Alt) -> bool:
+    """Can alt only match by calling an invalid_ (or incorrect_) rule?
+
+    Parsers generated with two passes skip such alternatives in the
+    first pass.  Calls that are optional, repeated, in a group or in a
+    negative lookahead don't count, since alt can match without them.
+    """
+    for item in alt.items:
+        node = item.item
+        if isinstance(node, PositiveLookahead):
+            node = node.node
+        if isinstance(node, NameLeaf) and is_invalid_rule_name(node.value):
+            return True
+    return False
+
+
+def is_ll1_rule(
+    rule: Rule, first_sets: FirstSetCalculator, reserved_keywords: bool = True
+) -> bool:
+    """Can the next token tell which alternative of rule to try?
+
+    That's so if the FIRST sets of the alternatives are made of tokens
+    and are pairwise disjoint, and none of them can match the empty
+    string.  Such a rule never backtracks: if the one alternative that
+    can start with the token fails, the rule fails.  Rules with a cut
+    are left out, as are loops and left-recursive rules.
+    """
+    if rule.is_loop() or rule.is_gather() or rule.left_recursive:
+        return False
+    seen: Set[str] = set()
+    for alt in rule.flatten().alts:
+        if any(isinstance(item.item, Cut) for item in alt.items):
+            return False
+        first = first_sets.first_set(alt.items)
+        if not first or any(not terminal or terminal.startswith("_") for terminal in first):
+            return False  # Nullable, or starting with a helper rule
+        for terminal in first:
+            if any(tokens_overlap(terminal, other, reserved_keywords) for other in seen):
+                return False
+        seen |= first
+    return True
+
+
+def tokens_overlap(a: str, b: str, reserved_keywords: bool = True) -> bool:
+    """Can a token match both terminals, given as in a FIRST set?"""
+    if a[0] in "'\"" and b[0] in "'\"":
+        return ast.literal_eval(a) == ast.literal_eval(b)
+    if a[0] in "'\"":
+        a, b = b, a
+    if b[0] not in "'\"":
+        return a == b
+    # A token type and a literal.  An expected literal can also match a token
+    # type by name, an operator is OP or its exact type (PLUS for '+'), and a
+    # NAME can be a soft (or unreserved) keyword.
+    val = ast.literal_eval(b)
+    if val == a:
+        return True
+    if re.match(r"[a-zA-Z_]\w*\Z", val):
+        return a == "NAME" and (b[0] == '"' or not reserved_keywords)
+    return a == "OP" or token.tok_name.get(token.EXACT_TOKEN_TYPES.get(val, -1)) == a
+
+
 def make_first_graph(rules: Dict[str, Rule]) -> Dict[str, AbstractSet[str]]:
     """Compute the graph of left-invocations.
 
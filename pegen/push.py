@@ -0,0 +1,275 @@
+"""Parse statements from text that arrives in chunks, without blocking.
+
+Usage:
+
+    push = PushParser(GeneratedParser)
+    for result in push.feed(chunk):
+        if isinstance(result, SyntaxError):
+            ...  # The statement was skipped
+        else:
+            ...  # A complete statement
+    if push.need_more:
+        ...  # Part of a statement is waiting for more input
+    results = push.close()  # At the end of the input
+
+Each line is tokenized once, when the logical line it belongs to is
+complete.  Which lines end a logical line is worked out by a scan that
+only keeps track of brackets, strings and backslash continuations.
+Statements are only parsed when no block is open, so the lines of a
+block don't each make the parser start over.
+"""
+
+import collections
+import itertools
+import token
+import tokenize
+from typing import Any, Deque, Iterable, List, Optional, Type
+
+from pegen.incremental import read_tokens, shift_token
+from pegen.parser import Parser
+from pegen.tokenizer import Tokenizer
+
+
+class NeedMoreInput(Exception):
+    """Raised by TokenQueue when it runs out of tokens."""
+
+
+class TokenQueue:
+    """Token source for Tokenizer that can be refilled after running dry."""
+
+    def __init__(self) -> None:
+        self.tokens: Deque[tokenize.TokenInfo] = collections.deque()
+
+    def __iter__(self) -> "TokenQueue":
+        return self
+
+    def __next__(self) -> tokenize.TokenInfo:
+        if not self.tokens:
+            raise NeedMoreInput
+        return self.tokens.popleft()
+
+
+class PushParser:
+    """Parse the statements in the text fed to it, as soon as they are complete.
+
+    feed() and close() return a list of results: the trees of the
+    statements completed, and a SyntaxError for each statement that
+    failed (which is then skipped as by Parser.iter_parse()).
+
+    With interactive=True a blank line ends all open blocks, as in the
+    interactive interpreter.
+
+    A compound statement can't be complete while one of its blocks is
+    open, so statements are only parsed when the input is back at the
+    top level.  When a statement still needs more tokens than have
+    been fed (say an if statement, which the next line may continue
+    with an else), the attempt to parse it is abandoned and its memo
+    entries are dropped (a left-recursive rule may have left a
+    half-grown entry).  It's parsed from its start again when the
+    input is next back at the top level.
+    """
+
+    def __init__(
+        self,
+        parser_class: Type[Parser],
+        *,
+        rule: str = "statement",
+        filename: str = "<stdin>",
+        interactive: bool = False,
+    ):
+        self.filename = filename
+        self.interactive = interactive
+        self._queue = TokenQueue()
+        self.tokenizer = Tokenizer(self._queue)
+        self.parser = parser_class(self.tokenizer)
+        self._rule = rule
+        self._closed = False
+        # Text not tokenized yet: a partial line, and the complete lines
+        # of an unfinished logical line.
+        self._partial = ""
+        self._lines: List[str] = []
+        # Scan state at the end of self._lines.
+        self._brackets = 0
+        self._quote: Optional[str] = None
+        self._continued = False
+        # Tokenizer state at the end of the tokenized lines.
+        self._indents: List[str] = []
+        self._row = 0
+        # Statement loop state, as in Parser.iter_parse().
+        self._depth = 0
+        self._resynced = False
+
+    @property
+    def need_more(self) -> bool:
+        """Whether some of the input fed so far isn't part of a complete statement."""
+        tokenizer = self.tokenizer
+        return bool(
+            self._partial.strip()
+            or self._lines
+            or self._queue.tokens
+            or tokenizer._index < tokenizer._offset + len(tokenizer._tokens)
+        )
+
+    def feed(self, text: str) -> List[Any]:
+        """Add text to the input; return the results for the statements it completes."""
+        assert not self._closed, "feed() after close()"
+        parts = (self._partial + text).split("\n")
+        self._partial = parts.pop()
+        results: List[Any] = []
+        for part in parts:
+            line = part + "\n"
+            self.scan(line)
+            self._lines.append(line)
+            if self._brackets <= 0 and self._quote is None and not self._continued:
+                self.tokenize_lines()
+                if not self._indents:
+                    results += self.parse_statements()
+        return results
+
+    def feed_tokens(self, tokens: Iterable[tokenize.TokenInfo]) -> List[Any]:
+        """Like feed(), for input that has already been tokenized.
+
+        The tokens must be those of whole logical lines; the tokens of
+        the last line of the input must end with ENDMARKER.  Don't mix
+        this with feed().
+        """
+        assert not self._closed, "feed_tokens() after close()"
+        assert not self._partial and not self._lines, "feed_tokens() after feed()"
+        self.queue_tokens(tokens)
+        if self._indents:
+            return []
+        return self.parse_statements()
+
+    def close(self) -> List[Any]:
+        """Mark the end of the input; return the results for the rest of it."""
+        assert not self._closed, "close() called twice"
+        if self._partial:
+            self._lines.append(self._partial)
+            self._partial = ""
+        if self._lines:
+            self.tokenize_lines()
+        self._closed = True
+        end = (self._row + 1, 0)
+        for indent in self._indents:
+            self._queue.tokens.append(tokenize.TokenInfo(token.DEDENT, "", end, end, ""))
+        self._indents = []
+        self._queue.tokens.append(tokenize.TokenInfo(token.ENDMARKER, "", end, end, ""))
+        return self.parse_statements()
+
+    def scan(self, line: str) -> None:
+        """Update the bracket, string and continuation state for line."""
+        self._continued = False
+        i = 0
+        while i < len(line):
+            c = line[i]
+            if self._quote is not None:
+                if line.startswith(self._quote, i):
+                    i += len(self._quote)
+                    self._quote = None
+                elif c == "\\":
+                    i += 2
+                elif c == "\n" and len(self._quote) == 1:
+                    self._quote = None  # Unterminated; tokenize will complain.
+                    i += 1
+                else:
+                    i += 1
+            elif c == "#":
+                break
+            elif c in "([{":
+                self._brackets += 1
+                i += 1
+            elif c in ")]}":
+                self._brackets -= 1
+                i += 1
+            elif c in "'\"":
+                self._quote = c * 3 if line.startswith(c * 3, i) else c
+                i += len(self._quote)
+            elif c == "\\" and line[i + 1 :].strip("\r\n") == "":
+                self._continued = True
+                break
+            else:
+                i += 1
+
+    def tokenize_lines(self) -> None:
+        """Tokenize the lines of a complete logical line and queue the tokens."""
+        lines, self._lines = self._lines, []
+        # Prefix lines recreating the indentation stack; each gives INDENT NAME NEWLINE.
+        prefix = [indent + "x\n" for indent in self._indents]
+        source = itertools.chain(prefix, lines)
+        tokens = [
+            shift_token(tok, self._row - len(prefix))
+            for tok in itertools.islice(read_tokens(source), 3 * len(prefix), None)
+        ]
+        self._row += len(lines)
+        # Drop the DEDENTs and ENDMARKER tokenize adds at the end of the input.
+        while tokens and (tokens[-1].start[0] > self._row or tokens[-1].type == token.ENDMARKER):
+            tokens.pop()
+        if not tokens or tokens[-1].type != token.NEWLINE:
+            if tokens:
+                # tokenize gave up; end the line so that resync() finds its end.
+                end = (self._row, len(lines[-1]))
+                tokens.append(tokenize.TokenInfo(token.NEWLINE, "", end, end, lines[-1]))
+            elif self.interactive and self._indents:
+                # A blank line closes all blocks.  The NEWLINE after the
+                # DEDENTs lets the statement end without waiting for the
+                # next line to see if it's an "else" and the like.
+                end = (self._row, 0)
+                for indent in self._indents:
+                    tokens.append(tokenize.TokenInfo(token.DEDENT, "", end, end, lines[-1]))
+                tokens.append(tokenize.TokenInfo(token.NEWLINE, "", end, end, lines[-1]))
+                self._indents = []
+        self.queue_tokens(tokens)
+
+    def queue_tokens(self, tokens: Iterable[tokenize.TokenInfo]) -> None:
+        """Queue tokens for the parser, keeping track of the open blocks."""
+        for tok in tokens:
+            if tok.type == token.INDENT:
+                self._indents.append(tok.string)
+            elif tok.type == token.DEDENT and self._indents:
+                self._indents.pop()
+            self._queue.tokens.append(tok)
+
+    def parse_statements(self) -> List[Any]:
+        """Parse the statements that are complete; see Parser.iter_parse()."""
+        parser = self.parser
+        tokenizer = self.tokenizer
+        results: List[Any] = []
+        while True:
+            mark = tokenizer._index
+            parser.commit(mark)
+            try:
+                tok = tokenizer.peek()
+                if tok.type == token.ENDMARKER:
+                    break
+                if tok.type == token.NEWLINE and not tok.line.strip():
+                    tokenizer.getnext()  # From a blank line in interactive mode
+                    continue
+                if (
+                    tok.type == token.INDENT
+                    and self._resynced
+                    or tok.type == token.DEDENT
+                    and self._depth > 0
+                ):
+                    tokenizer.getnext()
+                    self._depth += 1 if tok.type == token.INDENT else -1
+                    continue
+                parser.reset_reach(mark)
+                tree = parser.parse_rule(self._rule)
+            except NeedMoreInput:
+                parser.reset(mark)
+                parser._memo.clear()
+                parser._failures.clear()
+                parser._involved_memo = {}
+                parser._growing = []
+                parser._level = 0
+                break
+            self._resynced = False
+            if tree:
+                results.append(tree)
+            else:
+                results.append(parser.make_syntax_error(self.filename))
+                # The rest of the logical line has been queued, so
+                # this doesn't run out of tokens.
+                self._depth += parser.resync(mark)
+                self._resynced = True
+        return results
@@ -3,7 +3,7 @@ from __future__ import annotations
 import ast
 import re
 import token
-from typing import Any, Dict, Optional, IO, Set, Text, Tuple
+from typing import Any, Dict, List, Optional, IO, Sequence, Set, Text, Tuple
 
 from pegen.grammar import (
     Cut,
@@ -24,7 +24,9 @@ from pegen.grammar import (
     Alt,
 )
 from pegen import grammar
-from pegen.parser_generator import ParserGenerator
+from pegen.parser import FIRST_RULE_ID
+from pegen.parser_generator import is_invalid_rule_name, left_rec_tails, ParserGenerator
+from pegen.parser_generator import uses_invalid_rule
 
 MODULE_PREFIX = """\
 #!/usr/bin/env python3.8
@@ -36,12 +38,34 @@ import tokenize
 
 from typing import Any, List, Optional, Set, Tuple
 
-from pegen.parser import memoize, memoize_left_rec, logger, Parser
+from pegen.parser import memoize, memoize_left_rec, memoize_involved, logger, Parser
 
 # TODO: Replace List[Any] with List[NodeType] once recursive type alias are in
 NodeType = Tuple[str, int, List[Any]]
 
 """
+FAST_RUNTIME_IMPORT = (
+    "from pegen.parser import fast_memoize, fast_memoize_left_rec, fast_memoize_involved,"
+    " FastParser"
+)
+INLINE_TOKEN_IMPORT = (
+    "from token import ASYNC, AWAIT, DEDENT, ENDMARKER, INDENT, NAME, NEWLINE, NUMBER, OP, STRING,"
+    " TYPE_COMMENT"
+)
+# Token types that token_test() and first_set_guard() can test for.
+GUARD_TOKEN_TYPES = (
+    "NAME",
+    "NUMBER",
+    "STRING",
+    "OP",
+    "NEWLINE",
+    "DEDENT",
+    "INDENT",
+    "ENDMARKER",
+    "ASYNC",
+    "AWAIT",
+    "TYPE_COMMENT",
+)
 MODULE_SUFFIX = """
 
 if __name__ == '__main__':
@@ -51,11 +75,39 @@ if __name__ == '__main__':
 
 
 class PythonCallMakerVisitor(GrammarVisitor):
+    # Expression for the tokenizer in token_test().
+    tokenizer = "self._tokenizer"
+
     def __init__(self, parser_generator: PythonParserGenerator):
         self.gen = parser_generator
         self.keywords: Set[str] = set()
         self.cache: Dict[Any, Any] = {}
 
+    def token_test(self, node: Any) -> Optional[str]:
+        """Return an expression testing the current token for node, if it's a leaf."""
+        if isinstance(node, NamedItem):
+            return self.token_test(node.item)
+        if isinstance(node, Rhs) and len(node.alts) == 1 and len(node.alts[0].items) == 1:
+            return self.token_test(node.alts[0].items[0])
+        if isinstance(node, Group):
+            return self.token_test(node.rhs)
+        if isinstance(node, NameLeaf):
+            name = node.value
+            if name == "NAME":
+                return (
+                    f"(_tok := {self.tokenizer}.peek()).type == NAME"
+                    " and _tok.string not in self._keywords"
+                )
+            if name in GUARD_TOKEN_TYPES:
+                return f"{self.tokenizer}.peek().type == {name}"
+            return None
+        if isinstance(node, StringLeaf):
+            val = ast.literal_eval(node.value)
+            if val in token.__dict__:
+                return None  # expect() also matches token names; leave that to it.
+            return f"{self.tokenizer}.peek().string == {val!r}"
+        return None
+
     def visit_NameLeaf(self, node: NameLeaf) -> Tuple[Optional[str], str]:
         name = node.value
         if name in ("NAME", "NUMBER", "STRING", "OP"):
@@ -97,10 +149,20 @@ class PythonCallMakerVisitor(GrammarVisitor):
         return head, tail
 
     def visit_PositiveLookahead(self, node: PositiveLookahead) -> Tuple[None, str]:
+        # A FastParser just compares the current token to a leaf; the
+        # Parser calls the token method, which records what was expected.
+        test = self.token_test(node.node) if self.gen.fast else None
+        if test is not None:
+            self.visit(node.node)  # Records keywords.
+            return None, f"({test})"
         head, tail = self.lookahead_call_helper(node)
         return None, f"self.positive_lookahead({head}, {tail})"
 
     def visit_NegativeLookahead(self, node: NegativeLookahead) -> Tuple[None, str]:
+        test = self.token_test(node.node) if self.gen.fast else None
+        if test is not None:
+            self.visit(node.node)  # Records keywords.
+            return None, f"not ({test})"
         head, tail = self.lookahead_call_helper(node)
         return None, f"self.negative_lookahead({head}, {tail})"
 
@@ -139,9 +201,36 @@ class PythonCallMakerVisitor(GrammarVisitor):
         return self.visit(node.rhs)
 
     def visit_Cut(self, node: Cut) -> Tuple[str, str]:
+        if self.gen.prune_cuts:
+            return "cut", "self.cut(mark)"
         return "cut", "True"
 
 
+class InlineCallMakerVisitor(PythonCallMakerVisitor):
+    """Call maker for the inline emission mode.
+
+    Token and literal matches become conditional expressions on the
+    current token instead of calls to the memoized token methods.  They
+    expect a local variable _tokenizer holding self._tokenizer.
+    """
+
+    tokenizer = "_tokenizer"
+
+    def visit_NameLeaf(self, node: NameLeaf) -> Tuple[Optional[str], str]:
+        name, call = super().visit_NameLeaf(node)
+        test = self.token_test(node)
+        if test is None:
+            return name, call
+        return name, f"(_tokenizer.getnext() if {test} else None)"
+
+    def visit_StringLeaf(self, node: StringLeaf) -> Tuple[str, str]:
+        name, call = super().visit_StringLeaf(node)  # Also records keywords.
+        test = self.token_test(node)
+        if test is None:
+            return name, call
+        return name, f"(_tokenizer.getnext() if {test} else None)"
+
+
 class PythonParserGenerator(ParserGenerator, GrammarVisitor):
     def __init__(
         self,
@@ -150,17 +239,53 @@ class PythonParserGenerator(ParserGenerator, GrammarVisitor):
         *,
         tokens: Dict[int, str] = token.tok_name,
         skip_actions: bool = False,
+        fast: bool = False,
+        inline: bool = False,
+        memoize_all: bool = False,
+        prune_cuts: bool = False,
+        memo_policy: Optional[Dict[str, bool]] = None,
+        memoize_involved: bool = True,
+        left_rec_loops: bool = True,
+        first_set_guards: bool = True,
+        ll1_rules: bool = True,
+        two_pass: bool = False,
     ):
         keywords = grammar.metas.get("keywords")
-        self.use_reserved_words = self.parse_bool(keywords, "keywords", True)
+        self.use_reserved_words: bool = self.parse_bool(keywords, "keywords", True)
         if skip_actions and ("start" not in grammar.rules and "trailer" not in grammar.metas):
             first_rule = next(iter(grammar.rules))
             grammar.rules["start"] = Rule(
                 "start", None, Rhs([Alt([NamedItem(None, NameLeaf(first_rule))])])
             )
-        super().__init__(grammar, tokens, file)
+        super().__init__(
+            grammar,
+            tokens,
+            file,
+            left_rec_loops=left_rec_loops,
+            ll1_rules=ll1_rules,
+            reserved_keywords=self.use_reserved_words,
+        )
         self.skip_actions = skip_actions
-        self.callmakervisitor: PythonCallMakerVisitor = PythonCallMakerVisitor(self)
+        self.fast: bool = fast or inline  # Generate a FastParser subclass
+        self.inline = inline  # Inline memo lookups and token matches
+        self.memoize_all = memoize_all  # Ignore (memo) and memoize every rule
+        self.prune_cuts: bool = prune_cuts  # Prune memo entries at cuts
+        self.memo_policy = memo_policy or {}  # Rule name -> memoize? (overrides the above)
+        self.memoize_involved = memoize_involved  # Memoize non-leaders of left-recursive cycles
+        self.two_pass = two_pass  # Skip invalid_ rules until a first pass fails
+        self.callmakervisitor: PythonCallMakerVisitor
+        if inline:
+            self.callmakervisitor = InlineCallMakerVisitor(self)
+        else:
+            self.callmakervisitor = PythonCallMakerVisitor(self)
+        # Skip alternatives that can't start with the current token, and
+        # parse LL(1) rules predictively; only in a FastParser, since the
+        # others record every token tried for errors.
+        self.first_set_guards = self.fast and first_set_guards
+        self.predictive = False  # Emitting an LL(1) rule predictively
+        self.memo_rule_id: Optional[int] = None  # Rule memoized by the code being emitted
+        self.grow_method: Optional[str] = None  # Method the seeds found are passed to
+        self.rule_ids: Dict[str, int] = {}  # Memo keys, assigned in generation order
 
     def parse_bool(self, value: Optional[str], name: str, default: bool) -> bool:
         if value is None:
@@ -185,6 +310,9 @@ class PythonParserGenerator(ParserGenerator, GrammarVisitor):
                     self.visit(rule)
 
         self.print_keywords()
+        if self.two_pass:
+            with self.indent():
+                self.print("_two_pass = True")
         self.print_trailer()
 
     def print_keywords(self) -> None:
@@ -211,7 +339,14 @@ class PythonParserGenerator(ParserGenerator, GrammarVisitor):
             subheader = self.grammar.metas.get("subheader", "")
             if subheader:
                 self.print(subheader.format(filename=filename))
-        self.print("class GeneratedParser(Parser):")
+        if self.fast:
+            self.print()
+            self.print(FAST_RUNTIME_IMPORT)
+            self.print(INLINE_TOKEN_IMPORT)
+            self.print()
+            self.print("class GeneratedParser(FastParser):")
+        else:
+            self.print("class GeneratedParser(Parser):")
 
     def print_trailer(self) -> None:
         if self.skip_actions:
@@ -221,19 +356,41 @@ class PythonParserGenerator(ParserGenerator, GrammarVisitor):
         if trailer is not None:
             self.print(trailer.rstrip("\n"))
 
+    def rule_id(self, name: str) -> int:
+        if name not in self.rule_ids:
+            self.rule_ids[name] = FIRST_RULE_ID + len(self.rule_ids)
+        return self.rule_ids[name]
+
+    def _should_memoize(self, node: Rule) -> bool:
+        if node.left_rec_loop:
+            return True  # Like the other left-recursive rules
+        if node.left_recursive:
+            return False
+        if node.name in self.memo_policy:
+            return self.memo_policy[node.name]
+        return self.memoize_all or node.memo
+
     def visit_Rule(self, node: Rule) -> None:
         is_loop = node.is_loop()
         is_gather = node.is_gather()
         rhs = node.flatten()
-        if node.left_recursive:
-            if node.leader:
-                self.print("@memoize_left_rec")
-            else:
-                # Non-leader rules in a cycle are not memoized,
-                # but they must still be logged.
+        prefix = "fast_" if self.fast else ""
+        self.memo_rule_id = None
+        self.predictive = node.ll1 and all(
+            self.first_set_guard(alt.items) is not None for alt in rhs.alts
+        )
+        if node.left_recursive and node.leader and not node.left_rec_loop:
+            self.print(f"@{prefix}memoize_left_rec({self.rule_id(node.name)})")
+        elif node.left_recursive and not node.leader and self.memoize_involved:
+            self.print(f"@{prefix}memoize_involved({self.rule_id(node.name)})")
+        elif not self._should_memoize(node):
+            # Rules that are not memoized must still be logged.
+            if not self.fast:
                 self.print("@logger")
+        elif self.inline:
+            self.memo_rule_id = self.rule_id(node.name)
         else:
-            self.print("@memoize")
+            self.print(f"@{prefix}memoize({self.rule_id(node.name)})")
         if self.skip_actions:
             node_type = "NodeType"
         else:
@@ -243,14 +400,151 @@ class PythonParserGenerator(ParserGenerator, GrammarVisitor):
             self.print(f"# {node.name}: {rhs}")
             if node.nullable:
                 self.print(f"# nullable={node.nullable}")
-            self.print("mark = self.mark()")
+            # A predictive rule only resets after a partial match.
+            needs_mark = (
+                not self.predictive
+                or self.memo_rule_id is not None
+                or any(len(alt.items) > 1 for alt in rhs.alts)
+            )
+            if self.inline:
+                self.print("_tokenizer = self._tokenizer")
+                if needs_mark:
+                    self.print("mark = _tokenizer._index")
+                if self.memo_rule_id is not None:
+                    self.print_memo_lookup(self.memo_rule_id)
+            elif needs_mark:
+                self.print("mark = self.mark()")
             if is_loop:
                 self.print("children = []")
-            self.visit(rhs, is_loop=is_loop, is_gather=is_gather)
+            elif node.left_rec_loop:
+                self.print_first_token(rhs.alts[len(left_rec_tails(node)) :])
+            else:
+                self.print_first_token(rhs.alts)
+            if node.left_rec_loop:
+                tails = left_rec_tails(node)
+                self.grow_method = f"_grow_{node.name}"
+                for alt in rhs.alts[len(tails) :]:
+                    self.visit(alt, is_loop=False, is_gather=False)
+                self.grow_method = None
+            elif self.predictive:
+                # The guard on NAME lets keywords through, so the alternative
+                # that can start with one goes after those for keywords.
+                for alt in sorted(
+                    rhs.alts, key=lambda alt: "NAME" in self.first_sets.first_set(alt.items)
+                ):
+                    self.visit(alt, is_loop=False, is_gather=False)
+            else:
+                self.visit(rhs, is_loop=is_loop, is_gather=is_gather)
             if is_loop:
+                if self.memo_rule_id is not None:
+                    self.print(f"_table[{self.memo_rule_id}] = children, _tokenizer._index")
                 self.print("return children")
             else:
+                self.print_failure()
+        self.predictive = False
+        if node.left_rec_loop:
+            self.print()
+            self.print_grow_method(node, node_type)
+
+    def print_grow_method(self, node: Rule, node_type: str) -> None:
+        # Add tails to the seed for as long as one matches and gets further.
+        tails = left_rec_tails(node)
+        self.memo_rule_id = None
+        self.print(f"def _grow_{node.name}(self, _seed: {node_type}) -> Optional[{node_type}]:")
+        with self.indent():
+            self.print(f"# Grow {node.name}: {Rhs(tails)}")
+            if self.inline:
+                self.print("_tokenizer = self._tokenizer")
+            self.print("while True:")
+            with self.indent():
+                if self.inline:
+                    self.print("mark = _tokenizer._index")
+                else:
+                    self.print("mark = self.mark()")
+                self.print_first_token(tails, is_tail=True)
+                for alt in tails:
+                    self.visit(alt, is_loop=False, is_gather=False, is_tail=True)
+                self.print("return _seed")
+
+    def first_set_guard(
+        self, items: Sequence[NamedItem], tok: str = "_first_tok"
+    ) -> Optional[str]:
+        """Return a test on tok that fails if items can't match from it.
+
+        Return None if there's nothing to test, as when items can match
+        the empty string.  The first use of tok is bound to
+        _first_tok, so it can be a call.
+        """
+        if not self.first_set_guards:
+            return None
+        first = self.first_sets.first_set(items)
+        if not first or "" in first:
+            return None
+        types: List[str] = []
+        strings: Set[str] = set()
+        for terminal in sorted(first):
+            if terminal in GUARD_TOKEN_TYPES:
+                types.append(terminal)
+            elif terminal[0] in "'\"":
+                val = ast.literal_eval(terminal)
+                if val in token.__dict__:
+                    return None  # expect() also matches token names.
+                strings.add(val)
+            else:
+                return None  # Some other token, or a helper rule.
+        if tok != "_first_tok":
+            tok = f"(_first_tok := {tok})"
+        tests = []
+        if types:
+            if len(types) == 1:
+                tests.append(f"{tok}.type == {types[0]}")
+            else:
+                tests.append(f"{tok}.type in ({', '.join(types)})")
+            tok = "_first_tok"
+        if strings:
+            if len(strings) == 1:
+                tests.append(f"{tok}.string == {strings.pop()!r}")
+            else:
+                tests.append(f"{tok}.string in {{{', '.join(map(repr, sorted(strings)))}}}")
+        return " or ".join(tests)
+
+    def print_first_token(self, alts: Sequence[Alt], is_tail: bool = False) -> None:
+        # Set _first_tok if some alternative has a first_set_guard().
+        if any(self.first_set_guard(alt.items[is_tail:]) for alt in alts):
+            if self.inline:
+                self.print("_first_tok = _tokenizer.peek()")
+            else:
+                self.print("_first_tok = self._tokenizer.peek()")
+
+    def print_memo_lookup(self, rule_id: int) -> None:
+        # Successes are memoized as (tree, endmark), failures as None.
+        self.print("_table = self._memo.get(mark)")
+        self.print("if _table is None:")
+        with self.indent():
+            self.print("_table = self._memo[mark] = {}")
+        self.print(f"elif {rule_id} in _table:")
+        with self.indent():
+            self.print(f"_entry = _table[{rule_id}]")
+            self.print("if _entry is None:")
+            with self.indent():
                 self.print("return None")
+            self.print("_tree, _tokenizer._index = _entry")
+            self.print("return _tree")
+
+    def print_failure(self) -> None:
+        if self.memo_rule_id is not None:
+            self.print(f"_table[{self.memo_rule_id}] = None")
+        self.print("return None")
+
+    def print_return(self, value: str) -> None:
+        if self.grow_method is not None:
+            value = f"self.{self.grow_method}({value})"
+        if self.memo_rule_id is None:
+            self.print(f"return {value}")
+        else:
+            self.print(f"_tree = {value}")
+            self.print(f"_table[{self.memo_rule_id}] = _tree, _tokenizer._index")
+            self.print("return _tree")
 
     def visit_NamedItem(self, node: NamedItem, is_gather: bool = False) -> None:
         name, call = self.callmakervisitor.visit(node.item)
@@ -270,27 +564,60 @@ class PythonParserGenerator(ParserGenerator, GrammarVisitor):
         for alt in node.alts:
             self.visit(alt, is_loop=is_loop, is_gather=is_gather)
 
-    def visit_Alt(self, node: Alt, is_loop: bool, is_gather: bool) -> None:
+    def visit_Alt(self, node: Alt, is_loop: bool, is_gather: bool, is_tail: bool = False) -> None:
+        items = node.items[1:] if is_tail else node.items
+        if is_loop:
+            # The token changes on each round.
+            peek = "_tokenizer.peek()" if self.inline else "self._tokenizer.peek()"
+            guard = self.first_set_guard(items, peek)
+            if guard is not None and " or " in guard:
+                guard = f"({guard})"
+            self.print_alt(node, is_loop, is_gather, is_tail, guard)
+            return
+        guard = self.first_set_guard(items)
+        if guard is None:
+            self.print_alt(node, is_loop, is_gather, is_tail)
+        else:
+            self.print(f"if {guard}:")
+            with self.indent():
+                self.print_alt(node, is_loop, is_gather, is_tail)
+
+    def print_alt(
+        self,
+        node: Alt,
+        is_loop: bool,
+        is_gather: bool,
+        is_tail: bool,
+        loop_guard: Optional[str] = None,
+    ) -> None:
         with self.local_variable_context():
-            self.print("cut = False")  # TODO: Only if needed.
+            if not is_tail and not self.predictive:
+                self.print("cut = False")  # TODO: Only if needed.
             if is_loop:
                 self.print("while (")
             else:
                 self.print("if (")
             with self.indent():
-                first = True
-                for item in node.items:
-                    if first:
-                        first = False
-                    else:
+                guard = loop_guard
+                if self.two_pass and not is_loop and not is_gather and uses_invalid_rule(node):
+                    guard = "self.call_invalid_rules"
+                if guard is not None:
+                    self.print(guard)
+                for i, item in enumerate(node.items):
+                    if i or guard is not None:
                         self.print("and")
+                    if not i and is_tail:
+                        # The left-recursive call, which gives the seed.
+                        name = item.name or self.callmakervisitor.visit(item.item)[0]
+                        self.print(f"({self.dedupe(name)} := _seed)")
+                        continue
                     self.visit(item, is_gather=is_gather)
             self.print("):")
             with self.indent():
                 action = node.action
                 if self.skip_actions:
                     name = node.rule_name
-                    if name.startswith("incorrect_") or name.startswith("invalid_"):
+                    if is_invalid_rule_name(name):
                         action = "None"  # It's an error rule
                     else:
                         action = None
@@ -304,9 +631,49 @@ class PythonParserGenerator(ParserGenerator, GrammarVisitor):
                         action = f"[{', '.join(self.local_variable_names)}]"
                 if is_loop:
                     self.print(f"children.append({action})")
-                    self.print(f"mark = self.mark()")
+                    if self.inline:
+                        self.print("mark = _tokenizer._index")
+                    else:
+                        self.print(f"mark = self.mark()")
+                elif is_tail:
+                    self.print_new_seed(action)
                 else:
-                    self.print(f"return {action}")
-            self.print("self.reset(mark)")
+                    self.print_return(action)
+            if self.predictive:
+                # No other alternative can match, so fail right away.
+                if len(node.items) > 1:
+                    self.print_reset()
+                self.print_failure()
+                return
+            self.print_reset()
             # Skip remaining alternatives if a cut was reached.
-            self.print("if cut: return None")  # TODO: Only if needed.
+            if is_tail:
+                pass  # Tails have no cuts
+            elif self.memo_rule_id is None:
+                self.print("if cut: return None")  # TODO: Only if needed.
+            else:
+                self.print("if cut:")
+                with self.indent():
+                    self.print_failure()
+
+    def print_reset(self) -> None:
+        if self.inline:
+            self.print("_tokenizer._index = mark")
+        else:
+            self.print("self.reset(mark)")
+
+    def print_new_seed(self, action: str) -> None:
+        # Like memoize_left_rec(), stop at a false tree or one that gets no further.
+        self.print(f"_tree = {action}")
+        if self.inline:
+            self.print("if not _tree or _tokenizer._index <= mark:")
+        else:
+            self.print("if not _tree or self.mark() <= mark:")
+        with self.indent():
+            if self.inline:
+                self.print("_tokenizer._index = mark")
+            else:
+                self.print("self.reset(mark)")
+            self.print("return _seed")
+        self.print("_seed = _tree")
+        self.print("continue")
@@ -13,7 +13,7 @@ from pegen.build import compile_c_extension
 from pegen.c_generator import CParserGenerator
 from pegen.grammar import Grammar
 from pegen.grammar_parser import GeneratedParser as GrammarParser
-from pegen.parser import Parser
+from pegen.parser import make_dummy_token_type, Parser
 from pegen.python_generator import PythonParserGenerator
 from pegen.tokenizer import Mark, Tokenizer
 
@@ -42,7 +42,7 @@ def run_parser(file: IO[bytes], parser_class: Type[Parser], *, verbose: bool = F
     # Run a parser on a file (stream).
     tokenizer = Tokenizer(tokenize.generate_tokens(file.readline))  # type: ignore # typeshed issue #3515
     parser = parser_class(tokenizer, verbose=verbose)
-    result = parser.start()
+    result = parser.parse_rule()
     if result is None:
         raise parser.make_syntax_error()
     return result
@@ -77,15 +77,17 @@ def import_file(full_name: str, path: str) -> Any:
     return mod
 
 
-def generate_c_parser_source(grammar: Grammar) -> str:
+def generate_c_parser_source(grammar: Grammar, two_pass: bool = False) -> str:
     out = io.StringIO()
-    genr = CParserGenerator(grammar, ALL_TOKENS, EXACT_TOKENS, NON_EXACT_TOKENS, out)
+    genr = CParserGenerator(
+        grammar, ALL_TOKENS, EXACT_TOKENS, NON_EXACT_TOKENS, out, two_pass=two_pass
+    )
     genr.generate("<string>")
     return out.getvalue()
 
 
 def generate_parser_c_extension(
-    grammar: Grammar, path: pathlib.PurePath, debug: bool = False
+    grammar: Grammar, path: pathlib.PurePath, debug: bool = False, two_pass: bool = False
 ) -> Any:
     """Generate a parser c extension for the given grammar in the given path
 
@@ -100,7 +102,13 @@ def generate_parser_c_extension(
     source = path / "parse.c"
     with open(source, "w", encoding="utf-8") as file:
         genr = CParserGenerator(
-            grammar, ALL_TOKENS, EXACT_TOKENS, NON_EXACT_TOKENS, file, debug=debug
+            grammar,
+            ALL_TOKENS,
+            EXACT_TOKENS,
+            NON_EXACT_TOKENS,
+            file,
+            debug=debug,
+            two_pass=two_pass,
         )
         genr.generate("parse.c")
     extension_path = compile_c_extension(str(source), build_dir=str(path / "build"))
@@ -160,7 +168,7 @@ def recovery_by_insertions(
     howfar: Dict[Mark, List[tokenize.TokenInfo]] = {}
     initial_reach = parser.get_reach()
     pos = initial_reach - 1
-    got = tokenizer._tokens[pos]
+    got = tokenizer.lookup(pos)
     for i in range(limit):
         parser.reset(0)
         save_reach = parser.reset_reach(0)
@@ -187,6 +195,22 @@ def recovery_by_insertions(
     return (got, reach, expected, howfar)
 
 
+def expected_tokens(parser: Parser) -> List[tokenize.TokenInfo]:
+    """Return the tokens the failed parse tried at its furthest token, as dummy tokens.
+
+    Unlike recovery_by_insertions() this doesn't parse again, but it
+    doesn't check which of these would get the parse further either.
+    """
+    pos, expected = parser.get_expected()
+    if pos != parser.get_reach() - 1:
+        return []
+    return sorted(
+        tokenize.TokenInfo(make_dummy_token_type(type), type, (0, 0), (0, 0), "")
+        for type in expected
+        if type != "TYPE_COMMENT"  # The tokenize module never produces these.
+    )
+
+
 def recovery_by_deletions(
     parser: Parser, limit: int = 2
 ) -> List[Tuple[tokenize.TokenInfo, int, Mark, Mark]]:
@@ -199,7 +223,7 @@ def recovery_by_deletions(
         pos = orig_pos - i
         if pos < 0:
             break
-        if parser._tokenizer._tokens[pos].type in (token.ENDMARKER, token.ERRORTOKEN):
+        if tokenizer.lookup(pos).type in (token.ENDMARKER, token.ERRORTOKEN):
             continue
         parser.reset(0)
         parser.reset_reach(0)
@@ -215,21 +239,32 @@ def recovery_by_deletions(
 
 
 def make_improved_syntax_error(
-    parser: Parser, filename: str = "<unknown>", *, limit: int = 100
+    parser: Parser, filename: str = "<unknown>", *, limit: int = 100, reparse: bool = True
 ) -> SyntaxError:
+    """Turn the failure of parser into a more helpful SyntaxError.
+
+    By default this parses the input again up to limit times, to find
+    out which tokens would get the parse further.  With reparse=False
+    it only uses what the failed parse tried (see expected_tokens()),
+    which is much faster but gives longer lists.
+    """
     err = parser.make_syntax_error(filename)
 
     if not isinstance(err, SyntaxError):
         return err
 
-    got, reach, expected, howfar = recovery_by_insertions(parser, limit=limit)
+    if reparse:
+        got, reach, expected, howfar = recovery_by_insertions(parser, limit=limit)
+    else:
+        got = parser._tokenizer.diagnose()
+        expected = expected_tokens(parser)
 
     if got.type == token.INDENT and len(expected) > 10:  # 10 is pretty arbitrary
         return IndentationError("unexpected indent", *err.args[1:])
     if len(expected) == 1 and expected[0].type == token.INDENT:
         return IndentationError("expected an indented block", *err.args[1:])
 
-    deletions = recovery_by_deletions(parser, limit=1)
+    deletions = recovery_by_deletions(parser, limit=1) if reparse else []
     if deletions:
         d_tok, d_index, d_pos, d_reach = deletions[0]
         if d_reach >= reach:
@@ -237,7 +272,7 @@ def make_improved_syntax_error(
                 f"invalid syntax (unexpected token {describe_token(d_tok, parser)})"
             )
 
-    if isinstance(err, SyntaxError) and err.msg == "pegen parse failure":
+    if isinstance(err, SyntaxError) and err.msg == "pegen parse failure" and expected:
         expected_strings = ", ".join([describe_token(tok, parser) for tok in expected])
         return err.__class__(f"invalid syntax (expected one of {expected_strings})", *err.args[1:])
 
@@ -1,6 +1,6 @@
 import token
 import tokenize
-from typing import Any, List, Iterator
+from typing import Any, Callable, List, Iterator, Optional, Tuple
 
 Mark = int  # NewType('Mark', int)
 
@@ -29,27 +29,35 @@ class Tokenizer:
     def __init__(self, tokengen: Iterator[tokenize.TokenInfo], *, verbose: bool = False):
         self._tokengen = tokengen
         self._tokens = []
+        self._offset = 0  # Position of _tokens[0]; earlier tokens were evicted
         self._index = 0
         self._reach = 0
         self._verbose = verbose
+        # Sliding window: each time this many tokens have been fetched,
+        # call _window_hook with the position this many tokens back.
+        self._window = 0
+        self._window_hook: Optional[Callable[[Mark], None]] = None
+        self._window_count = 0
+        # Edit overlay: from _edit_pos on, positions are shifted by the
+        # inserted token (if _inserted is set) or the deleted one.
+        self._edit_pos: Optional[Mark] = None
+        self._inserted: Optional[tokenize.TokenInfo] = None
         if verbose:
             self.report(False, False)
 
     def getnext(self) -> tokenize.TokenInfo:
         """Return the next token and updates the index."""
         cached = True
-        while self._index == len(self._tokens):
-            try:
-                tok = next(self._tokengen)
-            except (IndentationError, tokenize.TokenError) as err:
-                tok = self.fix_token_error(err)
-            if tok.type in (tokenize.NL, tokenize.COMMENT):
-                continue
-            if tok.type == token.ERRORTOKEN and tok.string.isspace():
-                continue
-            self._tokens.append(tok)
-            cached = False
-        tok = self._tokens[self._index]
+        if self._edit_pos is None:
+            while self._index - self._offset == len(self._tokens):
+                self.fetch()
+                cached = False
+            index = self._index - self._offset
+            if index < 0:
+                raise self.evicted_error(self._index)
+            tok = self._tokens[index]
+        else:
+            tok = self.lookup(self._index)
         self._index += 1
         self._reach = max(self._reach, self._index)
         if self._verbose:
@@ -58,7 +66,66 @@ class Tokenizer:
 
     def peek(self) -> tokenize.TokenInfo:
         """Return the next token *without* updating the index."""
-        while self._index == len(self._tokens):
+        self._reach = max(self._reach, self._index + 1)
+        if self._edit_pos is not None:
+            return self.lookup(self._index)
+        while self._index - self._offset == len(self._tokens):
+            self.fetch()
+        index = self._index - self._offset
+        if index < 0:
+            raise self.evicted_error(self._index)
+        return self._tokens[index]
+
+    def lookup(self, pos: Mark) -> tokenize.TokenInfo:
+        """Return the token at pos, taking the edit overlay into account."""
+        if self._edit_pos is not None and pos >= self._edit_pos:
+            if self._inserted is not None:
+                if pos == self._edit_pos:
+                    return self._inserted
+                pos -= 1
+            else:
+                pos += 1
+        while pos - self._offset >= len(self._tokens):
+            self.fetch()
+        if pos < self._offset:
+            raise self.evicted_error(pos)
+        return self._tokens[pos - self._offset]
+
+    def insert_token(self, pos: Mark, tok: tokenize.TokenInfo) -> None:
+        """Pretend tok comes right before the token at pos, until undo_edit()."""
+        assert self._edit_pos is None, "Only one edit at a time"
+        assert pos >= self._offset
+        self._edit_pos = pos
+        self._inserted = tok
+
+    def delete_token(self, pos: Mark) -> tokenize.TokenInfo:
+        """Pretend the token at pos isn't there, until undo_edit(); return it."""
+        assert self._edit_pos is None, "Only one edit at a time"
+        tok = self.lookup(pos)
+        self._edit_pos = pos
+        return tok
+
+    def undo_edit(self) -> Optional[tokenize.TokenInfo]:
+        """Drop the edit overlay, if any; return the token inserted or deleted."""
+        if self._edit_pos is None:
+            return None
+        pos = self._edit_pos
+        tok = self._inserted
+        self._edit_pos = None
+        self._inserted = None
+        if tok is None:
+            tok = self.lookup(pos)
+        return tok
+
+    def get_edit(self) -> Optional[Tuple[Mark, Optional[tokenize.TokenInfo]]]:
+        """Return the position of the edit and the inserted token (None for a deletion)."""
+        if self._edit_pos is None:
+            return None
+        return self._edit_pos, self._inserted
+
+    def fetch(self) -> None:
+        """Append the next significant token from the token generator."""
+        while True:
             try:
                 tok = next(self._tokengen)
             except (IndentationError, tokenize.TokenError) as err:
@@ -67,9 +134,38 @@ class Tokenizer:
                 continue
             if tok.type == token.ERRORTOKEN and tok.string.isspace():
                 continue
-            self._tokens.append(tok)
-        self._reach = max(self._reach, self._index + 1)
-        return self._tokens[self._index]
+            break
+        self._tokens.append(tok)
+        if self._window_hook is not None:
+            self._window_count += 1
+            if self._window_count == self._window:
+                self._window_count = 0
+                self._window_hook(self._index - self._window)
+
+    def evict(self, pos: Mark) -> None:
+        """Forget the tokens before pos.
+
+        Resetting to an earlier position is still allowed, but looking
+        at an evicted token raises IndexError.
+        """
+        count = pos - self._offset
+        if count > 0:
+            del self._tokens[:count]
+            self._offset = pos
+
+    def set_window(self, window: int, hook: Callable[[Mark], None]) -> None:
+        """Call hook(pos) each time window tokens have been fetched, pos being window tokens back.
+
+        The hook can't evict the tokens before pos, unless it knows the
+        parser won't backtrack that far.
+        """
+        assert window > 0
+        self._window = window
+        self._window_hook = hook
+        self._window_count = 0
+
+    def evicted_error(self, pos: Mark) -> IndexError:
+        return IndexError(f"token {pos} was evicted (oldest kept is {self._offset})")
 
     def fix_token_error(self, err: Exception) -> tokenize.TokenInfo:
         msg = err.args[0]
@@ -83,8 +179,10 @@ class Tokenizer:
             raise err
 
     def diagnose(self) -> tokenize.TokenInfo:
-        if 1 <= self._reach <= len(self._tokens):
-            return self._tokens[self._reach - 1]
+        if self._edit_pos is not None and self._reach > self._offset:
+            return self.lookup(self._reach - 1)
+        if self._offset < self._reach <= self._offset + len(self._tokens):
+            return self._tokens[self._reach - 1 - self._offset]
         # Fall back on last token seen.  TODO: When does this get called?
         assert False, "Shouldn't get here"
         if not self._tokens:
@@ -97,7 +195,8 @@ class Tokenizer:
     def reset(self, index: Mark) -> None:
         if index == self._index:
             return
-        assert 0 <= index <= len(self._tokens), (index, len(self._tokens))
+        limit = self._offset + len(self._tokens) + (self._inserted is not None)
+        assert 0 <= index <= limit, (index, len(self._tokens))
         old_index = self._index
         self._index = index
         if self._verbose:
@@ -123,6 +222,8 @@ class Tokenizer:
             fill = "-" * self._index + "*"
         if self._index == 0:
             print(f"{fill} (Bof)")
+        elif self._index <= self._offset:
+            print(f"{fill} (evicted)")
         else:
-            tok = self._tokens[self._index - 1]
+            tok = self.lookup(self._index - 1)
             print(f"{fill} {shorttok(tok)}")
@@ -1,27 +1,38 @@
 #!/usr/bin/env python3.8
 """Find the maximum amount of nesting for an expression that can be parsed
-without causing a parse error.
+without causing a parse error, and how long parsing takes per level.
 
-Starting at the INITIAL_NESTING_DEPTH, an expression containing n parenthesis
-around a 0 is generated then tested with both the C and Python parsers. We
-continue incrementing the number of parenthesis by 10 until both parsers have
-failed. As soon as a single parser fails, we stop testing that parser.
+An expression containing n parenthesis around a 0 is generated then tested
+with both the C and Python parsers (the latter is data/python_parser.py,
+generated from the same grammar without actions).  Starting at
+INITIAL_NESTING_DEPTH, n is doubled until a parser fails, then the largest n
+that works is narrowed down to within NESTED_INCR_AMT by bisection.  The time of each successful parse is
+printed along with the time per level of nesting.
 
-The grammar file, initial nesting size, and amount by which the nested size is
-incremented on each success can be controlled by changing the GRAMMAR_FILE,
-INITIAL_NESTING_DEPTH, or NESTED_INCR_AMT variables.
+With --deep, each parse runs through pegen.parser.run_deep(), on a thread
+with a large stack and a recursion limit to match (--frame-size bytes of
+stack per Python call).
 
-Usage: python -m scripts.find_max_nesting
+The grammar file, initial nesting size, and precision can be controlled by
+changing the GRAMMAR_FILE, INITIAL_NESTING_DEPTH, or NESTED_INCR_AMT
+variables.
+
+Usage: python -m scripts.find_max_nesting [--deep] [--stack-size MIB] [--frame-size BYTES]
+                                         [--skip-c]
 """
-import os
+import argparse
 import sys
+import time
 from tempfile import TemporaryDirectory
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable, Dict, Optional
 
 sys.path.insert(0, ".")
 from pegen.build import build_parser
-from pegen.testutil import generate_parser, generate_parser_c_extension, make_parser, parse_string
+from pegen.parser import run_deep, STACK_BYTES_PER_FRAME
+from pegen.testutil import generate_parser_c_extension, parse_string
+
+from data.python_parser import GeneratedParser  # type: ignore
 
 GRAMMAR_FILE = "data/python.gram"
 INITIAL_NESTING_DEPTH = 10
@@ -31,46 +42,89 @@ NESTED_INCR_AMT = 10
 FAIL = "\033[91m"
 ENDC = "\033[0m"
 
-
-def check_nested_expr(nesting_depth: int, parser: Any, language: str) -> bool:
+argparser = argparse.ArgumentParser(
+    prog="find_max_nesting",
+    description="Find how deeply nested expressions the parsers handle",
+)
+argparser.add_argument("--deep", action="store_true", help="Parse using run_deep()")
+argparser.add_argument(
+    "--stack-size", type=int, default=512, metavar="MIB", help="Stack size for --deep in MiB"
+)
+argparser.add_argument(
+    "--frame-size",
+    type=int,
+    default=STACK_BYTES_PER_FRAME,
+    metavar="BYTES",
+    help="Stack per Python call for --deep, which sets the recursion limit",
+)
+argparser.add_argument("--skip-c", action="store_true", help="Only test the Python parser")
+
+
+def check_nested_expr(
+    nesting_depth: int, parse: Callable[[str], Any], language: str
+) -> Optional[float]:
+    """Parse an expression nested nesting_depth deep; return the time taken or None."""
     expr = f"{'(' * nesting_depth}0{')' * nesting_depth}"
 
     try:
-        if language == "Python":
-            parse_string(expr, parser)
-        else:
-            parser.parse_string(expr)
+        t0 = time.perf_counter()
+        parse(expr)
+        dt = time.perf_counter() - t0
 
-        print(f"({language}) Nesting depth of {nesting_depth} is successful")
+        print(
+            f"({language}) Nesting depth of {nesting_depth} is successful: "
+            f"{dt:.3f} sec, {dt / nesting_depth * 1e6:.1f} usec/level"
+        )
 
-        return True
+        return dt
     except Exception as err:
         print(f"{FAIL}({language}) Failed with nesting depth of {nesting_depth}{ENDC}")
-        print(f"{FAIL}\t{err}{ENDC}")
-        return False
+        print(f"{FAIL}\t{err.__class__.__name__}: {str(err)[:100]}{ENDC}")
+        return None
+
+
+def find_max_depth(parse: Callable[[str], Any], language: str) -> int:
+    good, bad = 0, INITIAL_NESTING_DEPTH
+    while check_nested_expr(bad, parse, language) is not None:
+        good, bad = bad, bad * 2
+    while bad - good > NESTED_INCR_AMT:
+        mid = (good + bad) // 2
+        if check_nested_expr(mid, parse, language) is not None:
+            good = mid
+        else:
+            bad = mid
+    return good
 
 
 def main() -> None:
+    args = argparser.parse_args()
     print(f"Testing {GRAMMAR_FILE} starting at nesting depth of {INITIAL_NESTING_DEPTH}...")
 
     with TemporaryDirectory() as tmp_dir:
-        nesting_depth = INITIAL_NESTING_DEPTH
         rules, parser, tokenizer = build_parser(GRAMMAR_FILE)
-        python_parser = generate_parser(rules)
-        c_parser = generate_parser_c_extension(rules, Path(tmp_dir))
-
-        c_succeeded = True
-        python_succeeded = True
-
-        while c_succeeded or python_succeeded:
-            expr = f"{'(' * nesting_depth}0{')' * nesting_depth}"
-
-            if c_succeeded:
-                c_succeeded = check_nested_expr(nesting_depth, c_parser, "C")
-            if python_succeeded:
-                python_succeeded = check_nested_expr(nesting_depth, python_parser, "Python")
-
-            nesting_depth += NESTED_INCR_AMT
+        parsers: Dict[str, Callable[[str], Any]] = {
+            "Python": lambda expr: parse_string(expr, GeneratedParser)
+        }
+        if not args.skip_c:
+            c_parser = generate_parser_c_extension(rules, Path(tmp_dir))
+            parsers["C"] = c_parser.parse_string
+
+        def deep(parse: Callable[[str], Any]) -> Callable[[str], Any]:
+            def parse_deep(expr: str) -> Any:
+                return run_deep(
+                    lambda: parse(expr),
+                    stack_size=args.stack_size * 1024 * 1024,
+                    frame_size=args.frame_size,
+                )
+
+            return parse_deep
+
+        results = {}
+        for language, parse in parsers.items():
+            results[language] = find_max_depth(deep(parse) if args.deep else parse, language)
+
+        for language, depth in results.items():
+            print(f"({language}) Maximum nesting depth: {depth}")
 
         sys.exit(1)
 
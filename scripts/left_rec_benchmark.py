@@ -0,0 +1,118 @@
+#!/usr/bin/env python3.8
+
+"""Compare the handling of indirect left recursion in the generated Python parser.
+
+A left-recursive cycle is grown by its leader; the other rules in the
+cycle used to be called afresh every time (only the leader was
+memoized), and are now memoized within each growth iteration of their
+leader.  This script generates parsers for data/indirect.gram both ways
+(memoize_involved off and on), for the default, fast and inline
+backends, and parses a generated expression of TERMS terms with each.
+
+For each variant it reports the parse time (best of a few runs) and the
+number of calls of the rules that are never memoized (a measure of the
+work redone), and checks that both ways give the same tree.
+
+Usage: python -m scripts.left_rec_benchmark [-r REPEAT] [-n TERMS]
+"""
+
+import argparse
+import gc
+import io
+import os
+import random
+import sys
+import time
+import tokenize
+
+from typing import Any, Dict, List, Tuple, Type
+
+sys.path.insert(0, os.getcwd())
+from pegen.build import build_parser
+from pegen.parser import Parser
+from pegen.python_generator import PythonParserGenerator
+from pegen.tokenizer import Tokenizer
+
+GRAMMAR_FILE = "data/indirect.gram"
+UNMEMOIZED_RULES = ["factor", "atom"]
+
+argparser = argparse.ArgumentParser(
+    prog="left_rec_benchmark", description="Compare handling of indirect left recursion"
+)
+argparser.add_argument("-r", "--repeat", type=int, default=3, help="Timing runs per variant")
+argparser.add_argument("-n", "--terms", type=int, default=2000, help="Terms in the expression")
+
+
+def make_parser_class(**options: Any) -> Type[Parser]:
+    grammar, parser, tokenizer = build_parser(GRAMMAR_FILE)
+    out = io.StringIO()
+    genr = PythonParserGenerator(grammar, out, **options)
+    genr.generate(GRAMMAR_FILE)
+    ns: Dict[str, Any] = {}
+    exec(out.getvalue(), ns)
+    return ns["GeneratedParser"]
+
+
+def make_counting_class(parser_class: Type[Parser]) -> Type[Parser]:
+    """Subclass parser_class to count calls of the UNMEMOIZED_RULES."""
+    namespace: Dict[str, Any] = {}
+    for name in UNMEMOIZED_RULES:
+
+        def counted(self: Any, *, _method: Any = getattr(parser_class, name)) -> Any:
+            self.calls += 1
+            return _method(self)
+
+        namespace[name] = counted
+    namespace["calls"] = 0
+    return type("CountingParser", (parser_class,), namespace)
+
+
+def make_expression(terms: int) -> str:
+    rng = random.Random(terms)
+    parts = []
+    for i in range(terms):
+        if i:
+            parts.append(rng.choice("+-<>*/%"))
+        atom = rng.choice(["x", "1", "-y", "(a + b * c)"])
+        parts.append(atom)
+    return " ".join(parts) + "\n"
+
+
+def parse(parser_class: Type[Parser], text: str) -> Tuple[float, Any, Parser]:
+    gc.collect()
+    t0 = time.perf_counter()
+    tokenizer = Tokenizer(tokenize.generate_tokens(io.StringIO(text).readline))
+    parser = parser_class(tokenizer)
+    tree = parser.start()
+    t1 = time.perf_counter()
+    if tree is None:
+        raise parser.make_syntax_error("<expression>")
+    return t1 - t0, tree, parser
+
+
+def main() -> None:
+    args = argparser.parse_args()
+    # Comparing the (deeply nested) trees recurses once per term.
+    sys.setrecursionlimit(max(sys.getrecursionlimit(), 10 * args.terms))
+    text = make_expression(args.terms)
+    print(f"{'variant':10} {'involved':>8} {'time (s)':>10} {'calls':>10}")
+    variants: List[Tuple[str, Dict[str, Any]]] = [
+        ("default", {}),
+        ("fast", {"fast": True}),
+        ("inline", {"inline": True}),
+    ]
+    for name, options in variants:
+        trees: List[Any] = []
+        for involved in False, True:
+            parser_class = make_parser_class(memoize_involved=involved, **options)
+            times = [parse(parser_class, text)[0] for i in range(args.repeat)]
+            dt, tree, parser = parse(make_counting_class(parser_class), text)
+            trees.append(tree)
+            print(f"{name:10} {str(involved):>8} {min(times):10.3f} {parser.calls:10}")  # type: ignore
+        if trees[0] != trees[1]:
+            print(f"{name}: the trees differ!")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
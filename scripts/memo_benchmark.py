@@ -0,0 +1,379 @@
+#!/usr/bin/env python3.8
+
+"""Compare memo strategies of the generated Python parser.
+
+For each input file and each variant this reports the parse time (best
+of a few runs), the number of memo entries left at the end of the parse
+(failures kept as bits count as entries), the memory used by those
+entries (the tables, the records and the failure bits, but not the
+trees) and the peak memory traced by tracemalloc (in a separate run,
+since tracing slows down the parse a lot).
+
+Variants:
+
+- legacy: a single dict keyed by (mark, method name, args) tuples (a
+  copy of the wrappers pegen.parser used before it got per-position
+  tables, minus the tracing output);
+- all: the per-position tables with integer rule IDs, memoizing every
+  rule (--memoize-all);
+- default: the same, memoizing only the rules marked (memo);
+- fast: a FastParser subclass (no tracing, reach or dummy-token hooks);
+- inline: a FastParser subclass with memo lookups and token matches
+  inlined into the rule methods;
+- default+commit, inline+commit: evicting memo entries and tokens at
+  the start of each top-level statement;
+- default+window, inline+window: evicting memo entries (but not tokens)
+  more than WINDOW tokens back;
+- default+stream, inline+stream: using Parser.iter_parse() to get one
+  statement at a time, which is then dropped;
+- all+cut, default+cut, inline+cut: generated with prune_cuts, deleting
+  memo entries made obsolete by a cut;
+- adaptive: the all variant with an AdaptiveMemoPolicy, learning during
+  the first run (over 20000 lookups) and frozen after that;
+- policy, inline+policy: generated with the memo policy learned by
+  parsing data/medium.txt with the adaptive variant.
+
+It also reports the time until the first tree is available.  With
+--peak-entries it also reports the largest number of memo entries seen
+(sampled every 1024 tokens, in a separate run).
+
+The legacy variant memoizes every rule, like pegen used to, and stores
+failures as full records, like every variant used to.  The
+--synthetic option adds a file of about the given size in MiB made of
+copies of data/large.txt.
+
+Usage: python -m scripts.memo_benchmark [-r REPEAT] [--no-memory] [--window WINDOW]
+                                       [--variant NAME ...] [--synthetic MIB] [file ...]
+"""
+
+import argparse
+import io
+import os
+import sys
+import tempfile
+import time
+import tokenize
+import tracemalloc
+
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type
+
+sys.path.insert(0, os.getcwd())
+from pegen.build import build_parser
+from pegen.parser import Parser, load_memo_policy, make_adaptive_parser_class
+from pegen.python_generator import PythonParserGenerator
+from pegen.tokenizer import Mark, Tokenizer
+
+GRAMMAR_FILE = "data/python.gram"
+DEFAULT_FILES = ["data/large.txt", "data/xl.txt"]
+
+argparser = argparse.ArgumentParser(
+    prog="memo_benchmark", description="Compare memo strategies of the generated Python parser"
+)
+argparser.add_argument("files", nargs="*", default=DEFAULT_FILES, help="Files to parse")
+argparser.add_argument("-r", "--repeat", type=int, default=3, help="Timing runs per file")
+argparser.add_argument(
+    "--no-memory", action="store_true", help="Skip the (slow) tracemalloc measurement"
+)
+argparser.add_argument(
+    "--window", type=int, default=1000, help="Window size (in tokens) of the +window variants"
+)
+argparser.add_argument(
+    "--peak-entries", action="store_true", help="Also sample the peak number of memo entries"
+)
+argparser.add_argument(
+    "--variant",
+    action="append",
+    dest="variants",
+    metavar="NAME",
+    help="Variant to run (repeatable; default all)",
+)
+argparser.add_argument(
+    "--synthetic", type=float, metavar="MIB", help="Also parse a synthetic file of this size"
+)
+
+
+def make_parser_class(**options: Any) -> Type[Parser]:
+    grammar, parser, tokenizer = build_parser(GRAMMAR_FILE)
+    out = io.StringIO()
+    genr = PythonParserGenerator(grammar, out, skip_actions=True, **options)
+    genr.generate(GRAMMAR_FILE)
+    ns: Dict[str, Any] = {}
+    exec(out.getvalue(), ns)
+    return ns["GeneratedParser"]
+
+
+def legacy_memoize(method: Callable[..., Any]) -> Callable[..., Any]:
+    method_name = method.__name__
+
+    def legacy_memoize_wrapper(self: Any, *args: object) -> Any:
+        mark = self.mark()
+        key = mark, method_name, args
+        # Fast path: cache hit, and not verbose.
+        if key in self._cache and not self._verbose:
+            tree, endmark, reach = self._cache[key]
+            self.reset(endmark)
+            self.update_reach(reach)
+            return tree
+        # Slow path: no cache hit, or verbose.
+        argsr = ",".join(repr(arg) for arg in args)
+        fill = "  " * self._level
+        if key not in self._cache:
+            self._level += 1
+            prior_reach = self.reset_reach(mark)
+            tree = method(self, *args)
+            reach = self.reset_reach(prior_reach)
+            self.update_reach(reach)
+            self._level -= 1
+            endmark = self.mark()
+            self._cache[key] = tree, endmark, reach
+        else:
+            tree, endmark, reach = self._cache[key]
+            self.reset(endmark)
+            self.update_reach(reach)
+        return tree
+
+    return legacy_memoize_wrapper
+
+
+def legacy_memoize_left_rec(method: Callable[..., Any]) -> Callable[..., Any]:
+    method_name = method.__name__
+
+    def legacy_memoize_left_rec_wrapper(self: Any) -> Any:
+        mark = self.mark()
+        key = mark, method_name, ()
+        # Fast path: cache hit, and not verbose.
+        if key in self._cache and not self._verbose:
+            tree, endmark, reach = self._cache[key]
+            self.reset(endmark)
+            self.update_reach(reach)
+            return tree
+        # Slow path: no cache hit, or verbose.
+        fill = "  " * self._level
+        if key not in self._cache:
+            self._level += 1
+            # Prime the cache with a failure.
+            self._cache[key] = None, mark, mark
+            lastresult, lastmark = None, mark
+            while True:
+                self.reset(mark)
+                prior_reach = self.reset_reach(mark)
+                result = method(self)
+                endmark = self.mark()
+                reach = self.reset_reach(prior_reach)
+                self.update_reach(reach)
+                if not result or endmark <= lastmark:
+                    break
+                self._cache[key] = lastresult, lastmark, reach = result, endmark, reach
+            self.reset(lastmark)
+            self.update_reach(reach)
+            tree = lastresult
+            self._level -= 1
+            if tree:
+                endmark = self.mark()
+            else:
+                endmark = mark
+                self.reset(endmark)
+            self._cache[key] = tree, endmark, reach
+        else:
+            tree, endmark, reach = self._cache[key]
+            if tree:
+                self.reset(endmark)
+        return tree
+
+    return legacy_memoize_left_rec_wrapper
+
+
+LEGACY_WRAPPERS = {
+    "memoize_wrapper": legacy_memoize,
+    "memoize_left_rec_wrapper": legacy_memoize_left_rec,
+}
+
+
+def make_legacy_class(parser_class: Type[Parser]) -> Type[Parser]:
+    """Re-wrap every memoized method of parser_class with the legacy dict memo."""
+    namespace: Dict[str, Any] = {}
+    for klass in reversed(parser_class.__mro__):
+        for name, value in vars(klass).items():
+            wrapper = LEGACY_WRAPPERS.get(getattr(value, "__name__", ""))
+            if wrapper is not None:
+                namespace[name] = wrapper(value.__wrapped__)
+
+    def __init__(self: Any, tokenizer: Tokenizer, *, verbose: bool = False) -> None:
+        parser_class.__init__(self, tokenizer, verbose=verbose)
+        cache: Dict[Tuple[Mark, str, Tuple[Any, ...]], Tuple[Any, Mark, Mark]] = {}
+        self._cache = cache
+
+    def memo_size(self: Any) -> int:
+        return len(self._cache)
+
+    namespace["__init__"] = __init__
+    namespace["memo_size"] = memo_size
+    return type("LegacyParser", (parser_class,), namespace)
+
+
+Variant = Tuple[Type[Parser], Dict[str, Any]]  # Parser class and its keyword arguments
+
+
+def memo_bytes(parser: Parser) -> int:
+    """Return the size of the memo of parser, not counting the trees."""
+    cache = getattr(parser, "_cache", None)
+    if cache is not None:
+        return sys.getsizeof(cache) + sum(
+            sys.getsizeof(key) + sys.getsizeof(entry) for key, entry in cache.items()
+        )
+    size = sys.getsizeof(parser._memo)
+    for table in parser._memo.values():
+        size += sys.getsizeof(table)
+        for entry in table.values():
+            size += sys.getsizeof(entry)
+    size += sys.getsizeof(parser._failures)
+    for bits in parser._failures.values():
+        size += sys.getsizeof(bits)
+    return size
+
+
+def parse_file(filename: str, variant: Variant) -> Tuple[float, float, int, int]:
+    parser_class, kwargs = variant
+    kwargs = dict(kwargs)
+    stream = kwargs.pop("stream", False)
+    with open(filename) as file:
+        t0 = time.perf_counter()
+        tokenizer = Tokenizer(tokenize.generate_tokens(file.readline))
+        parser = parser_class(tokenizer, **kwargs)
+        if stream:
+            first = None
+            for tree in parser.iter_parse("statement", filename):
+                if first is None:
+                    first = time.perf_counter()
+        else:
+            tree = parser.start()
+            if tree is None:
+                raise parser.make_syntax_error(filename)
+            first = time.perf_counter()
+        t1 = time.perf_counter()
+    return t1 - t0, (first or t1) - t0, parser.memo_size(), memo_bytes(parser)
+
+
+def peak_memory(filename: str, variant: Variant) -> int:
+    tracemalloc.start()
+    try:
+        parse_file(filename, variant)
+        current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak
+
+
+class SamplingTokenizer(Tokenizer):
+    """Tokenizer recording the memo size of its parser every 1024 tokens."""
+
+    parser: Optional[Parser] = None
+    peak = 0
+
+    def fetch(self) -> None:
+        super().fetch()
+        if self.parser is not None and (self._offset + len(self._tokens)) % 1024 == 0:
+            self.peak = max(self.peak, self.parser.memo_size())
+
+
+def peak_entries(filename: str, variant: Variant) -> int:
+    parser_class, kwargs = variant
+    with open(filename) as file:
+        tokenizer = SamplingTokenizer(tokenize.generate_tokens(file.readline))
+        parser = parser_class(tokenizer, **kwargs)
+        tokenizer.parser = parser
+        parser.start()
+    return max(tokenizer.peak, parser.memo_size())
+
+
+def learn_memo_policy(parser_class: Type[Parser], filename: str) -> Dict[str, bool]:
+    adaptive = make_adaptive_parser_class(parser_class, warmup=sys.maxsize)
+    parse_file(filename, (adaptive, {}))
+    policy = adaptive._memo_policy
+    assert policy is not None
+    policy.freeze()
+    out = io.StringIO()
+    policy.dump(out)
+    return load_memo_policy(io.StringIO(out.getvalue()))
+
+
+def make_variants(window: int) -> Dict[str, Variant]:
+    memoize_all = make_parser_class(memoize_all=True)
+    default = make_parser_class()
+    inline = make_parser_class(inline=True)
+    commit = {"commit_rule": "statement"}
+    memo_policy = learn_memo_policy(memoize_all, "data/medium.txt")
+    return {
+        "legacy": (make_legacy_class(memoize_all), {}),
+        "all": (memoize_all, {}),
+        "default": (default, {}),
+        "fast": (make_parser_class(fast=True), {}),
+        "inline": (inline, {}),
+        "default+commit": (default, commit),
+        "inline+commit": (inline, commit),
+        "default+window": (default, {"window": window}),
+        "inline+window": (inline, {"window": window}),
+        "default+stream": (default, {"stream": True}),
+        "inline+stream": (inline, {"stream": True}),
+        "all+cut": (make_parser_class(memoize_all=True, prune_cuts=True), {}),
+        "default+cut": (make_parser_class(prune_cuts=True), {}),
+        "inline+cut": (make_parser_class(inline=True, prune_cuts=True), {}),
+        "adaptive": (make_adaptive_parser_class(memoize_all, warmup=20000), {}),
+        "policy": (make_parser_class(memo_policy=memo_policy), {}),
+        "inline+policy": (make_parser_class(inline=True, memo_policy=memo_policy), {}),
+    }
+
+
+def make_synthetic_file(size: float) -> str:
+    with open("data/large.txt") as file:
+        chunk = file.read()
+    count = max(1, round(size * 2 ** 20 / len(chunk)))
+    fd, filename = tempfile.mkstemp(prefix="synthetic-", suffix=".txt")
+    with os.fdopen(fd, "w") as file:
+        for i in range(count):
+            file.write(chunk)
+    return filename
+
+
+def main() -> None:
+    args = argparser.parse_args()
+    variants = make_variants(args.window)
+    if args.variants:
+        variants = {name: variants[name] for name in args.variants}
+    files = list(args.files)
+    synthetic = None
+    if args.synthetic:
+        synthetic = make_synthetic_file(args.synthetic)
+        files.append(synthetic)
+    try:
+        print(
+            f"{'file':20} {'variant':15} {'time (s)':>10} {'first (ms)':>10}"
+            f" {'entries':>10} {'memo (MiB)':>11} {'peak (MiB)':>11}",
+            f"{'peak entries':>12}" if args.peak_entries else "",
+        )
+        for filename in files:
+            for name, variant in variants.items():
+                times: List[float] = []
+                firsts: List[float] = []
+                for i in range(args.repeat):
+                    dt, first, entries, size = parse_file(filename, variant)
+                    times.append(dt)
+                    firsts.append(first)
+                peak: Optional[int] = None
+                if not args.no_memory:
+                    peak = peak_memory(filename, variant)
+                peakr = f"{peak / 2**20:11.1f}" if peak is not None else f"{'-':>11}"
+                label = f"synthetic ({args.synthetic} MiB)" if filename == synthetic else filename
+                peake = f"{peak_entries(filename, variant):12}" if args.peak_entries else ""
+                print(
+                    f"{label:20} {name:15} {min(times):10.3f} {min(firsts) * 1000:10.1f}"
+                    f" {entries:10} {size / 2**20:11.1f} {peakr}",
+                    peake,
+                )
+    finally:
+        if synthetic is not None:
+            os.remove(synthetic)
+
+
+if __name__ == "__main__":
+    main()
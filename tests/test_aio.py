@@ -0,0 +1,98 @@
+import asyncio
+import concurrent.futures
+import io
+import tokenize
+
+from typing import Any, AsyncIterator, Iterable, List, TypeVar
+
+import pytest  # type: ignore
+
+from data.python_parser import GeneratedParser  # type: ignore
+from pegen.aio import aiter_parse, parse_in_executor
+from pegen.tokenizer import Tokenizer
+
+T = TypeVar("T")
+
+SOURCE = "import sys\n\ndef f(a):\n    return [\n        a,\n    ]\n\n1 +\nx = f(1)\n" * 20
+
+
+async def stream(items: Iterable[T]) -> AsyncIterator[T]:
+    for item in items:
+        yield item
+
+
+async def collect(results: AsyncIterator[Any]) -> List[Any]:
+    return [result async for result in results]
+
+
+def iter_parse(source: str, errors: List[SyntaxError]) -> List[Any]:
+    parser = GeneratedParser(Tokenizer(tokenize.generate_tokens(io.StringIO(source).readline)))
+    return list(parser.iter_parse("statement", errors=errors))
+
+
+def check(results: List[Any]) -> None:
+    errors: List[SyntaxError] = []
+    trees = iter_parse(SOURCE, errors)
+    assert [result for result in results if not isinstance(result, SyntaxError)] == trees
+    assert [result.args for result in results if isinstance(result, SyntaxError)] == [
+        err.args for err in errors
+    ]
+
+
+def test_aiter_parse_text() -> None:
+    chunks = [SOURCE[i : i + 7] for i in range(0, len(SOURCE), 7)]
+    check(asyncio.run(collect(aiter_parse(GeneratedParser, stream(chunks)))))
+
+
+def test_aiter_parse_tokens() -> None:
+    tokens = tokenize.generate_tokens(io.StringIO(SOURCE).readline)
+    check(asyncio.run(collect(aiter_parse(GeneratedParser, stream(tokens)))))
+
+
+def test_aiter_parse_yields() -> None:
+    async def main() -> int:
+        ticks = 0
+
+        async def ticker() -> None:
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0)
+
+        task = asyncio.create_task(ticker())
+        await asyncio.sleep(0)
+        start = ticks
+        # The whole source comes in one chunk.
+        await collect(aiter_parse(GeneratedParser, stream([SOURCE]), yield_every=50))
+        task.cancel()
+        return ticks - start
+
+    assert asyncio.run(main()) >= len(SOURCE.split()) // 50
+
+
+def test_parse_in_executor() -> None:
+    tree = asyncio.run(parse_in_executor(GeneratedParser, "x = 1\n"))
+    assert tree
+    with pytest.raises(SyntaxError) as excinfo:
+        asyncio.run(parse_in_executor(GeneratedParser, "x = 1\n1 +\n", filename="<test>"))
+    assert excinfo.value.filename == "<test>"
+    assert excinfo.value.lineno == 2
+
+
+def test_parse_in_executor_cancel() -> None:
+    executor = concurrent.futures.ThreadPoolExecutor(1)
+
+    async def main() -> None:
+        task = asyncio.create_task(
+            parse_in_executor(GeneratedParser, "x = 1\n" * 100_000, executor=executor)
+        )
+        await asyncio.sleep(0.01)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(main())
+    # The worker thread stops at the next token instead of finishing the parse.
+    future = executor.submit(lambda: None)
+    assert future.result(timeout=5) is None
+    executor.shutdown()
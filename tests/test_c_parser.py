@@ -1,16 +1,44 @@
 import ast
+import os
 from pathlib import PurePath
+import re
 import textwrap
-from typing import Optional, Sequence
+import time
+from typing import Any, Optional, Sequence
 import traceback
 
 import pytest  # type: ignore
 
+from pegen.build import find_cpython_root
+from pegen.grammar import Grammar
 from pegen.grammar_parser import GeneratedParser as GrammarParser
+from pegen.parser import ParseBudgetExceeded
 from pegen.testutil import parse_string, generate_parser_c_extension, generate_c_parser_source
 from pegen.ast_dump import ast_dump
 
 
+def c_build_error() -> Optional[str]:
+    """Return why C extensions can't be built here, or None if they can."""
+    try:
+        import distutils.tests.support  # type: ignore  # Used by compile_c_extension()
+
+        find_cpython_root()
+    except (ImportError, ValueError) as err:
+        return str(err)
+    return None
+
+
+def build_extension(grammar: Grammar, tmp_path: PurePath, two_pass: bool = False) -> Any:
+    """Build a parser extension for grammar, or skip the test if that's impossible.
+
+    Checks of the generated source done before this still count.
+    """
+    error = c_build_error()
+    if error is not None:
+        pytest.skip(f"Can't build C extensions: {error}")
+    return generate_parser_c_extension(grammar, tmp_path, two_pass=two_pass)
+
+
 def check_input_strings_for_grammar(
     source: str,
     tmp_path: PurePath,
@@ -18,7 +46,7 @@ def check_input_strings_for_grammar(
     invalid_cases: Sequence[str] = (),
 ) -> None:
     grammar = parse_string(source, GrammarParser)
-    extension = generate_parser_c_extension(grammar, tmp_path)
+    extension = build_extension(grammar, tmp_path)
 
     if valid_cases:
         for case in valid_cases:
@@ -32,7 +60,7 @@ def check_input_strings_for_grammar(
 
 def verify_ast_generation(source: str, stmt: str, tmp_path: PurePath) -> None:
     grammar = parse_string(source, GrammarParser)
-    extension = generate_parser_c_extension(grammar, tmp_path)
+    extension = build_extension(grammar, tmp_path)
 
     expected_ast = ast.parse(stmt)
     actual_ast = extension.parse_string(stmt, mode=1)
@@ -61,7 +89,7 @@ def test_c_parser(tmp_path: PurePath) -> None:
                    )
     """
     grammar = parse_string(grammar_source, GrammarParser)
-    extension = generate_parser_c_extension(grammar, tmp_path)
+    extension = build_extension(grammar, tmp_path)
 
     expressions = [
         "4+5",
@@ -101,6 +129,89 @@ def test_negative_lookahead(tmp_path: PurePath) -> None:
     check_input_strings_for_grammar(grammar, tmp_path, valid_cases, invalid_cases)
 
 
+def test_first_token_switch(tmp_path: PurePath) -> None:
+    grammar = """
+    start: stmt NEWLINE? ENDMARKER
+    stmt: "match" NAME ';' | &'(' expr '.' NAME | 'if' expr ':' expr | ['+'] !'+' expr
+    expr: NAME | NUMBER | '(' expr ')'
+    """
+    parser_source = generate_c_parser_source(parse_string(grammar, GrammarParser))
+    assert "switch (peek_token_type(p))" in parser_source
+    assert "_PyPegen_lookahead_with_int" not in parser_source
+    valid_cases = ["match x;", "(a).b", "(a)", "if a: 1", "+ 1", "1"]
+    invalid_cases = ["match x", "(a).", "if a:", "+ + 1", ";"]
+    check_input_strings_for_grammar(grammar, tmp_path, valid_cases, invalid_cases)
+
+
+def test_first_token_switch_many_alts(tmp_path: PurePath) -> None:
+    # Only the first 32 alternatives get a bit of the mask; the rest are
+    # always tried, as is 'k0' NAME, which the switch can't pick.
+    alts = " | ".join(f"'k{i}' NUMBER" for i in range(34))
+    grammar = f"""
+    start: stmt NEWLINE? ENDMARKER
+    stmt: {alts} | 'k0' NAME
+    """
+    parser_source = generate_c_parser_source(parse_string(grammar, GrammarParser))
+    assert "_alts = 0x80000000;" in parser_source
+    assert "if (_alts & 0x80000000) { // 'k31' NUMBER" in parser_source
+    assert "{ // 'k32' NUMBER" in parser_source
+    assert "if (_alts & 0x100000000)" not in parser_source
+    assert "{ // 'k0' NAME" in parser_source
+    valid_cases = ["k0 1", "k0 a", "k31 1", "k32 1", "k33 1"]
+    invalid_cases = ["k31 a", "k33 a", "1"]
+    check_input_strings_for_grammar(grammar, tmp_path, valid_cases, invalid_cases)
+
+
+def test_ll1_rule(tmp_path: PurePath) -> None:
+    grammar = """
+    start: stmt NEWLINE? ENDMARKER
+    stmt: NAME '=' NUMBER | 'pass' | '(' stmt ')'
+    """
+    parser_source = generate_c_parser_source(parse_string(grammar, GrammarParser))
+    # The rule switches straight to its only candidate alternative.
+    assert "case NAME:" in parser_source
+    assert "_alts" not in parser_source
+    valid_cases = ["a = 1", "pass", "((pass))"]
+    invalid_cases = ["a =", "pass = 1", "(pass", "1"]
+    check_input_strings_for_grammar(grammar, tmp_path, valid_cases, invalid_cases)
+
+
+def test_two_pass(tmp_path: PurePath) -> None:
+    grammar_source = """
+    start: stmt+ ENDMARKER
+    stmt (memo): NAME '=' NUMBER NEWLINE | 'pass' NEWLINE | invalid_stmt
+    invalid_stmt: a=NUMBER '=' NUMBER NEWLINE {
+        RAISE_SYNTAX_ERROR_KNOWN_LOCATION(a, "cannot assign to literal") }
+    """
+    grammar = parse_string(grammar_source, GrammarParser)
+    assert "CALL_INVALID_RULES" not in generate_c_parser_source(grammar)
+    parser_source = generate_c_parser_source(grammar, two_pass=True)
+    assert "if (CALL_INVALID_RULES(p)) { // invalid_stmt" in parser_source
+    extension = build_extension(grammar, tmp_path, two_pass=True)
+    extension.parse_string("a = 1\npass\n", mode=0)
+    # The second pass raises the error of the invalid_ rule; stmt failed
+    # there in the first pass, so this also needs the memo to be dropped.
+    with pytest.raises(SyntaxError, match="cannot assign to literal"):
+        extension.parse_string("pass\n1 = 2\n", mode=0)
+    with pytest.raises(SyntaxError, match="invalid syntax"):
+        extension.parse_string("a = b\n", mode=0)
+
+
+def test_python_grammar_pass_functions() -> None:
+    # The trailer of data/python.gram calls the pass functions emitted
+    # for every parser with the arguments they take.
+    with open(os.path.join("data", "python.gram"), "r") as grammar_file:
+        grammar = parse_string(grammar_file.read(), GrammarParser)
+    for two_pass in False, True:
+        parser_source = generate_c_parser_source(grammar, two_pass=two_pass)
+        for name in "begin_first_pass", "begin_second_pass":
+            params = re.findall(rf"^{name}\((.*)\)$", parser_source, re.MULTILINE)
+            calls = re.findall(rf"[ (]{name}\((.*?)\)[;)]", parser_source)
+            assert len(params) == 1 and calls, name
+            assert {args.count(",") for args in calls} == {params[0].count(",")}, name
+            assert all(args.strip() for args in calls), name
+
+
 def test_cut(tmp_path: PurePath) -> None:
     grammar = """
     start: X ~ Y Z | X Q S
@@ -135,6 +246,17 @@ def test_left_recursion(tmp_path: PurePath) -> None:
     check_input_strings_for_grammar(grammar, tmp_path, valid_cases)
 
 
+def test_left_recursion_loop(tmp_path: PurePath) -> None:
+    grammar = """
+    start: expr NEWLINE
+    expr: expr '+' term | expr '-' term | term
+    term: term '(' expr? ')' | term '.' NAME | NUMBER | NAME
+    """
+    valid_cases = ["34", "34 + 12", "1 - 1 + 2 - 3", "f()", "f(1 + 2).x(3) - g.y"]
+    invalid_cases = ["1 +", "+ 1", "f(", "f.", "1 - - 2"]
+    check_input_strings_for_grammar(grammar, tmp_path, valid_cases, invalid_cases)
+
+
 def test_advanced_left_recursive(tmp_path: PurePath) -> None:
     grammar = """
     start: NUMBER | sign start
@@ -259,7 +381,7 @@ def test_with_stmt_with_paren(tmp_path: PurePath) -> None:
     """
     stmt = "with (\n    a as b,\n    c as d\n): pass"
     grammar = parse_string(grammar_source, GrammarParser)
-    extension = generate_parser_c_extension(grammar, tmp_path)
+    extension = build_extension(grammar, tmp_path)
     the_ast = extension.parse_string(stmt, mode=1)
     assert ast_dump(the_ast).startswith(
         "Module(body=[With(items=[withitem(context_expr=Name(id='a', ctx=Load()), optional_vars=Name(id='b', ctx=Store())), "
@@ -290,7 +412,7 @@ def test_syntax_error_for_string(text: str, tmp_path: PurePath) -> None:
     expr: NAME
     """
     grammar = parse_string(grammar_source, GrammarParser)
-    extension = generate_parser_c_extension(grammar, tmp_path)
+    extension = build_extension(grammar, tmp_path)
     try:
         extension.parse_string(text, mode=1)
     except SyntaxError as e:
@@ -306,7 +428,7 @@ def test_syntax_error_for_file(text: str, tmp_path: PurePath) -> None:
     expr: NAME
     """
     grammar = parse_string(grammar_source, GrammarParser)
-    extension = generate_parser_c_extension(grammar, tmp_path)
+    extension = build_extension(grammar, tmp_path)
     the_file = tmp_path / "some_file.py"
     with open(the_file, "w") as fd:
         fd.write(text)
@@ -340,7 +462,29 @@ def test_error_in_rules(tmp_path: PurePath) -> None:
     expr: NAME {PyTuple_New(-1)}
     """
     grammar = parse_string(grammar_source, GrammarParser)
-    extension = generate_parser_c_extension(grammar, tmp_path)
+    extension = build_extension(grammar, tmp_path)
     # PyTuple_New raises SystemError if an invalid argument was passed.
     with pytest.raises(SystemError):
         extension.parse_string("a")
+
+
+def test_budget(tmp_path: PurePath) -> None:
+    # Without memoization this takes time exponential in the nesting depth.
+    grammar_source = """
+    start: a NEWLINE? ENDMARKER
+    a: b 'x' | b 'y' | b
+    b: '(' a ')' | NAME
+    """
+    grammar = parse_string(grammar_source, GrammarParser)
+    extension = build_extension(grammar, tmp_path)
+    extension.parse_string("((a)x)", mode=0, fuel=1000)
+    text = "(" * 20 + "a" + ")" * 20
+    with pytest.raises(ParseBudgetExceeded) as excinfo:
+        extension.parse_string(text, mode=0, fuel=10_000)
+    err = excinfo.value
+    assert (err.reason, err.calls, err.lineno) == ("fuel", 10_000, 1)
+    with pytest.raises(ParseBudgetExceeded) as excinfo:
+        extension.parse_string(text, mode=0, deadline=time.monotonic() + 0.01)
+    assert excinfo.value.reason == "deadline"
+    # The budget only applies to the call it's given to.
+    extension.parse_string("((a)x)", mode=0)
@@ -188,19 +188,22 @@ def test_mutual_left_recursion() -> None:
     """
     assert calculate_first_sets(grammar) == {
         "foo": {"'D'", "'B'"},
-        "bar": {"'D'"},
+        "bar": {"'D'", "'B'"},
         "start": {"'D'", "'B'"},
     }
 
 
 def test_nasty_left_recursion() -> None:
-    # TODO: Validate this
     grammar = """
     start: target '='
     target: maybe '+' | NAME
     maybe: maybe '-' | target
     """
-    assert calculate_first_sets(grammar) == {"maybe": set(), "target": {"NAME"}, "start": {"NAME"}}
+    assert calculate_first_sets(grammar) == {
+        "maybe": {"NAME"},
+        "target": {"NAME"},
+        "start": {"NAME"},
+    }
 
 
 def test_nullable_rule() -> None:
@@ -238,3 +241,23 @@ def test_multiple_nullable_rules() -> None:
         "other": {"'*'"},
         "another": {"'/'"},
     }
+
+
+def test_lookaheads_after_optional() -> None:
+    grammar = """
+    start: ['+'] !'+' NUMBER | !pair NAME
+    pair: NAME NAME
+    """
+    # Neither lookahead is tested on the first token of every match.
+    assert calculate_first_sets(grammar) == {
+        "start": {"'+'", "NUMBER", "NAME"},
+        "pair": {"NAME"},
+    }
+
+
+def test_first_set_of_items() -> None:
+    grammar: Grammar = parse_string("start: ['-'] NUMBER? $\n", GrammarParser)
+    calculator = FirstSetCalculator(grammar.rules)
+    items = grammar.rules["start"].rhs.alts[0].items
+    assert calculator.first_set(items) == {"'-'", "NUMBER", "ENDMARKER"}
+    assert calculator.first_set(items[:2]) == {"'-'", "NUMBER", ""}
@@ -0,0 +1,93 @@
+import io
+import textwrap
+import tokenize
+
+from typing import Any, Tuple
+
+from data.python_parser import GeneratedParser  # type: ignore
+from pegen.incremental import IncrementalParser, read_tokens
+from pegen.parser import Parser
+from pegen.tokenizer import Tokenizer
+
+SOURCE = textwrap.dedent(
+    """\
+    import sys
+
+    def f(a, b):
+        if a:
+            return b + 1
+        return [
+            a,
+            b,
+        ]
+
+    class C:
+        x = f(1, 2)
+    """
+)
+
+
+def parse(source: str) -> Tuple[Any, Parser]:
+    parser = GeneratedParser(Tokenizer(tokenize.generate_tokens(io.StringIO(source).readline)))
+    return parser.start(), parser
+
+
+def check(inc: IncrementalParser, tree: Any) -> None:
+    assert inc.tokens == list(read_tokens(iter(inc.text.splitlines(keepends=True))))
+    expected, parser = parse(inc.text)
+    assert tree == expected
+    if tree is None:
+        assert inc.parser.make_syntax_error().args == parser.make_syntax_error().args
+
+
+def test_edit_within_line() -> None:
+    inc = IncrementalParser(GeneratedParser, SOURCE)
+    check(inc, inc.parse())
+    memo_size = inc.parser.memo_size()
+    tree = inc.edit((5, 19), (5, 20), "42")
+    check(inc, tree)
+    # Only the tokens of the line with "return b + 42" were redone.
+    begin, end = inc.damage
+    strings = [tok.string for tok in inc.tokens[begin:end]]
+    assert strings == ["        ", "return", "b", "+", "42", "\n"]
+    # The memo entries before and after it are still there.
+    assert inc.parser.memo_size() > memo_size // 2
+
+
+def test_edit_lines() -> None:
+    inc = IncrementalParser(GeneratedParser, SOURCE)
+    inc.parse()
+    # Add a line to the body of the if.
+    tree = inc.edit((5, 20), (5, 20), "\n        print(b)")
+    check(inc, tree)
+    assert inc.text.splitlines()[5] == "        print(b)"
+    # Dedent it.
+    check(inc, inc.edit((6, 0), (6, 4), ""))
+    # Join the lines of the list.
+    check(inc, inc.edit((8, 10), (9, 8), " "))
+    # Delete the class.
+    check(inc, inc.edit((11, 0), (13, 0), ""))
+    assert inc.text.endswith("return [\n        a, b,\n    ]\n\n")
+
+
+def test_syntax_errors() -> None:
+    inc = IncrementalParser(GeneratedParser, SOURCE)
+    inc.parse()
+    tree = inc.edit((6, 11), (6, 12), "")
+    assert tree is None
+    check(inc, tree)
+    err = inc.parser.make_syntax_error()
+    assert err.lineno == 7
+    # The "]" closing the list is now unbalanced, which changes how the
+    # rest is tokenized.
+    assert inc.unbalanced
+    tree = inc.edit((6, 11), (6, 11), "[")
+    assert not inc.unbalanced
+    check(inc, tree)
+    assert tree is not None
+    tree = inc.edit((2, 0), (2, 0), ")")
+    assert inc.unbalanced
+    check(inc, tree)
+    tree = inc.edit((2, 0), (2, 1), "")
+    assert not inc.unbalanced
+    check(inc, tree)
@@ -1,5 +1,8 @@
 import io
+import sys
 import textwrap
+import time
+import tokenize
 
 from tokenize import TokenInfo, NAME, NEWLINE, NUMBER, OP
 
@@ -10,8 +13,10 @@ import pytest  # type: ignore
 from pegen.grammar_parser import GeneratedParser as GrammarParser
 from pegen.grammar import GrammarVisitor, GrammarError, Grammar
 from pegen.grammar_visualizer import ASTGrammarPrinter
-from pegen.parser import Parser
+from pegen.parser import FAILURES, FastParser, FIRST_RULE_ID, ParseBudgetExceeded, Parser
+from pegen.parser import load_memo_policy, make_adaptive_parser_class, run_deep
 from pegen.python_generator import PythonParserGenerator
+from pegen.tokenizer import Tokenizer
 
 from pegen.testutil import generate_parser, parse_string, make_parser
 
@@ -315,6 +320,7 @@ def test_left_recursive() -> None:
     rules = grammar.rules
     assert not rules["start"].left_recursive
     assert rules["expr"].left_recursive
+    assert not rules["expr"].left_rec_loop  # An alternative comes before expr '+' term
     assert not rules["term"].left_recursive
     assert not rules["foo"].left_recursive
     assert not rules["bar"].left_recursive
@@ -334,6 +340,71 @@ def test_left_recursive() -> None:
     ]
 
 
+def test_left_rec_loop() -> None:
+    grammar_source = """
+    start: expr NEWLINE
+    expr: expr '+' term | expr '-' term | term
+    term: term '(' expr? ')' | term '.' NAME | NUMBER | NAME
+    cut: cut '+' ~ NAME | NAME
+    """
+    grammar: Grammar = parse_string(grammar_source, GrammarParser)
+    sources = ["1 + 2 - 3\n", "f(1 + 2).x() - g.y\n", "1 + - 2\n", "f(1 +\n", "f.\n"]
+    all_options: List[Dict[str, Any]] = [{}, {"fast": True}, {"inline": True}]
+    for options in all_options:
+        parser_classes = []
+        for left_rec_loops in True, False:
+            out = io.StringIO()
+            genr = PythonParserGenerator(grammar, out, left_rec_loops=left_rec_loops, **options)
+            rules = grammar.rules
+            assert rules["expr"].left_rec_loop == left_rec_loops
+            assert rules["term"].left_rec_loop == left_rec_loops
+            assert not rules["cut"].left_rec_loop  # A tail with a cut
+            genr.generate("<string>")
+            assert ("def _grow_expr(" in out.getvalue()) == left_rec_loops
+            ns: Dict[str, Any] = {}
+            exec(out.getvalue(), ns)
+            parser_classes.append(ns["GeneratedParser"])
+        for source in sources:
+            results = []
+            for parser_class in parser_classes:
+                try:
+                    results.append(parse_string(source, parser_class))
+                except SyntaxError as err:
+                    results.append(err.args)
+            assert results[0] == results[1], (options, source)
+    # Left-associative: ((1 - 2) - 3).
+    expr, newline = parse_string("1 - 2 - 3\n", parser_classes[0])
+    assert expr[2][0].string == "3"
+    assert expr[0][2][0].string == "2"
+
+
+def test_left_rec_loop_nullable_seed() -> None:
+    # memoize_left_rec() fails when the seed matches nothing; c c can
+    # match nothing, although the second c is a revisit of c.
+    grammar_source = """
+    start: a ENDMARKER
+    a: a '(' '+' | c c | '(' a ')'
+    c: NUMBER? | NUMBER
+    """
+    grammar: Grammar = parse_string(grammar_source, GrammarParser)
+    all_options: List[Dict[str, Any]] = [{}, {"fast": True}, {"inline": True}]
+    for options in all_options:
+        results = []
+        for left_rec_loops in True, False:
+            out = io.StringIO()
+            PythonParserGenerator(grammar, out, left_rec_loops=left_rec_loops, **options).generate(
+                "<string>"
+            )
+            assert not grammar.rules["a"].left_rec_loop
+            ns: Dict[str, Any] = {}
+            exec(out.getvalue(), ns)
+            for source in "( +", "1 ( +", "(1 2)":
+                tokenizer = Tokenizer(tokenize.generate_tokens(io.StringIO(source).readline))
+                results.append(ns["GeneratedParser"](tokenizer).start())
+        assert results[0] is None
+        assert results[:3] == results[3:], options
+
+
 def test_python_expr() -> None:
     grammar = """
     start: expr NEWLINE? $ { ast.Expression(expr, lineno=1, col_offset=0) }
@@ -458,6 +529,40 @@ def test_nasty_mutually_left_recursive() -> None:
         parse_string("x - + =", parser_class)
 
 
+def test_memoize_involved() -> None:
+    grammar_source = """
+    start: expr NEWLINE? ENDMARKER
+    expr: binary | term
+    binary: expr '+' term | expr '-' term
+    term: product | factor
+    product: term '*' factor | term '/' factor
+    factor: '-' factor | '(' expr ')' | NAME
+    """
+    grammar: Grammar = parse_string(grammar_source, GrammarParser)
+    sources = ["a", "a - b * -c", "(a + b) * c / (d - e) - f", "a + * b", "(a + b"]
+    all_options: List[Dict[str, Any]] = [{}, {"fast": True}, {"inline": True}]
+    for options in all_options:
+        parser_classes = []
+        for memoize_involved in True, False:
+            out = io.StringIO()
+            genr = PythonParserGenerator(
+                grammar, out, memoize_involved=memoize_involved, **options
+            )
+            genr.generate("<string>")
+            assert ("memoize_involved(" in out.getvalue()) == memoize_involved
+            ns: Dict[str, Any] = {}
+            exec(out.getvalue(), ns)
+            parser_classes.append(ns["GeneratedParser"])
+        for source in sources:
+            results = []
+            for parser_class in parser_classes:
+                try:
+                    results.append(parse_string(source, parser_class))
+                except SyntaxError as err:
+                    results.append(err.args)
+            assert results[0] == results[1], (options, source)
+
+
 def test_lookahead() -> None:
     grammar = """
     start: (expr_stmt | assign_stmt) &'.'
@@ -508,6 +613,34 @@ def test_lookahead() -> None:
     ]
 
 
+def test_token_lookaheads() -> None:
+    grammar_source = """
+    start: stmt* ENDMARKER
+    stmt: !'pass' NAME &'=' '=' value NEWLINE | 'pass' !NUMBER NEWLINE | &pair pair NEWLINE
+    value: NUMBER !NAME | NAME
+    pair: NAME NAME
+    """
+    grammar: Grammar = parse_string(grammar_source, GrammarParser)
+    out = io.StringIO()
+    genr = PythonParserGenerator(grammar, out, fast=True)
+    genr.generate("<string>")
+    # Lookaheads on tokens compare the current token; those on rules are memoized.
+    assert out.getvalue().count("_lookahead(") == 1
+    assert "self.positive_lookahead(self.pair, )" in out.getvalue()
+    ns: Dict[str, Any] = {}
+    exec(out.getvalue(), ns)
+    parser_class = ns["GeneratedParser"]
+    default_class = make_parser(grammar_source)
+    for source in ["a = 1\npass\nb c\n", "a = b\n", "pass 1\n", "a = 1 b\n", "pass = 1\n"]:
+        try:
+            expected = parse_string(source, default_class)
+        except SyntaxError:
+            with pytest.raises(SyntaxError):
+                parse_string(source, parser_class)
+        else:
+            assert parse_string(source, parser_class) == expected
+
+
 def test_named_lookahead_error() -> None:
     grammar = """
     start: foo=!'x' NAME
@@ -551,6 +684,585 @@ def test_cut() -> None:
     ]
 
 
+def test_cut_pruning() -> None:
+    grammar_source = """
+    start: stmt NEWLINE
+    stmt (memo): 'for' target 'in' ~ NAME | NAME
+    target (memo): NAME
+    """
+    grammar: Grammar = parse_string(grammar_source, GrammarParser)
+    out = io.StringIO()
+    genr = PythonParserGenerator(grammar, out, prune_cuts=True)
+    genr.generate("<string>")
+    assert "(cut := self.cut(mark))" in out.getvalue()
+    ns: Dict[str, Any] = {}
+    exec(out.getvalue(), ns)
+    parser_class = ns["GeneratedParser"]
+    source = "for x in y\n"
+    tokenizer = Tokenizer(tokenize.generate_tokens(io.StringIO(source).readline))
+    parser = parser_class(tokenizer)
+    assert parser.start() == parse_string(source, make_parser(grammar_source))
+    # The tables between 'for' and the cut are gone.
+    assert sorted(parser._memo) == [0, 3, 4]
+
+
+def test_adaptive_memo_policy() -> None:
+    grammar_source = """
+    start: expr NEWLINE
+    expr (memo): term '+' expr | term
+    term (memo): NUMBER
+    """
+    grammar: Grammar = parse_string(grammar_source, GrammarParser)
+    parser_class = make_adaptive_parser_class(generate_parser(grammar), warmup=1000)
+    source = "1+2+3\n"
+    assert parse_string(source, parser_class) == parse_string(source, make_parser(grammar_source))
+    policy = parser_class._memo_policy
+    assert policy is not None
+    assert policy.learning
+    for i in range(100):
+        parse_string(source, parser_class)
+    # Each term is tried twice (hit rate 1/2), each expr once.
+    assert not policy.learning
+    disabled = {policy.names[rule_id] for rule_id in policy.disabled}
+    assert "expr" in disabled
+    assert "term" not in disabled
+    assert parse_string(source, parser_class) == parse_string(source, make_parser(grammar_source))
+    out = io.StringIO()
+    policy.dump(out)
+    memo_policy = load_memo_policy(io.StringIO(out.getvalue()))
+    assert memo_policy["expr"] is False
+    assert memo_policy["term"] is True
+    out = io.StringIO()
+    genr = PythonParserGenerator(grammar, out, memo_policy=memo_policy)
+    genr.generate("<string>")
+    assert set(genr.rule_ids) == {"term"}
+
+
+def test_memo_tables() -> None:
+    grammar = """
+    start: expr NEWLINE
+    expr: term '+' expr | term
+    term: NUMBER
+    """
+    parser_class = make_parser(grammar)
+    tokenizer = Tokenizer(tokenize.generate_tokens(io.StringIO("1+2\n").readline))
+    parser = parser_class(tokenizer)
+    assert parser.start()
+    # One table per position, keyed by integer rule IDs.
+    assert sorted(parser._memo) == [0, 1, 2, 3]
+    assert all(isinstance(key, (int, tuple)) for table in parser._memo.values() for key in table)
+    size = parser.memo_size()
+    # A second parse from the start only hits the memo.
+    parser.reset(0)
+    assert parser.start()
+    assert parser.memo_size() == size
+
+
+def test_failure_bits() -> None:
+    grammar = """
+    start: item* NEWLINE
+    item: NAME | NUMBER | STRING
+    """
+    parser_class = make_parser(grammar)
+    tokenizer = Tokenizer(tokenize.generate_tokens(io.StringIO("x 1 'a'\n").readline))
+    parser = parser_class(tokenizer)
+    assert parser.start()
+    # Failing name() and number() at the NUMBER and STRING are only bits.
+    table = parser._memo[2]
+    assert parser._failures[2] >> parser.failure_bit(0) & 1
+    assert parser._failures[2] >> parser.failure_bit(1) & 1
+    assert 0 not in table and 1 not in table
+    size = parser.memo_size()
+    parser.reset(0)
+    assert parser.start()
+    assert parser.memo_size() == size
+    # Failure bits are looked up like entries, reach included.
+    parser.reset(2)
+    parser._tokenizer.reset_reach(2)
+    assert parser.name() is None
+    assert parser._tokenizer.get_reach() == 3
+    # And cleared like entries.
+    parser.clear_excess(2)
+    assert 2 not in parser._failures
+
+
+def test_clear_excess() -> None:
+    grammar = """
+    start: expr NEWLINE
+    expr: expr '+' term | term
+    term: NUMBER | '(' expr ')'
+    """
+    parser_class = make_parser(grammar)
+
+    def parse(source: str) -> Parser:
+        tokenizer = Tokenizer(tokenize.generate_tokens(io.StringIO(source).readline))
+        parser = parser_class(tokenizer)
+        parser.start()
+        return parser
+
+    def entries(parser: Parser, pos: int) -> Dict[Any, Any]:
+        # Failure bits have reach mark + 1.
+        entries: Dict[Any, Any] = {
+            (mark, key): entry
+            for mark, table in parser._memo.items()
+            for key, entry in table.items()
+            if entry[2] <= pos
+        }
+        for mark, bits in parser._failures.items():
+            if mark + 1 <= pos:
+                entries[mark, FAILURES] = bits
+        return entries
+
+    source = "(1 + 2) + (3 + 4\n"
+    for pos in range(10, -1, -1):
+        parser = parse(source)
+        expected = entries(parser, pos)
+        parser.clear_excess(pos)
+        assert entries(parser, 100) == expected
+    # Once indexed, new entries are indexed too.
+    parser = parse(source)
+    parser.clear_excess(3)
+    parser.reset(0)
+    parser.start()
+    assert parser._reach_index is not None
+    for keys in parser._reach_index.values():
+        assert len(keys) == len(set(keys))
+    expected = entries(parser, 3)
+    parser.clear_excess(3)
+    assert entries(parser, 100) == expected
+
+
+def test_token_overlay() -> None:
+    grammar = """
+    start: NUMBER ('+' NUMBER)* NEWLINE
+    """
+    parser_class = make_parser(grammar)
+    tokenizer = Tokenizer(tokenize.generate_tokens(io.StringIO("1 + 2 3\n").readline))
+    parser = parser_class(tokenizer)
+    assert parser.start() is None
+    tokens = list(tokenizer._tokens)
+    plus = tokens[1]
+    # Inserting and deleting don't touch the token list.
+    parser.reset(0)
+    parser.clear_excess(3)
+    parser.insert_token(3, plus)
+    assert parser.start()
+    assert tokenizer._tokens[:4] == tokens
+    assert tokenizer.undo_edit() is plus
+    tokens = list(tokenizer._tokens)
+    parser.reset(0)
+    parser.clear_excess(2)
+    assert parser.delete_token(2).string == "2"
+    assert parser.start()
+    parser.insert_token(2, tokens[2])
+    assert tokenizer.get_edit() is None
+    assert tokenizer._tokens == tokens
+    parser.reset(0)
+    parser.clear_excess(2)
+    assert parser.start() is None
+
+
+def test_fast_parser() -> None:
+    grammar_source = """
+    start: expr NEWLINE
+    expr: expr '+' term | term
+    term: NUMBER | '(' expr ')'
+    """
+    grammar: Grammar = parse_string(grammar_source, GrammarParser)
+    out = io.StringIO()
+    genr = PythonParserGenerator(grammar, out, fast=True)
+    genr.generate("<string>")
+    assert "class GeneratedParser(FastParser):" in out.getvalue()
+    ns: Dict[str, Any] = {}
+    exec(out.getvalue(), ns)
+    parser_class = ns["GeneratedParser"]
+    assert issubclass(parser_class, FastParser)
+    source = "(1 + 2) + 3\n"
+    assert parse_string(source, parser_class) == parse_string(source, make_parser(grammar_source))
+    # Memo entries are (tree, endmark) pairs; failures are bits.
+    tokenizer = Tokenizer(tokenize.generate_tokens(io.StringIO(source).readline))
+    parser = parser_class(tokenizer)
+    assert parser.start()
+    for table in parser._memo.values():
+        for entry in table.values():
+            assert entry is not None and len(entry) == 2
+    # Syntax errors still point at the furthest token looked at.
+    tokenizer = Tokenizer(tokenize.generate_tokens(io.StringIO("1 + + 2\n").readline))
+    parser = parser_class(tokenizer)
+    assert parser.start() is None
+    assert parser.make_syntax_error().offset == 5
+
+
+def test_inline_parser() -> None:
+    grammar_source = """
+    start: stmt* ENDMARKER
+    stmt: 'if' expr ':' NEWLINE | !'if' expr [';'] NEWLINE
+    expr: expr '+' term | term
+    term: NAME | NUMBER | '(' expr ')'
+    """
+    grammar: Grammar = parse_string(grammar_source, GrammarParser)
+    out = io.StringIO()
+    genr = PythonParserGenerator(grammar, out, inline=True)
+    genr.generate("<string>")
+    assert "self.expect(" not in out.getvalue()
+    assert "self.name(" not in out.getvalue()
+    ns: Dict[str, Any] = {}
+    exec(out.getvalue(), ns)
+    parser_class = ns["GeneratedParser"]
+    assert issubclass(parser_class, FastParser)
+    with pytest.raises(SyntaxError):
+        parse_string("if a + 1:\n(b);\nif + 1\n", parser_class)
+    source = "if a + 1:\n(b);\n"
+    assert parse_string(source, parser_class) == parse_string(source, make_parser(grammar_source))
+    # Token matches don't create memo entries; rules are memoized inline.
+    tokenizer = Tokenizer(tokenize.generate_tokens(io.StringIO(source).readline))
+    parser = parser_class(tokenizer)
+    tree = parser.start()
+    assert tree
+    assert all(
+        isinstance(key, int) and key >= FIRST_RULE_ID
+        for table in parser._memo.values()
+        for key in table
+    )
+    parser.reset(0)
+    assert parser.start() == tree
+
+
+def test_first_set_guards() -> None:
+    grammar_source = """
+    start: stmt* ENDMARKER
+    stmt: 'if' expr ':' NEWLINE | ['+'] !'+' expr NEWLINE | 'pass' (',' NAME)* NEWLINE
+    expr: expr '+' term | term
+    term: NAME | NUMBER | '(' expr ')'
+    """
+    grammar: Grammar = parse_string(grammar_source, GrammarParser)
+    out = io.StringIO()
+    PythonParserGenerator(grammar, out).generate("<string>")
+    assert "_first_tok" not in out.getvalue()
+    source = "if a + 1:\n+ (b)\npass\npass, x, y\n1 + 2\n"
+    expected = parse_string(source, make_parser(grammar_source))
+    for mode in "fast", "inline":
+        for guards in True, False:
+            out = io.StringIO()
+            genr = PythonParserGenerator(
+                grammar,
+                out,
+                first_set_guards=guards,
+                fast=mode == "fast",
+                inline=mode == "inline",
+            )
+            genr.generate("<string>")
+            assert ("if _first_tok.string == 'if':" in out.getvalue()) == guards
+            ns: Dict[str, Any] = {}
+            exec(out.getvalue(), ns)
+            parser_class = ns["GeneratedParser"]
+            assert parse_string(source, parser_class) == expected
+            with pytest.raises(SyntaxError):
+                parse_string("if a + 1:\npass + 1\n", parser_class)
+
+
+def test_ll1_rules() -> None:
+    grammar_source = """
+    start: stmt* ENDMARKER
+    stmt: expr NEWLINE | 'if' expr ':' NEWLINE | 'pass' NEWLINE
+    expr: expr '+' term | term
+    term: NAME | NUMBER | '(' expr ')' | ['-'] '!' term
+    call: NAME '(' ')' | NAME
+    soft: "match" NAME | NAME
+    cut: '(' ~ expr ')' | NAME
+    """
+    grammar: Grammar = parse_string(grammar_source, GrammarParser)
+    out = io.StringIO()
+    genr = PythonParserGenerator(grammar, out, fast=True)
+    genr.generate("<string>")
+    ll1_rules = {name for name, rule in grammar.rules.items() if rule.ll1}
+    assert ll1_rules == {"start", "stmt", "term"}
+    # Predictive rules have no cut variable, and the NAME alternative
+    # comes after those starting with keywords.
+    term = out.getvalue().split("def term(")[1].split("def ")[0]
+    assert "cut" not in term
+    stmt = out.getvalue().split("def stmt(")[1].split("def ")[0]
+    assert stmt.index("_first_tok.string == 'pass'") < stmt.index("_first_tok.type in (NAME")
+    ns: Dict[str, Any] = {}
+    exec(out.getvalue(), ns)
+    parser_class = ns["GeneratedParser"]
+    source = "if a + 1:\n(b) + -!2\npass\n"
+    assert parse_string(source, parser_class) == parse_string(source, make_parser(grammar_source))
+    with pytest.raises(SyntaxError):
+        parse_string("pass +\n", parser_class)
+    # memoize_all memoizes predictive rules too.
+    for mode in "fast", "inline":
+        out = io.StringIO()
+        genr = PythonParserGenerator(
+            grammar, out, memoize_all=True, fast=mode == "fast", inline=mode == "inline"
+        )
+        genr.generate("<string>")
+        ns = {}
+        exec(out.getvalue(), ns)
+        tokenizer = Tokenizer(tokenize.generate_tokens(io.StringIO(source).readline))
+        parser = ns["GeneratedParser"](tokenizer)
+        assert parser.start()
+        assert any(genr.rule_ids["term"] in table for table in parser._memo.values())
+
+
+def test_two_pass() -> None:
+    grammar_source = """
+    start: stmt* ENDMARKER
+    stmt: NAME '=' expr NEWLINE | invalid_assignment | expr NEWLINE
+    expr: NAME | NUMBER
+    invalid_assignment: NUMBER '=' expr NEWLINE
+    """
+    grammar: Grammar = parse_string(grammar_source, GrammarParser)
+    out = io.StringIO()
+    genr = PythonParserGenerator(grammar, out, two_pass=True)
+    genr.generate("<string>")
+    ns: Dict[str, Any] = {}
+    exec(out.getvalue(), ns)
+    calls: List[int] = []
+
+    class TwoPassParser(ns["GeneratedParser"]):  # type: ignore
+        def invalid_assignment(self) -> Any:
+            calls.append(self.mark())
+            return super().invalid_assignment()
+
+    one_pass_class = make_parser(grammar_source)
+    # Valid input is parsed in one pass, without the invalid_ rules.
+    assert parse_string("a = 1\nb\n", TwoPassParser) == parse_string("a = 1\nb\n", one_pass_class)
+    assert calls == []
+    # Otherwise the second pass gives what a single pass would.
+    assert parse_string("1 = a\n", TwoPassParser) == parse_string("1 = a\n", one_pass_class)
+    assert calls == [0, 4]  # At the start of each statement
+    with pytest.raises(SyntaxError) as one_pass_error:
+        parse_string("a\n1 2\n", one_pass_class)
+    with pytest.raises(SyntaxError) as two_pass_error:
+        parse_string("a\n1 2\n", TwoPassParser)
+    assert two_pass_error.value.args == one_pass_error.value.args
+    # Calling a rule directly tries everything.
+    calls.clear()
+    parser = TwoPassParser(Tokenizer(tokenize.generate_tokens(io.StringIO("b\n").readline)))
+    assert parser.start()
+    assert calls == [0, 2]
+
+
+def test_selective_memoization() -> None:
+    grammar_source = """
+    start: expr NEWLINE
+    expr (memo): term '+' expr | term
+    term: NUMBER
+    """
+    grammar: Grammar = parse_string(grammar_source, GrammarParser)
+    out = io.StringIO()
+    genr = PythonParserGenerator(grammar, out)
+    genr.generate("<string>")
+    assert out.getvalue().count("@memoize(") == 1
+    assert out.getvalue().count("@logger") == 2
+    ns: Dict[str, Any] = {}
+    exec(out.getvalue(), ns)
+    parser_class = ns["GeneratedParser"]
+    out = io.StringIO()
+    PythonParserGenerator(grammar, out, memoize_all=True).generate("<string>")
+    assert out.getvalue().count("@memoize(") == 3
+    assert "@logger" not in out.getvalue()
+    tokenizer = Tokenizer(tokenize.generate_tokens(io.StringIO("1+2\n").readline))
+    parser = parser_class(tokenizer)
+    assert parser.start()
+    rule_keys = {
+        key
+        for table in parser._memo.values()
+        for key in table
+        if isinstance(key, int) and key >= FIRST_RULE_ID
+    }
+    assert rule_keys == {genr.rule_ids["expr"]}
+
+
+def test_commit_evicts_memo_and_tokens() -> None:
+    grammar = """
+    start: stmt* ENDMARKER
+    stmt: expr NEWLINE
+    expr: term '+' expr | term
+    term: NUMBER
+    """
+    parser_class = make_parser(grammar)
+    source = "1+2\n3\n4+5+6\n"
+    expected = parse_string(source, parser_class)
+    tokenizer = Tokenizer(tokenize.generate_tokens(io.StringIO(source).readline))
+    parser = parser_class(tokenizer, commit_rule="stmt")
+    assert parser.start() == expected
+    # The last attempt at a statement was at the ENDMARKER.
+    assert tokenizer._offset == 12
+    assert len(tokenizer._tokens) == 1
+    assert min(parser._memo) == 12
+    # Going back is allowed, but looking at an evicted token is not.
+    parser.reset(0)
+    with pytest.raises(IndexError):
+        tokenizer.peek()
+    tokenizer = Tokenizer(tokenize.generate_tokens(io.StringIO(source * 10).readline))
+    parser = parser_class(tokenizer, window=8)
+    assert parser.start()
+    assert len(parser._memo) < 16
+
+
+def test_window_keeps_tokens() -> None:
+    # The second alternative backtracks over a statement much longer than
+    # the window, and the seed of expr is grown over all of it.
+    grammar = """
+    start: stmt* ENDMARKER
+    stmt: expr NEWLINE | expr ';' NEWLINE
+    expr: expr '+' term | term
+    term: NUMBER | '[' ','.expr+ ']'
+    """
+    source = "1 + [2, 3]" + " + [4, 5]" * 100 + ";\n1\n"
+
+    class CountingTokenizer(Tokenizer):
+        count = 0
+
+        def getnext(self) -> tokenize.TokenInfo:
+            self.count += 1
+            return super().getnext()
+
+    all_options: List[Dict[str, Any]] = [{}, {"fast": True}, {"inline": True}]
+    for options in all_options:
+        out = io.StringIO()
+        genr = PythonParserGenerator(
+            parse_string(grammar, GrammarParser), out, left_rec_loops=False, **options
+        )
+        genr.generate("<string>")
+        ns: Dict[str, Any] = {}
+        exec(out.getvalue(), ns)
+        parser_class = ns["GeneratedParser"]
+        expected = parse_string(source, parser_class)
+        assert expected
+        tokenizer = CountingTokenizer(tokenize.generate_tokens(io.StringIO(source).readline))
+        parser = parser_class(tokenizer, window=8)
+        assert parser.start() == expected
+        # Had the table of the seed been evicted, it would be grown again and again.
+        assert tokenizer.count < 2 * len(tokenizer._tokens)
+
+
+def test_iter_parse() -> None:
+    grammar = """
+    start: stmt* ENDMARKER
+    stmt: expr NEWLINE
+    expr: term '+' expr | term
+    term: NUMBER
+    """
+    parser_class = make_parser(grammar)
+    source = "1+2\n3\n4+5+6\n"
+    tokenizer = Tokenizer(tokenize.generate_tokens(io.StringIO(source).readline))
+    parser = parser_class(tokenizer)
+    expected = [stmt for [stmt] in parse_string(source, parser_class)[0]]
+    trees = parser.iter_parse("stmt")
+    assert next(trees) == expected[0]
+    # Nothing after the first statement has been tokenized yet.
+    assert len(tokenizer._tokens) == 4
+    assert list(trees) == expected[1:]
+    assert tokenizer._offset == 12
+    assert parser.memo_size() == 0
+    tokenizer = Tokenizer(tokenize.generate_tokens(io.StringIO("1+2\n3+\n4\n").readline))
+    parser = parser_class(tokenizer)
+    trees = parser.iter_parse("stmt")
+    assert next(trees)
+    with pytest.raises(SyntaxError) as errinfo:
+        next(trees)
+    assert errinfo.value.lineno == 2
+
+
+def test_iter_parse_errors() -> None:
+    grammar = """
+    start: stmt* ENDMARKER
+    stmt: compound | simple
+    compound: NAME ':' NEWLINE INDENT stmt+ DEDENT
+    simple: expr NEWLINE
+    expr: term '+' expr | term
+    term: NUMBER | NAME
+    """
+    parser_class = make_parser(grammar)
+    source = textwrap.dedent(
+        """\
+        1 +
+        2
+        a:
+            3
+            4 4
+            b:
+                5
+            6
+        7 +
+        c
+            8
+        9
+        """
+    )
+    tokenizer = Tokenizer(tokenize.generate_tokens(io.StringIO(source).readline))
+    parser = parser_class(tokenizer)
+    errors: List[SyntaxError] = []
+    trees = list(parser.iter_parse("stmt", errors=errors))
+
+    def first_token(tree: Any) -> TokenInfo:
+        return tree if isinstance(tree, TokenInfo) else first_token(tree[0])
+
+    # The rest of the block of a statement with an error is parsed as
+    # separate statements, but an unexpected indent is still an error.
+    assert [first_token(tree).string for tree in trees] == ["2", "b", "6", "c", "9"]
+    assert [(err.lineno, err.offset) for err in errors] == [(1, 4), (5, 7), (9, 4), (11, 1)]
+
+
+def test_run_deep() -> None:
+    grammar = """
+    start: expr NEWLINE? ENDMARKER
+    expr: expr '+' term | term
+    term: '(' expr ')' | NUMBER
+    """
+    parser_class = make_parser(grammar)
+    source = "(" * 2000 + "1 + 2" + ")" * 2000
+    limit = sys.getrecursionlimit()
+    with pytest.raises(RecursionError):
+        parse_string(source, parser_class)
+    assert run_deep(lambda: parse_string(source, parser_class))
+    assert sys.getrecursionlimit() == limit
+    with pytest.raises(SyntaxError):
+        run_deep(lambda: parse_string(source[1:], parser_class))
+    # The limit is never lowered, and it's restored after an error too.
+    with pytest.raises(RecursionError):
+        run_deep(lambda: parse_string(source, parser_class), frame_size=2 ** 40)
+    assert sys.getrecursionlimit() == limit
+
+
+def test_budget() -> None:
+    # Without memoization this takes time exponential in the nesting depth.
+    grammar = """
+    start: a NEWLINE? ENDMARKER
+    a: b 'x' | b 'y' | b
+    b: '(' a ')' | NAME
+    """
+    parser_class = make_parser(grammar)
+
+    def make(source: str, **kwargs: Any) -> Parser:
+        tokenizer = Tokenizer(tokenize.generate_tokens(io.StringIO(source).readline))
+        return parser_class(tokenizer, **kwargs)
+
+    assert make("((a)x)", fuel=1000).start()
+    parser = make("(" * 20 + "a" + ")" * 20, fuel=10_000)
+    with pytest.raises(ParseBudgetExceeded) as excinfo:
+        parser.start()
+    err = excinfo.value
+    assert (err.reason, err.calls, err.lineno, err.offset) == ("fuel", 10_000, 1, 28)
+    assert "ran out of fuel after 10000 rule calls" in str(err)
+    parser = make("(" * 20 + "a" + ")" * 20, deadline=time.monotonic() + 0.01)
+    with pytest.raises(ParseBudgetExceeded) as excinfo:
+        parser.start()
+    assert excinfo.value.reason == "deadline"
+    # set_budget() starts the count again.
+    parser = make("(a) (b)")
+    parser.set_budget(fuel=100)
+    assert parser.a()  # type: ignore
+    parser.set_budget(fuel=100)
+    assert parser.a()  # type: ignore
+    parser.set_budget(fuel=2)
+    with pytest.raises(ParseBudgetExceeded):
+        parser.start()
+
+
 def test_dangling_reference() -> None:
     grammar = """
     start: foo ENDMARKER
@@ -0,0 +1,125 @@
+import io
+import random
+import textwrap
+import tokenize
+
+from typing import Any, List, Optional
+
+from data.python_parser import GeneratedParser  # type: ignore
+from pegen.push import PushParser
+from pegen.tokenizer import Tokenizer
+
+SOURCE = textwrap.dedent(
+    """\
+    import sys
+
+    def f(a, b):
+        if a:
+            return b + 1
+        return [
+            a,  # (
+            b,
+        ]
+
+    s = '''x
+    y''' + "]" \\
+        + 'z'
+    1 +
+    class C:
+        x = f(1, 2)
+    """
+)
+
+
+def iter_parse(source: str, errors: Optional[List[SyntaxError]] = None) -> List[Any]:
+    parser = GeneratedParser(Tokenizer(tokenize.generate_tokens(io.StringIO(source).readline)))
+    return list(parser.iter_parse("statement", errors=errors))
+
+
+def test_chunks() -> None:
+    errors: List[SyntaxError] = []
+    trees = iter_parse(SOURCE, errors)
+    assert len(errors) == 1
+    for seed in range(5):
+        rng = random.Random(seed)
+        push = PushParser(GeneratedParser, filename="<unknown>")
+        results = []
+        i = 0
+        while i < len(SOURCE):
+            n = rng.randint(1, 20)
+            results += push.feed(SOURCE[i : i + n])
+            i += n
+        results += push.close()
+        assert [result for result in results if not isinstance(result, SyntaxError)] == trees
+        pushed_errors = [result for result in results if isinstance(result, SyntaxError)]
+        assert [err.args for err in pushed_errors] == [err.args for err in errors]
+
+
+def test_need_more() -> None:
+    push = PushParser(GeneratedParser)
+    assert push.feed("x = (1,") == []
+    assert push.need_more
+    assert push.feed("\n2)") == []
+    assert push.need_more
+    [tree] = push.feed("\n")
+    assert tree == iter_parse("x = (1,\n2)\n")[0]
+    assert not push.need_more
+    # A compound statement isn't complete until the next line doesn't continue it.
+    assert push.feed("if x:\n    pass\n") == []
+    assert push.need_more
+    assert push.feed("else:\n    pass\n") == []
+    [if_tree, y_tree] = push.feed("y\n")
+    assert if_tree and y_tree
+    assert not push.need_more
+    assert push.close() == []
+
+
+def test_errors() -> None:
+    push = PushParser(GeneratedParser, filename="<test>")
+    [err] = push.feed("1 +\n")
+    assert isinstance(err, SyntaxError)
+    assert err.filename == "<test>"
+    assert err.lineno == 1
+    # The parser picks up again after the error.
+    [tree] = push.feed("x = 1\n")
+    assert tree
+    [err] = push.feed("f(]\n")
+    assert isinstance(err, SyntaxError)
+    assert err.lineno == 3
+    assert push.close() == []
+
+
+def test_long_block() -> None:
+    # The lines of a block don't each make the parser start the class over.
+    lines = ["class C:\n"] + [f"    x{i} = {i}\n" for i in range(200)] + ["y = 1\n"]
+    push = PushParser(GeneratedParser)
+    tokenizer = push.tokenizer
+    getnext = tokenizer.getnext
+    count = 0
+
+    def counting_getnext() -> tokenize.TokenInfo:
+        nonlocal count
+        count += 1
+        return getnext()
+
+    setattr(tokenizer, "getnext", counting_getnext)
+    results = []
+    for line in lines:
+        results += push.feed(line)
+    source = "".join(lines)
+    assert results == iter_parse(source)
+    # Re-parsing the class for each line would read about 100 times as many.
+    assert count < 2 * len(list(tokenize.generate_tokens(io.StringIO(source).readline)))
+
+
+def test_interactive() -> None:
+    push = PushParser(GeneratedParser, interactive=True)
+    assert push.feed("if x:\n") == []
+    assert push.feed("    y = 1\n") == []
+    # A blank line ends the block, so the statement is complete.
+    [tree] = push.feed("\n")
+    assert str(tree) == str(iter_parse("if x:\n    y = 1\n")[0])
+    assert not push.need_more
+    assert push.feed("\n") == []
+    [tree] = push.feed("z\n")
+    assert push.close() == []
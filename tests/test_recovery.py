@@ -4,6 +4,7 @@ import tokenize
 from data.python_parser import GeneratedParser  # type: ignore
 from pegen.testutil import (
     describe_token,
+    expected_tokens,
     make_improved_syntax_error,
     recovery_by_deletions,
     recovery_by_insertions,
@@ -95,6 +96,31 @@ def test_make_improved_syntax_error() -> None:
     )
 
 
+def test_expected_tokens() -> None:
+    parser = make_parser("(a+)")
+    parser.start()
+    expected_strings = [t.string for t in expected_tokens(parser)]
+    assert expected_strings[:3] == ["NAME", "NUMBER", "STRING"]
+    # Everything that recovery by insertions finds was tried.
+    got, reach, expected, howfar = recovery_by_insertions(parser)
+    assert {t.string for t in expected} <= set(expected_strings)
+    assert "(" in expected_strings and ")" not in expected_strings
+
+
+def test_make_improved_syntax_error_without_reparse() -> None:
+    parser = make_parser("if 1:\npass\n")
+    parser.start()
+    err = make_improved_syntax_error(parser, reparse=False)
+    assert isinstance(err, IndentationError)
+    assert err.args[0] == "expected an indented block"
+    parser = make_parser("(a;)")
+    parser.start()
+    parser.start = None  # type: ignore  # Make sure it doesn't parse again.
+    err = make_improved_syntax_error(parser, reparse=False)
+    assert err.args[0].startswith("invalid syntax (expected one of ")
+    assert "')'" in err.args[0] and "','" in err.args[0]
+
+
 def test_bad_unindent_during_recovery() -> None:
     # Catch IndentationError("unindent does not match any outer indentation
     # level") raised in tokenize.py